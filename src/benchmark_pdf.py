@@ -0,0 +1,111 @@
+"""
+Compare the platypus and canvas PDF renderers on synthetic flight days.
+
+    python src/benchmark_pdf.py --flights 600 --repeat 3
+
+Needs reportlab. Nothing is fetched; the flights are generated locally and
+the PDFs are written to a temporary directory.
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import date, time as clock
+from pathlib import Path
+
+from model.flight_display_row import FlightDisplayRow
+from view.ga_pdf_printer import RENDERERS, GAPdfPrinter
+
+
+LAUNCHES = ["Aerotow", "Winch", "Self-launch", "TMG"]
+TUGS = ["GRL", "GRL2", "TUG3"]
+
+
+def synthetic_flights(count: int, seed: int = 1) -> list[FlightDisplayRow]:
+    rng = random.Random(seed)
+    flights: list[FlightDisplayRow] = []
+
+    for number in range(1, count + 1):
+        launch = rng.choice(LAUNCHES)
+        takeoff = rng.randint(8 * 60, 19 * 60)
+        landing = min(takeoff + rng.randint(5, 300), 23 * 60 + 59)
+
+        flights.append(FlightDisplayRow(
+            source="GA",
+            sequence_number=number,
+            flight_date=date(2026, 5, 1),
+            launch_method=launch,
+            registration=f"G-C{number % 900:03d}",
+            callsign=f"K{number % 90:02d}",
+            takeoff_time=clock(takeoff // 60, takeoff % 60),
+            landing_time=clock(landing // 60, landing % 60),
+            pic_account=str(1000 + number % 400),
+            pic_name=f"Pilot {number % 400} Surname",
+            p2_account=str(2000 + number % 50) if number % 3 == 0 else "",
+            p2_name=f"Instructor {number % 50}" if number % 3 == 0 else "",
+            payer_account=str(1000 + number % 400),
+            tow_callsign=rng.choice(TUGS) if launch == "Aerotow" else "",
+            tow_pilot_account="3001" if launch == "Aerotow" else "",
+            tow_pilot_name="Tug Pilot" if launch == "Aerotow" else "",
+            height_ft=2000 if launch == "Aerotow" else None,
+            category="Club",
+            airfield_takeoff="GRL",
+            airfield_landing="GRL",
+            is_club_aircraft=number % 2 == 0,
+        ))
+
+    return flights
+
+
+def time_renderer(
+    renderer: str,
+    flights: list[FlightDisplayRow],
+    output_dir: Path,
+    repeat: int,
+) -> float:
+    printer = GAPdfPrinter(
+        save_to_file=True,
+        grl_only=False,
+        group_by_launch_type=True,
+        renderer=renderer,
+    )
+    best = float("inf")
+
+    for attempt in range(repeat):
+        started = time.perf_counter()
+        # Straight to the renderer, so the PDF cache is not involved.
+        printer._build_pdf(
+            [(date(2026, 5, 1), flights)],
+            output_dir / f"{renderer}-{attempt}.pdf",
+        )
+        best = min(best, time.perf_counter() - started)
+
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--flights", type=int, default=600, help="flights per day (default: 600)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per renderer; the best is shown (default: 3)")
+    args = parser.parse_args(argv)
+
+    flights = synthetic_flights(args.flights)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        results = {
+            renderer: time_renderer(renderer, flights, Path(output_dir), args.repeat)
+            for renderer in RENDERERS
+        }
+
+    print(f"{'Renderer':12}{'Seconds':>10}{'Speed-up':>10}")
+
+    for renderer, seconds in results.items():
+        print(f"{renderer:12}{seconds:>10.3f}{results['platypus'] / seconds:>9.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,556 @@
+"""
+Headless command-line entry point.
+
+Drives FlightUpdaterService directly, without tkinter, tkcalendar or
+reportlab, so the comparison can be scripted or run from cron:
+
+    python src/cli.py --date 2026-05-01 --errors --aircraft --upload-dry-run
+    python src/cli.py --date 2026-05-01 --format json
+    python src/cli.py --date 2026-05-01 --to 2026-05-31
+    python src/cli.py --date 2026-05-01 --to 2026-05-31 --pdf-dir sheets
+
+Only --pdf-dir needs reportlab. The date-range season summary is added
+when the frames extra (NumPy) is installed.
+"""
+
+import argparse
+import json
+import sys
+import traceback
+from dataclasses import fields
+from datetime import date
+
+from config import load_config
+from constants.display import RENDERERS
+from model.flight_display_row import FlightDisplayRow
+from services.flight_comparison_service import Reconciliation, reconcile
+from services.flight_updater_service import (
+    DATE_RANGE_MAX_WORKERS,
+    FlightUpdaterService,
+)
+from view.flight_table_formatter import FlightTableFormatter
+
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_DIFFERENCES = 2
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="flightupdater",
+        description="Compare Gliding.App flights with Ktrax and Aerolog.",
+    )
+    parser.add_argument(
+        "--date",
+        type=date.fromisoformat,
+        default=date.today(),
+        help="flight date as YYYY-MM-DD (default: today)",
+    )
+    parser.add_argument(
+        "--to",
+        dest="end_date",
+        type=date.fromisoformat,
+        default=None,
+        help="reconcile every day from --date to this date (YYYY-MM-DD)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DATE_RANGE_MAX_WORKERS,
+        help=f"days fetched, or PDFs rendered, at once with --to (default: {DATE_RANGE_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="output format (default: text)",
+    )
+    parser.add_argument(
+        "--errors",
+        action="store_true",
+        help="run the Gliding.App error tests",
+    )
+    parser.add_argument(
+        "--aircraft",
+        action="store_true",
+        help="report aircraft planned for upload that differ from the Aerolog aircraft cache",
+    )
+    parser.add_argument(
+        "--upload-dry-run",
+        action="store_true",
+        help="build the Aerolog upload payload without sending it",
+    )
+    parser.add_argument(
+        "--resend",
+        action="store_true",
+        help="with --upload-dry-run, include flights the upload journal shows as already sent",
+    )
+    parser.add_argument(
+        "--no-non-grl-club-departures",
+        dest="include_non_grl_club_departures",
+        action="store_false",
+        help="only upload flights departing from GRL",
+    )
+    parser.add_argument(
+        "--no-modify-payer",
+        dest="modify_payer",
+        action="store_false",
+        help="do not change the payer for trial, scout and university flights",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="ignore cached flights and fetch everything again",
+    )
+    parser.add_argument(
+        "--pdf-dir",
+        default=None,
+        help="save Gliding.App PDF log sheets for --date (to --to) in this directory, instead of comparing",
+    )
+    parser.add_argument(
+        "--pdf-combined",
+        action="store_true",
+        help="with --pdf-dir, write one PDF with a page per day",
+    )
+    parser.add_argument(
+        "--pdf-renderer",
+        choices=RENDERERS,
+        default="platypus",
+        help="with --pdf-dir, PDF layout engine; canvas is faster on busy days (default: platypus)",
+    )
+    parser.add_argument(
+        "--no-launch-groups",
+        dest="group_by_launch_type",
+        action="store_false",
+        help="with --pdf-dir, list flights in takeoff order instead of by launch type",
+    )
+    parser.add_argument(
+        "--fail-on-differences",
+        action="store_true",
+        help=f"exit with status {EXIT_DIFFERENCES} if any flights are unmatched or in error",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.pdf_dir is not None and (args.errors or args.aircraft or args.upload_dry_run):
+        parser.error("--pdf-dir cannot be combined with --errors, --aircraft or --upload-dry-run")
+
+    if args.end_date is not None:
+        if args.end_date < args.date:
+            parser.error("--to must not be before --date")
+
+        if args.errors or args.aircraft or args.upload_dry_run:
+            parser.error("--errors, --aircraft and --upload-dry-run need a single --date")
+
+    return args
+
+
+def run(args: argparse.Namespace, service: FlightUpdaterService) -> dict:
+    fetched = service.fetch_all_sources(
+        args.date,
+        modify_payer=args.modify_payer,
+        force_refresh=args.refresh,
+    )
+
+    ga = fetched["ga"]
+    kt = fetched["kt"]
+    al = fetched["al"]
+    reconciliation = reconcile(ga, kt, al)
+
+    report: dict = {
+        "date": args.date,
+        "ga": ga,
+        "kt": kt,
+        "al": al,
+        "latency_seconds": fetched["latency_seconds"],
+        "reconciliation": reconciliation,
+    }
+
+    upload_flights = FlightTableFormatter(
+        grl_only=False,
+        group_by_launch_type=False,
+    ).filter_aerolog_upload_flights(
+        ga,
+        include_non_grl_club_departures=args.include_non_grl_club_departures,
+    )
+
+    if args.errors:
+        report["errors"] = service.test_for_errors(ga)
+
+    if args.aircraft:
+        report["aircraft_errors"] = service.aerolog_upload_aircraft_error_report(
+            upload_flights
+        )
+
+    if args.upload_dry_run:
+        report["upload_flights"] = upload_flights
+        report["upload"] = service.send_glidingapp_flights_to_aerolog(
+            upload_flights,
+            modify_payer=args.modify_payer,
+            dry_run=True,
+            resend=args.resend,
+        )
+
+    return report
+
+
+def run_range(args: argparse.Namespace, service: FlightUpdaterService) -> dict:
+    return service.reconcile_date_range(
+        args.date,
+        args.end_date,
+        modify_payer=args.modify_payer,
+        force_refresh=args.refresh,
+        max_workers=args.workers,
+    )
+
+
+def run_pdf_export(args: argparse.Namespace, service: FlightUpdaterService) -> dict:
+    # Imported here so that only --pdf-dir needs reportlab.
+    from view.ga_pdf_printer import GAPdfPrinter
+
+    days = service.fetch_glidingapp_date_range(
+        args.date,
+        args.end_date or args.date,
+        modify_payer=args.modify_payer,
+        force_refresh=args.refresh,
+        max_workers=args.workers,
+    )
+
+    printer = GAPdfPrinter(
+        save_to_file=True,
+        grl_only=False,
+        group_by_launch_type=args.group_by_launch_type,
+        renderer=args.pdf_renderer,
+    )
+
+    export_days = [
+        (day["date"], day["ga"])
+        for day in days
+        if "error" not in day and day["ga"]
+    ]
+
+    saved = printer.export_days(
+        export_days,
+        output_dir=args.pdf_dir,
+        combined=args.pdf_combined,
+        max_workers=args.workers,
+        progress=lambda msg: print(msg, file=sys.stderr),
+    )
+
+    expected = min(len(export_days), 1) if args.pdf_combined else len(export_days)
+
+    return {
+        "saved": saved,
+        "failed": [day for day in days if "error" in day],
+        "incomplete": len(saved) < expected,
+    }
+
+
+def has_differences(report: dict) -> bool:
+    reconciliation: Reconciliation = report["reconciliation"]
+
+    unmatched = [
+        reconciliation.kt_not_ga,
+        reconciliation.ga_not_kt,
+    ]
+
+    if report["al"]:
+        unmatched.extend([reconciliation.al_not_ga, reconciliation.ga_not_al])
+
+    return (
+        any(unmatched)
+        or bool(report.get("errors"))
+        or bool(report.get("aircraft_errors"))
+    )
+
+
+def format_text(report: dict) -> list[str]:
+    formatter = FlightTableFormatter(
+        grl_only=False,
+        group_by_launch_type=False,
+    )
+    reconciliation: Reconciliation = report["reconciliation"]
+    latency = report["latency_seconds"]
+
+    lines: list[str] = [
+        f"Flights for {report['date']}",
+        f"Fetched in {max(latency.values()):.1f}s "
+        f"(Gliding.App {latency['ga']:.1f}s, "
+        f"Ktrax {latency['kt']:.1f}s, "
+        f"Aerolog {latency['al']:.1f}s)",
+        "",
+        f"{'Source':15}"
+        f"{'Aerotow':>10}"
+        f"{'Winch':>10}"
+        f"{'Self':>10}"
+        f"{'TMG':>10}"
+        f"{'Other':>10}"
+        f"{'Total':>10}",
+    ]
+
+    for name, key in (("Gliding.App", "ga"), ("Ktrax", "kt"), ("Aerolog", "al")):
+        counts = formatter.count_types_of_flight(report[key])
+        lines.append(f"{name:15}" + "".join(f"{count:>10}" for count in counts))
+
+    unmatched_sections = [
+        ("Flights in Ktrax but not in Gliding.App", reconciliation.kt_not_ga),
+        ("Flights in Gliding.App but not in Ktrax", reconciliation.ga_not_kt),
+    ]
+
+    if report["al"]:
+        unmatched_sections.extend([
+            ("Flights in Aerolog but not in Gliding.App", reconciliation.al_not_ga),
+            ("Flights in Gliding.App but not in Aerolog", reconciliation.ga_not_al),
+        ])
+
+    for title, flights in unmatched_sections:
+        if flights:
+            lines.extend(
+                line
+                for line, _tag in formatter.format_flights(
+                    flights,
+                    title,
+                    group_by_launch_type=False,
+                )
+            )
+
+    if "errors" in report:
+        lines.append("")
+        lines.append("Possible Gliding.App errors")
+
+        if not report["errors"]:
+            lines.append("No errors found.")
+
+        for heading, flights in report["errors"].items():
+            lines.extend(
+                line
+                for line, _tag in formatter.format_flights(
+                    flights,
+                    heading,
+                    group_by_launch_type=False,
+                    include_non_grl_sections=False,
+                )
+            )
+
+    if report.get("aircraft_errors"):
+        lines.append("")
+        lines.extend(report["aircraft_errors"])
+
+    if "upload" in report:
+        result = report["upload"]
+        lines.append("")
+        lines.append(
+            f"Aerolog dry run: "
+            f"status={result.get('status')}, "
+            f"records={result.get('record_count')}"
+        )
+
+        if "new_count" in result:
+            lines.append(
+                f"Upload plan: "
+                f"new={result['new_count']}, "
+                f"changed={result['changed_count']}, "
+                f"skipped as already sent={result['skipped_count']}, "
+                f"already in Aerolog={result['already_in_aerolog_count']}, "
+                f"already queued={result['queued_count']}"
+            )
+
+    return lines
+
+
+RANGE_COUNT_COLUMNS = [
+    ("ga", "GA"),
+    ("kt", "Ktrax"),
+    ("al", "Aerolog"),
+    ("kt_not_ga", "KT-GA"),
+    ("ga_not_kt", "GA-KT"),
+    ("al_not_ga", "AL-GA"),
+    ("ga_not_al", "GA-AL"),
+]
+
+
+def range_has_differences(report: dict) -> bool:
+    totals = report["totals"]
+
+    return bool(
+        totals["failed_days"]
+        or totals["kt_not_ga"]
+        or totals["ga_not_kt"]
+        or totals["al_not_ga"]
+        or totals["ga_not_al"]
+    )
+
+
+def format_range_text(report: dict) -> list[str]:
+    lines: list[str] = [
+        f"Flights from {report['start_date']} to {report['end_date']}",
+        "",
+        f"{'Date':12}" + "".join(f"{label:>10}" for _key, label in RANGE_COUNT_COLUMNS),
+    ]
+
+    for day in report["days"]:
+        if "error" in day:
+            lines.append(f"{day['date'].isoformat():12}ERROR {day['error']}")
+            continue
+
+        counts = day["counts"]
+        lines.append(
+            f"{day['date'].isoformat():12}"
+            + "".join(f"{counts[key]:>10}" for key, _label in RANGE_COUNT_COLUMNS)
+        )
+
+    totals = report["totals"]
+    lines.append(
+        f"{'Total':12}"
+        + "".join(f"{totals[key]:>10}" for key, _label in RANGE_COUNT_COLUMNS)
+    )
+
+    if totals["failed_days"]:
+        lines.append("")
+        lines.append(f"Days that could not be fetched: {totals['failed_days']}")
+
+    summary = report.get("ga_summary")
+
+    if summary:
+        lines.append("")
+        lines.append("Gliding.App flights by launch type")
+
+        for launch, count in sorted(summary["by_launch"].items()):
+            lines.append(f"{launch or 'unknown':15}{count:>10}")
+
+        lines.append("")
+        lines.append(f"{'Club aircraft departing away from GRL':40}{summary['away_from_grl_club']:>10}")
+        lines.append(f"{'GA flights for Aerolog upload (GRL)':40}{summary['aerolog_upload_candidates']:>10}")
+        lines.append(f"{'Aerotows with no tug pilot listed':40}{summary['aerotows_missing_tug_pilot']:>10}")
+
+    return lines
+
+
+def format_range_json(report: dict) -> str:
+    days: list[dict] = []
+
+    for day in report["days"]:
+        if "error" in day:
+            days.append({"date": day["date"], "error": day["error"]})
+            continue
+
+        reconciliation: Reconciliation = day["reconciliation"]
+        days.append({
+            "date": day["date"],
+            "counts": day["counts"],
+            "kt_not_ga": _rows_to_json(reconciliation.kt_not_ga),
+            "ga_not_kt": _rows_to_json(reconciliation.ga_not_kt),
+            "al_not_ga": _rows_to_json(reconciliation.al_not_ga) if day["al"] else [],
+            "ga_not_al": _rows_to_json(reconciliation.ga_not_al) if day["al"] else [],
+        })
+
+    data = {
+        "start_date": report["start_date"],
+        "end_date": report["end_date"],
+        "totals": report["totals"],
+        "days": days,
+    }
+
+    if "ga_summary" in report:
+        data["ga_summary"] = {
+            **report["ga_summary"],
+            "by_date": {
+                day.isoformat(): count
+                for day, count in report["ga_summary"]["by_date"].items()
+            },
+        }
+
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+
+
+def format_json(report: dict) -> str:
+    reconciliation: Reconciliation = report["reconciliation"]
+
+    data: dict = {
+        "date": report["date"],
+        "latency_seconds": report["latency_seconds"],
+        "counts": {
+            key: len(report[key])
+            for key in ("ga", "kt", "al")
+        },
+        "kt_not_ga": _rows_to_json(reconciliation.kt_not_ga),
+        "ga_not_kt": _rows_to_json(reconciliation.ga_not_kt),
+        "al_not_ga": _rows_to_json(reconciliation.al_not_ga) if report["al"] else [],
+        "ga_not_al": _rows_to_json(reconciliation.ga_not_al) if report["al"] else [],
+    }
+
+    if "errors" in report:
+        data["errors"] = {
+            heading: _rows_to_json(flights)
+            for heading, flights in report["errors"].items()
+        }
+
+    if "aircraft_errors" in report:
+        data["aircraft_errors"] = report["aircraft_errors"]
+
+    if "upload" in report:
+        data["upload"] = report["upload"]
+        data["upload"]["flights"] = _rows_to_json(report["upload_flights"])
+
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+
+
+def _rows_to_json(rows: list[FlightDisplayRow]) -> list[dict]:
+    # Only the constructor fields; the derived lookup keys are internal.
+    row_fields = [f.name for f in fields(FlightDisplayRow) if f.init]
+
+    return [
+        {name: getattr(row, name) for name in row_fields}
+        for row in rows
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    try:
+        service = FlightUpdaterService(load_config())
+
+        if args.pdf_dir is not None:
+            export = run_pdf_export(args, service)
+        elif args.end_date is not None:
+            report = run_range(args, service)
+        else:
+            report = run(args, service)
+    except Exception:
+        traceback.print_exc()
+        return EXIT_ERROR
+
+    if args.pdf_dir is not None:
+        for path in export["saved"]:
+            print(path)
+
+        for day in export["failed"]:
+            print(f"{day['date'].isoformat()} ERROR {day['error']}", file=sys.stderr)
+
+        return EXIT_ERROR if export["failed"] or export["incomplete"] else EXIT_OK
+
+    if args.end_date is not None:
+        if args.format == "json":
+            print(format_range_json(report))
+        else:
+            print("\n".join(format_range_text(report)))
+
+        differences = range_has_differences(report)
+    else:
+        if args.format == "json":
+            print(format_json(report))
+        else:
+            print("\n".join(format_text(report)))
+
+        differences = has_differences(report)
+
+    if args.fail_on_differences and differences:
+        return EXIT_DIFFERENCES
+
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
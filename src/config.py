@@ -1,7 +1,32 @@
 ﻿import json
+import sys
+from pathlib import Path
 
-def load_config():
-    with open("config.json", "r", encoding="utf-8") as f:
+
+def app_root() -> Path:
+    """
+    Return the application root directory.
+
+    Source mode:
+        FlightUpdater/
+            src/main.py
+            config.json
+
+    PyInstaller mode:
+        dist/
+            FlightUpdater.exe
+            config.json
+    """
+    if getattr(sys, "frozen", False):
+        return Path(sys.executable).resolve().parent
+
+    return Path(__file__).resolve().parents[1]
+
+
+def load_config() -> dict:
+    config_path = app_root() / "config.json"
+
+    with config_path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 APP_NAME = "FlightUpdater"
@@ -0,0 +1,5 @@
+# PDF renderers for GAPdfPrinter. "platypus" lays tables out with
+# reportlab's Table flowable; "canvas" draws rows straight onto the page and
+# is much faster on busy days. Kept here so callers can offer the choice
+# without importing reportlab.
+RENDERERS = ("platypus", "canvas")
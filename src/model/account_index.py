@@ -0,0 +1,47 @@
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+
+@dataclass(frozen=True)
+class AccountIndex:
+    """
+    Lookup sets built once from the Gliding.App active accounts.
+
+    Keyed by membership number, so error tests only do set and dict
+    lookups per flight.
+    """
+
+    by_membership_number: dict[str, Any] = field(default_factory=dict)
+    active_members: frozenset[str] = frozenset()
+    instructors: frozenset[str] = frozenset()
+
+    @classmethod
+    def build(cls, accounts: Iterable[Any]) -> "AccountIndex":
+        by_membership_number: dict[str, Any] = {}
+        instructors: set[str] = set()
+
+        for account in accounts:
+            membership_number = account.membership_number
+
+            if not membership_number:
+                continue
+
+            by_membership_number[membership_number] = account
+
+            if any("instructor" in group.lower() for group in account.groups):
+                instructors.add(membership_number)
+
+        return cls(
+            by_membership_number=by_membership_number,
+            active_members=frozenset(by_membership_number),
+            instructors=frozenset(instructors),
+        )
+
+    def is_instructor(self, membership_number: str | None) -> bool:
+        return membership_number in self.instructors
+
+    def is_active_member(self, membership_number: str | None) -> bool:
+        return membership_number in self.active_members
+
+    def get(self, membership_number: str | None) -> Any | None:
+        return self.by_membership_number.get(membership_number or "")
@@ -0,0 +1,65 @@
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+
+# Registrations and callsigns repeat across every flight and aircraft list,
+# so the distinct values seen stay small.
+IDENTITY_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True, slots=True)
+class AircraftIdentity:
+    """
+    Normalised identifiers of one aircraft record.
+
+    ids holds one normalised value per field, in the order given (empty when
+    the field is blank), and doubles as the sort key. keys holds the distinct
+    non-empty ids, in the same order, and key_set the same as a frozenset for
+    overlap tests.
+    """
+
+    ids: tuple[str, ...]
+    keys: tuple[str, ...]
+    key_set: frozenset[str]
+
+    def matches(self, other: "AircraftIdentity") -> bool:
+        return not self.key_set.isdisjoint(other.key_set)
+
+
+@lru_cache(maxsize=IDENTITY_CACHE_SIZE)
+def normalise_aircraft_id(value: Any) -> str:
+    """Upper case, with spaces and hyphens removed: "g-ckab " -> "GCKAB"."""
+    return sys.intern(
+        str(value or "")
+        .strip()
+        .upper()
+        .replace("-", "")
+        .replace(" ", "")
+    )
+
+
+@lru_cache(maxsize=IDENTITY_CACHE_SIZE)
+def aircraft_identity(*values: Any) -> AircraftIdentity:
+    ids = tuple(normalise_aircraft_id(value) for value in values)
+    keys = tuple(dict.fromkeys(key for key in ids if key))
+
+    return AircraftIdentity(ids=ids, keys=keys, key_set=frozenset(keys))
+
+
+def glidingapp_identity(aircraft: Any) -> AircraftIdentity:
+    return aircraft_identity(aircraft.registration, aircraft.callsign)
+
+
+def aerolog_identity(aircraft: Any) -> AircraftIdentity:
+    return aircraft_identity(
+        aircraft.registration,
+        aircraft.competition_registration,
+        aircraft.short_registration,
+    )
+
+
+def values_differ(left: Any, right: Any) -> bool:
+    """True if two identifiers differ once normalised; two blanks do not."""
+    return normalise_aircraft_id(left) != normalise_aircraft_id(right)
@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+from model.aircraft_identity import glidingapp_identity, normalise_aircraft_id
+
+
+@dataclass(frozen=True)
+class AircraftIndex:
+    """
+    Gliding.App aircraft keyed by every normalised registration and callsign.
+
+    Built once per aircraft refresh, so resolving a flight's aircraft is a
+    dict lookup rather than a scan that re-normalises every aircraft.
+    Registrations take precedence over callsigns when the two collide.
+    """
+
+    by_key: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, aircraft: Iterable[Any]) -> "AircraftIndex":
+        identified = [(glidingapp_identity(item), item) for item in aircraft]
+        by_key: dict[str, Any] = {}
+
+        # ids are (registration, callsign).
+        for position in range(2):
+            for identity, item in identified:
+                key = identity.ids[position]
+
+                if key:
+                    by_key.setdefault(key, item)
+
+        return cls(by_key=by_key)
+
+    def find(self, *identifiers: str | None) -> Any | None:
+        """The aircraft for the first identifier that matches, in the order given."""
+        for identifier in identifiers:
+            aircraft = self.by_key.get(normalise_aircraft_id(identifier))
+
+            if aircraft is not None:
+                return aircraft
+
+        return None
+
+    def __len__(self) -> int:
+        return len(self.by_key)
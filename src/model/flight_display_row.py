@@ -1,10 +1,21 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import date, time
 from typing import Optional
 
+from model.aircraft_identity import aircraft_identity
 
-@dataclass
+
+@dataclass(slots=True)
 class FlightDisplayRow:
+    """
+    One flight as shown, compared and printed.
+
+    The fields after is_club_aircraft are derived once at construction so
+    that matching, sorting and sectioning can read them directly. Rows are
+    not modified after they are built.
+    """
+
     source: str
     uuid: str = ""
     sync_key: int | None = None
@@ -32,6 +43,30 @@ class FlightDisplayRow:
     aircraft_category: str = ""
     is_club_aircraft: bool = False
 
+    takeoff_seconds: int | None = field(default=None, init=False, repr=False, compare=False)
+    landing_seconds: int | None = field(default=None, init=False, repr=False, compare=False)
+    launch_key: str = field(default="", init=False, repr=False, compare=False)
+    airfield_takeoff_key: str = field(default="", init=False, repr=False, compare=False)
+    aircraft_keys: frozenset[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    tow_keys: frozenset[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Low-cardinality strings are shared between rows.
+        self.source = _intern(self.source)
+        self.launch_method = _intern(self.launch_method)
+        self.category = _intern(self.category)
+        self.airfield_takeoff = _intern(self.airfield_takeoff)
+        self.airfield_landing = _intern(self.airfield_landing)
+        self.aircraft_category = _intern(self.aircraft_category)
+
+        self.takeoff_seconds = _seconds_since_midnight(self.takeoff_time)
+        self.landing_seconds = _seconds_since_midnight(self.landing_time)
+        self.launch_key = _intern((self.launch_method or "").lower())
+        self.airfield_takeoff_key = _intern((self.airfield_takeoff or "").upper())
+
+        self.aircraft_keys = aircraft_identity(self.callsign, self.registration).key_set
+        self.tow_keys = aircraft_identity(self.tow_callsign).key_set
+
     def takeoff_str(self) -> str:
         return self.takeoff_time.strftime("%H:%M") if self.takeoff_time else ""
 
@@ -39,4 +74,15 @@ class FlightDisplayRow:
         return self.landing_time.strftime("%H:%M") if self.landing_time else ""
 
     def date_str(self) -> str:
-        return self.flight_date.isoformat() if self.flight_date else ""
\ No newline at end of file
+        return self.flight_date.isoformat() if self.flight_date else ""
+
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _seconds_since_midnight(value: time | None) -> int | None:
+    if not value:
+        return None
+
+    return value.hour * 3600 + value.minute * 60 + value.second
@@ -0,0 +1,148 @@
+from typing import Iterable, Sequence
+
+from model.flight_display_row import FlightDisplayRow
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class FlightFrame:
+    """
+    Column-oriented view of a list of FlightDisplayRow.
+
+    Intended for season-scale filtering and aggregation: masks are NumPy
+    boolean arrays that can be combined with & and |, and group-by counts
+    use bincount over categorical codes. rows() converts a mask or index
+    back to the original row objects for display.
+    """
+
+    def __init__(self, rows: Sequence[FlightDisplayRow]):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError(
+                "NumPy is not installed. Install the frames extra "
+                "(poetry install --extras frames) to enable flight frames."
+            )
+
+        self._rows = list(rows)
+
+        # Categorical columns are small integer codes plus a label table.
+        self.labels: dict[str, list[str]] = {}
+        self.codes: dict[str, np.ndarray] = {}
+
+        for column, values in (
+            ("source", (r.source or "" for r in self._rows)),
+            ("launch", (r.launch_key for r in self._rows)),
+            ("airfield_takeoff", (r.airfield_takeoff_key for r in self._rows)),
+            ("category", ((r.category or "").strip().lower() for r in self._rows)),
+        ):
+            self.labels[column], self.codes[column] = _encode(values)
+
+        count = len(self._rows)
+
+        self.is_club_aircraft = np.fromiter(
+            (r.is_club_aircraft for r in self._rows),
+            dtype=bool,
+            count=count,
+        )
+        self.has_tug_pilot = np.fromiter(
+            (
+                bool((r.tow_pilot_account or "").strip() or (r.tow_pilot_name or "").strip())
+                for r in self._rows
+            ),
+            dtype=bool,
+            count=count,
+        )
+        self.flight_date = np.array(
+            [r.flight_date for r in self._rows],
+            dtype="datetime64[D]",
+        )
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def is_value(self, column: str, value: str) -> "np.ndarray":
+        labels = self.labels[column]
+
+        if value not in labels:
+            return np.zeros(len(self), dtype=bool)
+
+        return self.codes[column] == labels.index(value)
+
+    def launch_is(self, launch: str) -> "np.ndarray":
+        return self.is_value("launch", launch.lower())
+
+    def departs_from(self, airfield: str) -> "np.ndarray":
+        return self.is_value("airfield_takeoff", airfield.upper())
+
+    def club_aircraft(self) -> "np.ndarray":
+        return self.is_club_aircraft
+
+    def missing_tug_pilot(self) -> "np.ndarray":
+        return self.launch_is("aerotow") & ~self.has_tug_pilot
+
+    def from_source(self, source: str) -> "np.ndarray":
+        return self.is_value("source", source)
+
+    def aerolog_upload_candidates(
+        self,
+        include_non_grl_club_departures: bool = False,
+    ) -> "np.ndarray":
+        """The mask form of FlightTableFormatter.filter_aerolog_upload_flights."""
+        departures = self.departs_from("GRL")
+
+        if include_non_grl_club_departures:
+            departures = departures | self.club_aircraft()
+
+        return self.from_source("GA") & departures
+
+    def count_by(
+        self,
+        column: str,
+        mask: "np.ndarray | None" = None,
+    ) -> dict[str, int]:
+        codes = self.codes[column] if mask is None else self.codes[column][mask]
+        counts = np.bincount(codes, minlength=len(self.labels[column]))
+
+        return {
+            label: int(count)
+            for label, count in zip(self.labels[column], counts)
+            if count
+        }
+
+    def count_by_date(
+        self,
+        mask: "np.ndarray | None" = None,
+    ) -> dict:
+        """Flights per date. Rows with no flight_date are not counted."""
+        dates = self.flight_date if mask is None else self.flight_date[mask]
+        dates = dates[~np.isnat(dates)]
+        values, counts = np.unique(dates, return_counts=True)
+
+        return {
+            value.item(): int(count)
+            for value, count in zip(values, counts)
+        }
+
+    def rows(
+        self,
+        selection: "np.ndarray | None" = None,
+    ) -> list[FlightDisplayRow]:
+        """Return rows for a boolean mask or an array of positions."""
+        if selection is None:
+            return list(self._rows)
+
+        if selection.dtype == bool:
+            selection = np.flatnonzero(selection)
+
+        return [self._rows[position] for position in selection]
+
+
+def _encode(values: Iterable[str]) -> tuple[list[str], "np.ndarray"]:
+    labels: dict[str, int] = {}
+    codes = [labels.setdefault(value, len(labels)) for value in values]
+
+    return list(labels), np.array(codes, dtype=np.int32)
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, Callable
+
+from services.upload_outbox import OutboxChunk, UploadOutbox
+
+if TYPE_CHECKING:
+    # Annotations only, so this module imports without glidinglib.
+    from glidinglib.models.combination_flight_model import CombinationFlight
+
+
+DEFAULT_CHUNK_SIZE = 25
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_BACKOFF_SECONDS = 2.0
+MAX_BACKOFF_SECONDS = 300.0
+DRAIN_INTERVAL_SECONDS = 60.0
+
+
+@dataclass
+class ChunkResult:
+    """
+    Outcome of one chunk.
+
+    status is "sent", "rejected" (Aerolog answered but did not take it;
+    dropped, since resending the same records will not help) or "pending"
+    (still failing after max_attempts; left in the outbox for the drain).
+    """
+
+    chunk_id: int
+    record_count: int
+    status: str
+    attempts: int
+    error: str | None = None
+    flight_dates: list[date] = field(default_factory=list)
+
+
+class AerologUploadPipeline:
+    """
+    Sends CombinationFlight records to Aerolog in bounded chunks.
+
+    Every chunk goes into the UploadOutbox before it is sent. Chunks are sent
+    max_workers at a time, and each is retried with exponential backoff and
+    jitter up to max_attempts times. A chunk that still fails stays in the
+    outbox, and the background drain retries it later, also across restarts.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[CombinationFlight]], dict],
+        outbox: UploadOutbox,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+        on_sent: Callable[[list[CombinationFlight]], None] | None = None,
+    ):
+        self.send = send
+        self.outbox = outbox
+        self.chunk_size = max(1, chunk_size)
+        self.max_workers = max(1, max_workers)
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_seconds = backoff_seconds
+        self.on_sent = on_sent
+
+        self._stop_drain = threading.Event()
+        self._drain_thread: threading.Thread | None = None
+
+    @classmethod
+    def from_config(
+        cls,
+        config: dict,
+        send: Callable[[list[CombinationFlight]], dict],
+        on_sent: Callable[[list[CombinationFlight]], None] | None = None,
+    ) -> "AerologUploadPipeline":
+        upload_config = config.get("upload", {})
+
+        return cls(
+            send,
+            UploadOutbox.from_config(config),
+            chunk_size=upload_config.get("chunk_size", DEFAULT_CHUNK_SIZE),
+            max_workers=upload_config.get("max_workers", DEFAULT_MAX_WORKERS),
+            max_attempts=upload_config.get("max_attempts", DEFAULT_MAX_ATTEMPTS),
+            backoff_seconds=upload_config.get("backoff_seconds", DEFAULT_BACKOFF_SECONDS),
+            on_sent=on_sent,
+        )
+
+    def upload(
+        self,
+        flights: list[CombinationFlight],
+        progress: Callable[[str], None] | None = None,
+    ) -> list[ChunkResult]:
+        chunks: list[OutboxChunk] = []
+
+        for start in range(0, len(flights), self.chunk_size):
+            chunk_flights = flights[start:start + self.chunk_size]
+            # Added already claimed, so the drain cannot pick it up too.
+            chunk_id = self.outbox.add(chunk_flights, claimed=True)
+            chunks.append(OutboxChunk(chunk_id, chunk_flights, 0, None))
+
+        return self._send_chunks(chunks, progress)
+
+    def drain(
+        self,
+        progress: Callable[[str], None] | None = None,
+    ) -> list[ChunkResult]:
+        """Send every outbox chunk whose retry is due and that we can claim."""
+        chunks = [
+            chunk
+            for chunk in self.outbox.due()
+            if self.outbox.claim(chunk.chunk_id)
+        ]
+
+        return self._send_chunks(chunks, progress)
+
+    def pending_count(self) -> int:
+        return self.outbox.count()
+
+    def queued_sync_keys(self) -> set[int]:
+        return self.outbox.sync_keys()
+
+    def start_background_drain(
+        self,
+        interval_seconds: float = DRAIN_INTERVAL_SECONDS,
+        progress: Callable[[str], None] | None = None,
+    ) -> None:
+        if self._drain_thread is not None and self._drain_thread.is_alive():
+            return
+
+        self._stop_drain.clear()
+
+        def loop() -> None:
+            while not self._stop_drain.is_set():
+                try:
+                    self.drain(progress)
+                except Exception as exc:
+                    if progress is not None:
+                        progress(f"Aerolog outbox: drain failed: {type(exc).__name__}: {exc}")
+
+                self._stop_drain.wait(interval_seconds)
+
+        self._drain_thread = threading.Thread(
+            target=loop,
+            name="aerolog-outbox",
+            daemon=True,
+        )
+        self._drain_thread.start()
+
+    def stop_background_drain(self) -> None:
+        self._stop_drain.set()
+
+    def _send_chunks(
+        self,
+        chunks: list[OutboxChunk],
+        progress: Callable[[str], None] | None,
+    ) -> list[ChunkResult]:
+        """Send chunks the caller has already claimed."""
+        if not chunks:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="aerolog-upload",
+        ) as executor:
+            return list(executor.map(
+                lambda chunk: self._send_chunk(chunk, progress),
+                chunks,
+            ))
+
+    def _send_chunk(
+        self,
+        chunk: OutboxChunk,
+        progress: Callable[[str], None] | None,
+    ) -> ChunkResult:
+        flight_dates = sorted({f.flight_date for f in chunk.flights if f.flight_date is not None})
+        attempts = chunk.attempts
+        error: str | None = None
+
+        for attempt in range(self.max_attempts):
+            if attempt:
+                time.sleep(self._backoff(attempts))
+
+            attempts += 1
+
+            try:
+                result = self.send(chunk.flights)
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+                self.outbox.record_failure(chunk.chunk_id, error, time.time() + self._backoff(attempts))
+                continue
+
+            if not result.get("sent"):
+                self.outbox.remove(chunk.chunk_id)
+                outcome = ChunkResult(
+                    chunk.chunk_id,
+                    len(chunk.flights),
+                    "rejected",
+                    attempts,
+                    error=f"status={result.get('status')}",
+                    flight_dates=flight_dates,
+                )
+                self._report(outcome, progress)
+                return outcome
+
+            self.outbox.remove(chunk.chunk_id)
+
+            if self.on_sent is not None:
+                self.on_sent(chunk.flights)
+
+            outcome = ChunkResult(
+                chunk.chunk_id,
+                len(chunk.flights),
+                "sent",
+                attempts,
+                flight_dates=flight_dates,
+            )
+            self._report(outcome, progress)
+            return outcome
+
+        # Still in the outbox; let the drain claim it once its retry is due.
+        self.outbox.release(chunk.chunk_id)
+
+        outcome = ChunkResult(
+            chunk.chunk_id,
+            len(chunk.flights),
+            "pending",
+            attempts,
+            error=error,
+            flight_dates=flight_dates,
+        )
+        self._report(outcome, progress)
+        return outcome
+
+    def _backoff(self, attempts: int) -> float:
+        delay = min(self.backoff_seconds * 2 ** max(attempts - 1, 0), MAX_BACKOFF_SECONDS)
+        return delay * random.uniform(0.5, 1.0)
+
+    @staticmethod
+    def _report(
+        outcome: ChunkResult,
+        progress: Callable[[str], None] | None,
+    ) -> None:
+        if progress is None:
+            return
+
+        line = (
+            f"Aerolog chunk {outcome.chunk_id}: {outcome.status}, "
+            f"{outcome.record_count} records, {outcome.attempts} attempt(s)"
+        )
+
+        if outcome.error:
+            line += f" - {outcome.error}"
+
+        progress(line)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import pickle
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    # Annotations only, so this module imports without glidinglib.
+    from glidinglib.models.combination_flight_model import CombinationFlight
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".flightupdater"
+DEFAULT_RECENT_DAYS = 7
+DEFAULT_RECENT_TTL_SECONDS = 300
+
+
+class FlightCache:
+    """
+    On-disk cache of mapped CombinationFlight records, keyed by (source, date).
+
+    Days older than recent_days are treated as immutable and never expire.
+    Today, recent days and future days expire after recent_ttl_seconds.
+    If the cache file cannot be created, the cache disables itself.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        recent_days: int = DEFAULT_RECENT_DAYS,
+        recent_ttl_seconds: int = DEFAULT_RECENT_TTL_SECONDS,
+        enabled: bool = True,
+    ):
+        self.path = Path(path)
+        self.recent_days = recent_days
+        self.recent_ttl_seconds = recent_ttl_seconds
+        self.enabled = enabled
+
+        if self.enabled:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+
+                with self._connect() as conn:
+                    conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS flights (
+                            source TEXT NOT NULL,
+                            flight_date TEXT NOT NULL,
+                            fetched_at REAL NOT NULL,
+                            payload BLOB NOT NULL,
+                            PRIMARY KEY (source, flight_date)
+                        )
+                        """
+                    )
+            except (OSError, sqlite3.Error):
+                # Unwritable or unusable cache location: fetch without caching.
+                self.enabled = False
+
+    @classmethod
+    def from_config(cls, config: dict) -> "FlightCache":
+        cache_config = config.get("cache", {})
+
+        return cls(
+            path=cache_config.get("path") or DEFAULT_CACHE_DIR / "flight_cache.sqlite3",
+            recent_days=cache_config.get("recent_days", DEFAULT_RECENT_DAYS),
+            recent_ttl_seconds=cache_config.get(
+                "recent_ttl_seconds",
+                DEFAULT_RECENT_TTL_SECONDS,
+            ),
+            enabled=cache_config.get("enabled", True),
+        )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per call keeps the cache safe to use
+        # from the concurrent fetch threads.
+        conn = sqlite3.connect(self.path, timeout=10)
+
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def is_immutable(self, flight_date: date) -> bool:
+        return flight_date < date.today() - timedelta(days=self.recent_days)
+
+    def get(
+        self,
+        source: str,
+        flight_date: date,
+    ) -> list[CombinationFlight] | None:
+        if not self.enabled:
+            return None
+
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT fetched_at, payload FROM flights "
+                    "WHERE source = ? AND flight_date = ?",
+                    (source, flight_date.isoformat()),
+                ).fetchone()
+
+            if row is None:
+                return None
+
+            fetched_at, payload = row
+
+            if not self.is_immutable(flight_date):
+                if time.time() - fetched_at > self.recent_ttl_seconds:
+                    return None
+
+            return pickle.loads(payload)
+
+        except (
+            sqlite3.Error,
+            pickle.UnpicklingError,
+            AttributeError,
+            EOFError,
+            ImportError,
+            TypeError,
+        ):
+            # A corrupt entry, or one pickled by a different glidinglib
+            # version (moved module, changed constructor), is just a miss.
+            return None
+
+    def put(
+        self,
+        source: str,
+        flight_date: date,
+        flights: list[CombinationFlight],
+    ) -> None:
+        if not self.enabled:
+            return
+
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO flights "
+                    "(source, flight_date, fetched_at, payload) "
+                    "VALUES (?, ?, ?, ?)",
+                    (
+                        source,
+                        flight_date.isoformat(),
+                        time.time(),
+                        pickle.dumps(flights, protocol=pickle.HIGHEST_PROTOCOL),
+                    ),
+                )
+        except sqlite3.Error:
+            pass
+
+    def invalidate(
+        self,
+        source: str,
+        flight_date: date,
+    ) -> None:
+        if not self.enabled:
+            return
+
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "DELETE FROM flights WHERE source = ? AND flight_date = ?",
+                    (source, flight_date.isoformat()),
+                )
+        except sqlite3.Error:
+            pass
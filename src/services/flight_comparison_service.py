@@ -1,4 +1,5 @@
-from datetime import date, datetime
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 
 from model.flight_display_row import FlightDisplayRow
 
@@ -9,27 +10,15 @@ MAX_TOLERANCE_SECONDS = 180
 MAX_TOLERANCE_SECONDS = 120
 
 
-def _times_match(
-    t1,
-    t2,
+def _seconds_match(
+    s1: int | None,
+    s2: int | None,
     tolerance_seconds: int = MAX_TOLERANCE_SECONDS,
 ) -> bool:
-    if not t1 or not t2:
+    if s1 is None or s2 is None:
         return False
 
-    today = date.today()
-    delta = abs(
-        (
-            datetime.combine(today, t1)
-            - datetime.combine(today, t2)
-        ).total_seconds()
-    )
-
-    return delta <= tolerance_seconds
-
-
-def _normalise(value: str | None) -> str:
-    return (value or "").strip().upper()
+    return abs(s1 - s2) <= tolerance_seconds
 
 
 def flights_match(
@@ -43,10 +32,10 @@ def flights_match(
     if not _tow_aircraft_matches(f1, f2):
         return False
 
-    if not _times_match(f1.takeoff_time, f2.takeoff_time, tolerance_seconds):
+    if not _seconds_match(f1.takeoff_seconds, f2.takeoff_seconds, tolerance_seconds):
         return False
 
-    if not _times_match(f1.landing_time, f2.landing_time, tolerance_seconds):
+    if not _seconds_match(f1.landing_seconds, f2.landing_seconds, tolerance_seconds):
         return False
 
     return True
@@ -55,27 +44,15 @@ def _aircraft_matches(
     f1: FlightDisplayRow,
     f2: FlightDisplayRow,
 ) -> bool:
-    f1_keys = _aircraft_keys(f1)
-    f2_keys = _aircraft_keys(f2)
-
-    return bool(f1_keys & f2_keys)
-
-
-def _aircraft_keys(flight: FlightDisplayRow) -> set[str]:
-    keys = {
-        _normalise_aircraft_id(flight.callsign),
-        _normalise_aircraft_id(flight.registration),
-    }
-
-    return {key for key in keys if key}
+    return not f1.aircraft_keys.isdisjoint(f2.aircraft_keys)
 
 
 def _tow_aircraft_matches(
     f1: FlightDisplayRow,
     f2: FlightDisplayRow,
 ) -> bool:
-    f1_keys = _tow_aircraft_keys(f1)
-    f2_keys = _tow_aircraft_keys(f2)
+    f1_keys = f1.tow_keys
+    f2_keys = f2.tow_keys
 
     # If neither flight has a tow aircraft recorded, that is a match.
     if not f1_keys and not f2_keys:
@@ -85,47 +62,192 @@ def _tow_aircraft_matches(
     if not f1_keys or not f2_keys:
         return False
 
-    return bool(f1_keys & f2_keys)
+    return not f1_keys.isdisjoint(f2_keys)
+
+
+@dataclass
+class PairComparison:
+    """Result of matching Gliding.App flights against one other source."""
+
+    matched: list[tuple[FlightDisplayRow, FlightDisplayRow]] = field(default_factory=list)
+    ga_only: list[FlightDisplayRow] = field(default_factory=list)
+    other_only: list[FlightDisplayRow] = field(default_factory=list)
+
+
+@dataclass
+class Reconciliation:
+    ktrax: PairComparison
+    aerolog: PairComparison
 
+    @property
+    def kt_not_ga(self) -> list[FlightDisplayRow]:
+        return self.ktrax.other_only
 
-def _tow_aircraft_keys(flight: FlightDisplayRow) -> set[str]:
-    keys = {
-        _normalise_aircraft_id(getattr(flight, "tow_callsign", "")),
-        _normalise_aircraft_id(getattr(flight, "tow_registration", "")),
-    }
+    @property
+    def ga_not_kt(self) -> list[FlightDisplayRow]:
+        return self.ktrax.ga_only
 
-    return {key for key in keys if key}
+    @property
+    def al_not_ga(self) -> list[FlightDisplayRow]:
+        return self.aerolog.other_only
 
+    @property
+    def ga_not_al(self) -> list[FlightDisplayRow]:
+        return self.aerolog.ga_only
 
-def _normalise_aircraft_id(value: str | None) -> str:
-    return (
-        (value or "")
-        .strip()
-        .upper()
-        .replace("-", "")
-        .replace(" ", "")
+
+def reconcile(
+    ga: list[FlightDisplayRow],
+    kt: list[FlightDisplayRow],
+    al: list[FlightDisplayRow],
+    tolerance_seconds: int = MAX_TOLERANCE_SECONDS,
+) -> Reconciliation:
+    """
+    Match Gliding.App against Ktrax and Aerolog in a single pass per pair.
+
+    Each pairing is derived once, and the unmatched flights on both sides
+    come from the same pass.
+    """
+    return Reconciliation(
+        ktrax=compare_pair(ga, kt, tolerance_seconds),
+        aerolog=compare_pair(ga, al, tolerance_seconds),
+    )
+
+
+def compare_pair(
+    ga: list[FlightDisplayRow],
+    other: list[FlightDisplayRow],
+    tolerance_seconds: int = MAX_TOLERANCE_SECONDS,
+) -> PairComparison:
+    matched, ga_only, other_only = match_flights(ga, other, tolerance_seconds)
+
+    return PairComparison(
+        matched=matched,
+        ga_only=ga_only,
+        other_only=other_only,
     )
 
+
 def find_unmatched(
     source: list[FlightDisplayRow],
     target: list[FlightDisplayRow],
 ) -> list[FlightDisplayRow]:
-    unmatched: list[FlightDisplayRow] = []
+    _pairs, unmatched, _unused = match_flights(source, target)
+    return unmatched
+
+
+def match_flights(
+    source: list[FlightDisplayRow],
+    target: list[FlightDisplayRow],
+    tolerance_seconds: int = MAX_TOLERANCE_SECONDS,
+) -> tuple[
+    list[tuple[FlightDisplayRow, FlightDisplayRow]],
+    list[FlightDisplayRow],
+    list[FlightDisplayRow],
+]:
+    """
+    Greedily pair source flights with target flights.
+
+    Each source flight, in order, takes the lowest-indexed unused target
+    flight that satisfies flights_match. Target flights are bucketed by
+    aircraft key and sorted by takeoff time, so only candidates inside the
+    takeoff tolerance window are checked.
+
+    Returns (matched pairs, unmatched source flights, unmatched target flights).
+    """
+    index = _build_takeoff_index(target)
     used: set[int] = set()
 
+    pairs: list[tuple[FlightDisplayRow, FlightDisplayRow]] = []
+    unmatched: list[FlightDisplayRow] = []
+
     for flight in source:
-        found = False
+        match_index = _find_first_match(
+            flight,
+            target,
+            index,
+            used,
+            tolerance_seconds,
+        )
+
+        if match_index is None:
+            unmatched.append(flight)
+            continue
+
+        used.add(match_index)
+        pairs.append((flight, target[match_index]))
+
+    unused = [
+        candidate
+        for index_, candidate in enumerate(target)
+        if index_ not in used
+    ]
+
+    return pairs, unmatched, unused
+
+
+TakeoffIndex = dict[str, tuple[list[int], list[int]]]
+
+
+def _build_takeoff_index(target: list[FlightDisplayRow]) -> TakeoffIndex:
+    """
+    Bucket target flights by aircraft key, sorted by takeoff seconds.
+
+    Flights without a takeoff or landing time can never match, so they
+    are left out of the index.
+    """
+    buckets: dict[str, list[tuple[int, int]]] = {}
+
+    for index, flight in enumerate(target):
+        if flight.takeoff_seconds is None or flight.landing_seconds is None:
+            continue
 
-        for index, candidate in enumerate(target):
-            if index in used:
+        for key in flight.aircraft_keys:
+            buckets.setdefault(key, []).append((flight.takeoff_seconds, index))
+
+    index: TakeoffIndex = {}
+
+    for key, entries in buckets.items():
+        entries.sort()
+        index[key] = (
+            [takeoff for takeoff, _ in entries],
+            [position for _, position in entries],
+        )
+
+    return index
+
+
+def _find_first_match(
+    flight: FlightDisplayRow,
+    target: list[FlightDisplayRow],
+    index: TakeoffIndex,
+    used: set[int],
+    tolerance_seconds: int,
+) -> int | None:
+    if flight.takeoff_seconds is None or flight.landing_seconds is None:
+        return None
+
+    takeoff = flight.takeoff_seconds
+    best: int | None = None
+
+    for key in flight.aircraft_keys:
+        bucket = index.get(key)
+
+        if bucket is None:
+            continue
+
+        takeoffs, positions = bucket
+        start = bisect_left(takeoffs, takeoff - tolerance_seconds)
+        end = bisect_right(takeoffs, takeoff + tolerance_seconds)
+
+        for position in positions[start:end]:
+            if position in used:
                 continue
 
-            if flights_match(flight, candidate):
-                used.add(index)
-                found = True
-                break
+            if best is not None and position >= best:
+                continue
 
-        if not found:
-            unmatched.append(flight)
+            if flights_match(flight, target[position], tolerance_seconds):
+                best = position
 
-    return unmatched
\ No newline at end of file
+    return best
@@ -1,5 +1,8 @@
-from datetime import date
-from copy import deepcopy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from copy import copy
 from glidinglib.clients.ktrax_flight_client import KtraxFlightClient
 from glidinglib.services.glidingapp_flight_service import GlidingAppFlightService
 from glidinglib.services.ktrax_flight_service import KtraxFlightService
@@ -16,14 +19,28 @@ from glidinglib.mappers.glidingapp_combination_flight_mapper import (
     map_glidingapp_flights_to_combination_flights,
 )
 from glidinglib.models.combination_flight_model import CombinationFlight
+from model.account_index import AccountIndex
+from model.aircraft_identity import (
+    aerolog_identity,
+    glidingapp_identity,
+    normalise_aircraft_id,
+    values_differ,
+)
+from model.aircraft_index import AircraftIndex
 from model.flight_display_row import FlightDisplayRow
+from services.aerolog_upload_pipeline import AerologUploadPipeline
+from services.flight_cache import FlightCache
+from services.flight_comparison_service import match_flights, reconcile
+from services.ogn_device_index import OgnDeviceIndex
+from services.reference_cache import DEFAULT_REFERENCE_TTL_SECONDS, ReferenceCache
+from services.upload_journal import UploadJournal
 
 from pathlib import Path
 
 from glidinglib.clients.aerolog_aircraft_client import AerologAircraftClient
 from glidinglib.models.aerolog_aircraft_model import AerologAircraft
 from glidinglib.models.glidingapp_aircraft_model import GlidingAppAircraft
-from typing import Any
+from typing import Any, Callable
 from glidinglib.clients.ogn_ddb_client import OgnDdbClient
 
 PAYER_BY_CATEGORY = {
@@ -32,6 +49,14 @@ PAYER_BY_CATEGORY = {
     "scouts": "1099",
 }
 
+# One worker per flight source (Gliding.App, Ktrax, Aerolog).
+FETCH_MAX_WORKERS = 3
+
+# Days fetched at once in date-range mode. Each day uses its own
+# FETCH_MAX_WORKERS pool, so this bounds the total to 12 requests.
+DATE_RANGE_MAX_WORKERS = 4
+
+
 class FlightUpdaterService:
     def __init__(self, config: dict):
         self.config = config
@@ -45,7 +70,8 @@ class FlightUpdaterService:
         self.ga_aircraft: list[GlidingAppAircraft] = []
         self.al_aircraft: list[AerologAircraft] = []
         self.ogn_ddb_client = OgnDdbClient(app_name="FlightUpdater")
-        self.ogn_records: list[dict[str, Any]] = []
+        self.ogn_index: OgnDeviceIndex | None = None
+        self._ogn_lock = threading.Lock()
 
         ktrax_config = config.get("ktrax", {})
         self.ktrax_service = KtraxFlightService(
@@ -55,20 +81,115 @@ class FlightUpdaterService:
             )
         )
         self.ga_base_combination_flights: list[CombinationFlight] = []
-        self.ga_combination_flights: list[CombinationFlight] = []
+        # Aerolog rows from the same fetch, to avoid uploading flights that
+        # are already there.
+        self.al_flights: list[FlightDisplayRow] = []
+        self.fetch_latency_seconds: dict[str, float] = {}
+        self.flight_cache = FlightCache.from_config(config)
+        self.reference_cache = ReferenceCache(
+            ttl_seconds=config.get("cache", {}).get(
+                "reference_ttl_seconds",
+                DEFAULT_REFERENCE_TTL_SECONDS,
+            ),
+        )
+        self.upload_journal = UploadJournal.from_config(
+            config,
+            payloads=self._aerolog_payloads,
+        )
+        self.upload_pipeline = AerologUploadPipeline.from_config(
+            config,
+            send=self._send_chunk_to_aerolog,
+            on_sent=self._on_aerolog_chunk_sent,
+        )
+
+    def get_aircraft_by_registration(self) -> dict[str, GlidingAppAircraft]:
+        return self.reference_cache.get(
+            "aircraft_by_registration",
+            self.aircraft_service.get_aircraft_by_registration,
+        )
+
+    def get_aircraft_by_callsign(self) -> dict[str, GlidingAppAircraft]:
+        return self.reference_cache.get(
+            "aircraft_by_callsign",
+            self.aircraft_service.get_aircraft_by_callsign,
+        )
+
+    def get_aircraft_index(self) -> AircraftIndex:
+        aircraft_by_registration = self.get_aircraft_by_registration()
+
+        def build() -> tuple[dict, AircraftIndex]:
+            return (
+                aircraft_by_registration,
+                AircraftIndex.build(aircraft_by_registration.values()),
+            )
+
+        source, index = self.reference_cache.get("aircraft_index", build)
+
+        # Rebuilt whenever the aircraft list has been refetched since.
+        if source is not aircraft_by_registration:
+            self.reference_cache.invalidate("aircraft_index")
+            source, index = self.reference_cache.get("aircraft_index", build)
+
+        return index
+
+    def get_account_index(self) -> AccountIndex:
+        return self.reference_cache.get(
+            "account_index",
+            lambda: AccountIndex.build(self.account_service.get_active_accounts()),
+        )
+
+    def invalidate_reference_data(self) -> None:
+        """Drop cached Gliding.App reference data so the next use refetches it."""
+        self.reference_cache.invalidate()
 
     def initialise_ogn_ddb(
         self,
         force_refresh: bool = False,
     ) -> dict:
-        records = self.ogn_ddb_client.load(force_refresh=force_refresh)
-        self.ogn_records = records
+        """
+        Open the compact OGN device index, rebuilding it from the DDB if needed.
+
+        The full DDB is only loaded when the index is missing, out of date
+        with the downloaded DDB, or a refresh is forced.
+        """
+        with self._ogn_lock:
+            source_path = Path(self.ogn_ddb_client.cache_path)
+            index_path = source_path.with_name(source_path.name + ".idx")
+
+            index = (
+                None
+                if force_refresh
+                else OgnDeviceIndex.open_if_fresh(index_path, source_path)
+            )
+
+            if index is None:
+                records = self.ogn_ddb_client.load(force_refresh=force_refresh)
+                index = OgnDeviceIndex.build(
+                    records,
+                    index_path,
+                    self.ogn_ddb_client.cache_path,
+                    normalise_device_id=self._normalise_flarm_id,
+                )
+
+            self.ogn_index = index
 
         return {
-            "record_count": len(records),
+            "record_count": index.source_record_count,
             "cache_path": str(self.ogn_ddb_client.cache_path),
         }
 
+    def find_ogn_records_for_ga(
+        self,
+        aircraft: list[GlidingAppAircraft],
+    ) -> list[dict[str, Any] | None]:
+        """Look up the OGN record for each aircraft by its FLARM ID."""
+        if not aircraft:
+            return []
+
+        if self.ogn_index is None:
+            self.initialise_ogn_ddb()
+
+        return [self._find_ogn_record_for_ga(ga) for ga in aircraft]
 
     def _find_ogn_record_for_ga(
         self,
@@ -79,23 +200,10 @@ class FlightUpdaterService:
         if not flarm_id:
             return None
 
-        if not self.ogn_records:
+        if self.ogn_index is None:
             self.initialise_ogn_ddb()
 
-        record = self.ogn_ddb_client.find_by_device_id(flarm_id)
-
-        if record is not None:
-            return record
-
-        # Fallback in case OGN or GA has prefixes / punctuation differences.
-        for candidate in self.ogn_records:
-            candidate_id = self._normalise_flarm_id(candidate.get("device_id"))
-
-            if candidate_id == flarm_id:
-                return candidate
-
-        return None
-
+        return self.ogn_index.find(flarm_id)
 
     @staticmethod
     def _normalise_flarm_id(value: object) -> str:
@@ -111,7 +219,6 @@ class FlightUpdaterService:
             .replace(" ", "")
         )
 
-
     @staticmethod
     def _ogn_field(
         record: dict[str, Any] | None,
@@ -122,49 +229,390 @@ class FlightUpdaterService:
 
         return str(record.get(field_name, "") or "").strip()
 
+    def fetch_all_sources(
+        self,
+        flight_date: date,
+        modify_payer: bool = True,
+        force_refresh: bool = False,
+        keep_for_upload: bool = True,
+    ) -> dict:
+        """
+        Fetch Gliding.App, Ktrax and Aerolog flights for a day concurrently.
+
+        The wall time is that of the slowest source rather than the sum of
+        all three. Per-source latency is returned and also kept in
+        fetch_latency_seconds. An exception from any source is re-raised.
+
+        With keep_for_upload=False the GA flights are not remembered as the
+        day to send to Aerolog, so other days can be fetched alongside.
+        """
+        # Range mode refreshes reference data once for all its days.
+        if force_refresh and keep_for_upload:
+            self.invalidate_reference_data()
+
+        fetch_glidingapp = (
+            self.get_glidingapp_flights
+            if keep_for_upload
+            else self._fetch_glidingapp_flights
+        )
+
+        fetchers = {
+            "ga": lambda: fetch_glidingapp(
+                flight_date,
+                modify_payer=modify_payer,
+                force_refresh=force_refresh,
+            ),
+            "kt": lambda: self.get_ktrax_flights(
+                flight_date,
+                force_refresh=force_refresh,
+            ),
+            "al": lambda: self.get_aerolog_flights(
+                flight_date,
+                force_refresh=force_refresh,
+            ),
+        }
+
+        with ThreadPoolExecutor(
+            max_workers=FETCH_MAX_WORKERS,
+            thread_name_prefix="fetch",
+        ) as executor:
+            futures = {
+                name: executor.submit(self._timed_fetch, fetch)
+                for name, fetch in fetchers.items()
+            }
+            results = {
+                name: future.result()
+                for name, future in futures.items()
+            }
+
+        latency = {
+            name: elapsed
+            for name, (_rows, elapsed) in results.items()
+        }
+
+        if keep_for_upload:
+            self.fetch_latency_seconds = latency
+            self.al_flights = results["al"][0]
+
+        return {
+            "ga": results["ga"][0],
+            "kt": results["kt"][0],
+            "al": results["al"][0],
+            "latency_seconds": latency,
+        }
+
+    def reconcile_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        modify_payer: bool = True,
+        force_refresh: bool = False,
+        max_workers: int = DATE_RANGE_MAX_WORKERS,
+    ) -> dict:
+        """
+        Reconcile Gliding.App against Ktrax and Aerolog for every day in a range.
+
+        Days are fetched in parallel through the same per-day pipeline as
+        fetch_all_sources. A day that fails is reported with its error and
+        does not stop the others. As in the GUI, Aerolog differences are only
+        counted for days that have Aerolog flights.
+        """
+        if end_date < start_date:
+            raise ValueError("end_date must not be before start_date")
+
+        if force_refresh:
+            self.invalidate_reference_data()
+
+        dates = [
+            start_date + timedelta(days=offset)
+            for offset in range((end_date - start_date).days + 1)
+        ]
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="day",
+        ) as executor:
+            days = list(executor.map(
+                lambda flight_date: self._reconcile_day(
+                    flight_date,
+                    modify_payer=modify_payer,
+                    force_refresh=force_refresh,
+                ),
+                dates,
+            ))
+
+        totals = {
+            "ga": 0,
+            "kt": 0,
+            "al": 0,
+            "kt_not_ga": 0,
+            "ga_not_kt": 0,
+            "al_not_ga": 0,
+            "ga_not_al": 0,
+            "failed_days": 0,
+        }
+
+        for day in days:
+            if "error" in day:
+                totals["failed_days"] += 1
+                continue
+
+            for key, count in day["counts"].items():
+                totals[key] += count
+
+        report = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "days": days,
+            "totals": totals,
+        }
+
+        ga_summary = self.summarise_flights([
+            row
+            for day in days
+            if "error" not in day
+            for row in day["ga"]
+        ])
+
+        if ga_summary is not None:
+            report["ga_summary"] = ga_summary
+
+        return report
+
+    def fetch_glidingapp_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        modify_payer: bool = True,
+        force_refresh: bool = False,
+        max_workers: int = DATE_RANGE_MAX_WORKERS,
+    ) -> list[dict]:
+        """
+        Fetch Gliding.App flights for every day in a range, in parallel.
+
+        Returns one dict per day, in date order, with either "ga" rows or
+        an "error". Used for batch PDF export; nothing is kept for upload.
+        """
+        if end_date < start_date:
+            raise ValueError("end_date must not be before start_date")
+
+        if force_refresh:
+            self.invalidate_reference_data()
+
+        dates = [
+            start_date + timedelta(days=offset)
+            for offset in range((end_date - start_date).days + 1)
+        ]
+
+        def fetch_day(flight_date: date) -> dict:
+            try:
+                ga = self._fetch_glidingapp_flights(
+                    flight_date,
+                    modify_payer=modify_payer,
+                    force_refresh=force_refresh,
+                )
+            except Exception as exc:
+                return {
+                    "date": flight_date,
+                    "error": f"{type(exc).__name__}: {exc}",
+                }
+
+            return {"date": flight_date, "ga": ga}
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="day",
+        ) as executor:
+            return list(executor.map(fetch_day, dates))
+
+    @staticmethod
+    def summarise_flights(flights: list[FlightDisplayRow]) -> dict | None:
+        """
+        Season-scale launch and error counts, computed on a FlightFrame.
+
+        None when NumPy (the frames extra) is not installed. The import is
+        deferred so that NumPy is only loaded for a date-range report.
+        """
+        from model.flight_frame import NUMPY_AVAILABLE, FlightFrame
+
+        if not NUMPY_AVAILABLE:
+            return None
+
+        frame = FlightFrame(flights)
+        away_club = ~frame.departs_from("GRL") & frame.club_aircraft()
+
+        return {
+            "by_launch": frame.count_by("launch"),
+            "by_date": frame.count_by_date(),
+            "away_from_grl_club": int(away_club.sum()),
+            "aerolog_upload_candidates": int(frame.aerolog_upload_candidates().sum()),
+            "aerotows_missing_tug_pilot": int(frame.missing_tug_pilot().sum()),
+        }
+
+    def _reconcile_day(
+        self,
+        flight_date: date,
+        modify_payer: bool = True,
+        force_refresh: bool = False,
+    ) -> dict:
+        try:
+            fetched = self.fetch_all_sources(
+                flight_date,
+                modify_payer=modify_payer,
+                force_refresh=force_refresh,
+                keep_for_upload=False,
+            )
+        except Exception as exc:
+            return {
+                "date": flight_date,
+                "error": f"{type(exc).__name__}: {exc}",
+            }
+
+        ga = fetched["ga"]
+        kt = fetched["kt"]
+        al = fetched["al"]
+        reconciliation = reconcile(ga, kt, al)
+
+        al_not_ga = reconciliation.al_not_ga if al else []
+        ga_not_al = reconciliation.ga_not_al if al else []
+
+        return {
+            "date": flight_date,
+            "ga": ga,
+            "kt": kt,
+            "al": al,
+            "reconciliation": reconciliation,
+            "latency_seconds": fetched["latency_seconds"],
+            "counts": {
+                "ga": len(ga),
+                "kt": len(kt),
+                "al": len(al),
+                "kt_not_ga": len(reconciliation.kt_not_ga),
+                "ga_not_kt": len(reconciliation.ga_not_kt),
+                "al_not_ga": len(al_not_ga),
+                "ga_not_al": len(ga_not_al),
+            },
+        }
+
+    @staticmethod
+    def _timed_fetch(fetch) -> tuple[list[FlightDisplayRow], float]:
+        started = time.perf_counter()
+        rows = fetch()
+        return rows, time.perf_counter() - started
+
     def get_glidingapp_flights(
         self,
         flight_date: date,
         modify_payer: bool = True,
+        force_refresh: bool = False,
     ) -> list[FlightDisplayRow]:
-        ga_flights = self.ga_service.get_flights_for_date(flight_date)
-        base_combination_flights = map_glidingapp_flights_to_combination_flights(ga_flights)
+        base_combination_flights, rows = self._load_glidingapp_flights(
+            flight_date,
+            modify_payer=modify_payer,
+            force_refresh=force_refresh,
+        )
 
         self.ga_base_combination_flights = base_combination_flights
 
-        combination_flights = deepcopy(base_combination_flights)
-        aircraft_by_registration = self.aircraft_service.get_aircraft_by_registration()
-        aircraft_by_callsign = self.aircraft_service.get_aircraft_by_callsign()
+        return rows
 
-        if modify_payer:
-            self._modify_payers_by_category(combination_flights)
+    def _fetch_glidingapp_flights(
+        self,
+        flight_date: date,
+        modify_payer: bool = True,
+        force_refresh: bool = False,
+    ) -> list[FlightDisplayRow]:
+        _base, rows = self._load_glidingapp_flights(
+            flight_date,
+            modify_payer=modify_payer,
+            force_refresh=force_refresh,
+        )
+        return rows
+
+    def _load_glidingapp_flights(
+        self,
+        flight_date: date,
+        modify_payer: bool = True,
+        force_refresh: bool = False,
+    ) -> tuple[list[CombinationFlight], list[FlightDisplayRow]]:
+        base_combination_flights = self._cached_combination_flights(
+            "GA",
+            flight_date,
+            lambda: map_glidingapp_flights_to_combination_flights(
+                self.ga_service.get_flights_for_date(flight_date)
+            ),
+            force_refresh=force_refresh,
+        )
 
-        self.ga_combination_flights = combination_flights
+        aircraft_by_registration = self.get_aircraft_by_registration()
+        aircraft_by_callsign = self.get_aircraft_by_callsign()
 
-        return [
+        rows = [
             self._combination_to_display_row(
                 f,
                 aircraft_by_registration=aircraft_by_registration,
                 aircraft_by_callsign=aircraft_by_callsign,
+                payer_override=self._category_payer(f) if modify_payer else None,
             )
-            for f in combination_flights
+            for f in base_combination_flights
         ]
 
-    def get_ktrax_flights(self, flight_date: date) -> list[FlightDisplayRow]:
-        kt_flights = self.ktrax_service.get_flights_for_date(flight_date)
-        combination_flights = map_ktrax_flights_to_combination_flights(kt_flights)
+        return base_combination_flights, rows
+
+    def get_ktrax_flights(
+        self,
+        flight_date: date,
+        force_refresh: bool = False,
+    ) -> list[FlightDisplayRow]:
+        combination_flights = self._cached_combination_flights(
+            "KT",
+            flight_date,
+            lambda: map_ktrax_flights_to_combination_flights(
+                self.ktrax_service.get_flights_for_date(flight_date)
+            ),
+            force_refresh=force_refresh,
+        )
         return [self._combination_to_display_row(f) for f in combination_flights]
 
-    def get_aerolog_flights(self, flight_date: date) -> list[FlightDisplayRow]:
-        al_flights = self.aerolog_service.get_flights_for_date(flight_date)
-        combination_flights = map_aerolog_flights_to_combination_flights(al_flights)
+    def get_aerolog_flights(
+        self,
+        flight_date: date,
+        force_refresh: bool = False,
+    ) -> list[FlightDisplayRow]:
+        combination_flights = self._cached_combination_flights(
+            "AL",
+            flight_date,
+            lambda: map_aerolog_flights_to_combination_flights(
+                self.aerolog_service.get_flights_for_date(flight_date)
+            ),
+            force_refresh=force_refresh,
+        )
         return [self._combination_to_display_row(f) for f in combination_flights]
 
+    def _cached_combination_flights(
+        self,
+        source: str,
+        flight_date: date,
+        fetch,
+        force_refresh: bool = False,
+    ) -> list[CombinationFlight]:
+        if not force_refresh:
+            cached = self.flight_cache.get(source, flight_date)
+
+            if cached is not None:
+                return cached
+
+        combination_flights = fetch()
+        self.flight_cache.put(source, flight_date, combination_flights)
+
+        return combination_flights
+
     def _combination_to_display_row(
         self,
         flight: CombinationFlight,
         aircraft_by_registration: dict | None = None,
         aircraft_by_callsign: dict | None = None,
+        payer_override: str | None = None,
     ) -> FlightDisplayRow:
         aircraft = None
 
@@ -201,7 +649,7 @@ class FlightUpdaterService:
             pic_name=flight.pic_name,
             p2_account=flight.p2_membership_number,
             p2_name=flight.p2_name,
-            payer_account=flight.paying_pilot_membership_number,
+            payer_account=payer_override or flight.paying_pilot_membership_number,
 
             tow_callsign=flight.tow_callsign or flight.tow_registration,
             tow_pilot_account=flight.tow_pilot_account,
@@ -219,20 +667,15 @@ class FlightUpdaterService:
             airfield_takeoff=flight.airfield_takeoff,
             airfield_landing=flight.airfield_landing,
             notes=flight.remarks,
-        )    
+        )
+
     def test_for_errors(
         self,
         flights: list[FlightDisplayRow],
     ) -> dict[str, list[FlightDisplayRow]]:
-        accounts = self.account_service.get_active_accounts()
-        aircraft_by_callsign = self.aircraft_service.get_aircraft_by_callsign()
-        aircraft_by_registration = self.aircraft_service.get_aircraft_by_registration()
-
-        instructor_accounts = {
-            a.membership_number
-            for a in accounts
-            if any("instructor" in g.lower() for g in a.groups)
-        }
+        account_index = self.get_account_index()
+        aircraft_by_callsign = self.get_aircraft_by_callsign()
+        aircraft_by_registration = self.get_aircraft_by_registration()
 
         errors: dict[str, list[FlightDisplayRow]] = {
             "Club aircraft flown by an instructor/BI with no P2": [],
@@ -253,7 +696,7 @@ class FlightUpdaterService:
                 and aircraft.pilots == 2
             )
 
-            pic_is_instructor = f.pic_account in instructor_accounts
+            pic_is_instructor = account_index.is_instructor(f.pic_account)
             has_no_p2 = not (f.p2_name or "").strip()
 
             if is_club_two_seater and pic_is_instructor and has_no_p2:
@@ -286,23 +729,77 @@ class FlightUpdaterService:
             if rows
         }
 
-    def _modify_payers_by_category(
+    @staticmethod
+    def _category_payer(flight: CombinationFlight) -> str | None:
+        category_key = (flight.category or "").strip().lower()
+        return PAYER_BY_CATEGORY.get(category_key)
+
+    def _payer_overrides(
         self,
         flights: list[CombinationFlight],
-    ) -> None:
+    ) -> dict[int, str]:
+        """Payer changes by sync_key, applied on top of the unmodified flights."""
+        overrides: dict[int, str] = {}
+
         for flight in flights:
-            category_key = (flight.category or "").strip().lower()
+            payer = self._category_payer(flight)
 
-            payer = PAYER_BY_CATEGORY.get(category_key)
-            if payer:
+            if payer and flight.sync_key is not None:
+                overrides[flight.sync_key] = payer
+
+        return overrides
+
+    @staticmethod
+    def _apply_payer_overrides(
+        flights: list[CombinationFlight],
+        overrides: dict[int, str],
+    ) -> list[CombinationFlight]:
+        """
+        Return the flights with payer overrides applied.
+
+        Only overridden flights are copied, and only shallowly, so the base
+        flights are never modified.
+        """
+        result: list[CombinationFlight] = []
+
+        for flight in flights:
+            payer = overrides.get(flight.sync_key)
+
+            if payer and payer != flight.paying_pilot_membership_number:
+                flight = copy(flight)
                 flight.paying_pilot_membership_number = payer
 
+            result.append(flight)
+
+        return result
+
     def send_glidingapp_flights_to_aerolog(
         self,
         flights: list[FlightDisplayRow],
         modify_payer: bool = True,
         dry_run: bool = False,
+        progress: Callable[[str], None] | None = None,
+        resend: bool = False,
     ) -> dict:
+        """
+        Send the chosen GA flights to Aerolog, or build the payload on a dry run.
+
+        Flights the upload journal shows were already sent with identical
+        content are skipped unless resend is True; new_count, changed_count
+        and skipped_count report the split, for dry runs too.
+
+        Flights still waiting in the upload outbox from an earlier send are
+        left to the outbox rather than queued a second time (queued_count).
+
+        Flights not sent from here before are also matched against the
+        Aerolog rows from the last fetch, using the comparison's aircraft and
+        takeoff tolerance rules, and skipped if Aerolog already has them
+        (already_in_aerolog_count). Changed flights are always sent.
+
+        A live send goes through the upload pipeline: chunked, retried and
+        backed by the outbox. The result lists each chunk, and progress, if
+        given, is called as each chunk finishes.
+        """
         if not self.ga_base_combination_flights:
             return {
                 "status": "no_records",
@@ -311,14 +808,18 @@ class FlightUpdaterService:
                 "payload": [],
             }
 
-        sync_keys_to_send = {
-            f.sync_key
+        ga_rows = [
+            f
             for f in flights
             if f.source == "GA" and f.sync_key is not None
-        }
+        ]
+        sync_keys_to_send = {f.sync_key for f in ga_rows}
+
+        pairs, _unmatched, _unused = match_flights(ga_rows, self.al_flights)
+        in_aerolog = {ga.sync_key for ga, _al in pairs}
 
         combination_flights_to_send = [
-            deepcopy(f)
+            f
             for f in self.ga_base_combination_flights
             if f.sync_key in sync_keys_to_send
         ]
@@ -332,14 +833,128 @@ class FlightUpdaterService:
             }
 
         if modify_payer:
-            self._modify_payers_by_category(combination_flights_to_send)
+            combination_flights_to_send = self._apply_payer_overrides(
+                combination_flights_to_send,
+                self._payer_overrides(combination_flights_to_send),
+            )
 
-        return self.aerolog_service.send_combination_flight_log_to_aerolog(
+        queued_sync_keys = self.upload_pipeline.queued_sync_keys()
+        queued = [f for f in combination_flights_to_send if f.sync_key in queued_sync_keys]
+        combination_flights_to_send = [
+            f
+            for f in combination_flights_to_send
+            if f.sync_key not in queued_sync_keys
+        ]
+
+        plan = self.upload_journal.classify(combination_flights_to_send)
+
+        candidates = plan["new"] + plan["unchanged"] if resend else plan["new"]
+        already_in_aerolog = [f for f in candidates if f.sync_key in in_aerolog]
+        candidates = [f for f in candidates if f.sync_key not in in_aerolog]
+
+        counts = {
+            "new_count": len(plan["new"]) - sum(f.sync_key in in_aerolog for f in plan["new"]),
+            "changed_count": len(plan["changed"]),
+            "skipped_count": 0 if resend else len(plan["unchanged"]),
+            "already_in_aerolog_count": len(already_in_aerolog),
+            "queued_count": len(queued),
+        }
+
+        combination_flights_to_send = candidates + plan["changed"]
+
+        if not combination_flights_to_send:
+            return {
+                "status": "unchanged",
+                "sent": False,
+                "record_count": 0,
+                "payload": [],
+                **counts,
+            }
+
+        if dry_run:
+            return {
+                **self.aerolog_service.send_combination_flight_log_to_aerolog(
+                    combination_flights_to_send,
+                    data_source="config",
+                    dry_run=True,
+                ),
+                **counts,
+            }
+
+        chunks = self.upload_pipeline.upload(
             combination_flights_to_send,
+            progress=progress,
+        )
+
+        statuses = {chunk.status for chunk in chunks}
+
+        if statuses == {"sent"}:
+            status = "sent"
+        elif "sent" in statuses:
+            status = "partial"
+        else:
+            status = "failed"
+
+        return {
+            "status": status,
+            "sent": status == "sent",
+            "record_count": len(combination_flights_to_send),
+            "sent_count": sum(c.record_count for c in chunks if c.status == "sent"),
+            "chunks": chunks,
+            "pending_chunks": self.upload_pipeline.pending_count(),
+            **counts,
+        }
+
+    def start_upload_drain(
+        self,
+        progress: Callable[[str], None] | None = None,
+    ) -> int:
+        """
+        Start retrying unsent outbox chunks in the background.
+
+        Returns how many chunks were waiting, e.g. from a previous session.
+        """
+        pending = self.upload_pipeline.pending_count()
+        self.upload_pipeline.start_background_drain(progress=progress)
+        return pending
+
+    def _send_chunk_to_aerolog(self, flights: list[CombinationFlight]) -> dict:
+        return self.aerolog_service.send_combination_flight_log_to_aerolog(
+            flights,
             data_source="config",
-            dry_run=dry_run,
+            dry_run=False,
         )
-    
+
+    def _aerolog_payloads(self, flights: list[CombinationFlight]) -> list[Any]:
+        """The Aerolog upload record for each flight, as a dry run builds it."""
+        payload = self.aerolog_service.send_combination_flight_log_to_aerolog(
+            flights,
+            data_source="config",
+            dry_run=True,
+        ).get("payload")
+
+        if isinstance(payload, list) and len(payload) == len(flights):
+            return payload
+
+        # Not one record per flight, so build them one at a time.
+        return [
+            self.aerolog_service.send_combination_flight_log_to_aerolog(
+                [flight],
+                data_source="config",
+                dry_run=True,
+            ).get("payload")
+            for flight in flights
+        ]
+
+    def _on_aerolog_chunk_sent(self, flights: list[CombinationFlight]) -> None:
+        self.upload_journal.record(flights)
+
+        # Aerolog now holds new flights for these days, even if they are
+        # old enough to be in the immutable cache tier.
+        for flight_date in {f.flight_date for f in flights}:
+            if flight_date is not None:
+                self.flight_cache.invalidate("AL", flight_date)
+
     def load_aerolog_aircraft_file(
         self,
         excel_path: str | Path,
@@ -353,14 +968,12 @@ class FlightUpdaterService:
             "excel_cache_path": str(self.aerolog_aircraft_client.excel_cache_path),
         }
 
-
     def load_aerolog_aircraft_cache(self) -> list[AerologAircraft]:
         self.al_aircraft = self.aerolog_aircraft_client.load()
         return self.al_aircraft
 
-
     def load_glidingapp_aircraft(self) -> list[GlidingAppAircraft]:
-        aircraft_by_registration = self.aircraft_service.get_aircraft_by_registration()
+        aircraft_by_registration = self.get_aircraft_by_registration()
 
         # Deduplicate defensively.
         by_key: dict[str, GlidingAppAircraft] = {}
@@ -369,7 +982,7 @@ class FlightUpdaterService:
             key = (
                 str(aircraft.id)
                 if aircraft.id is not None
-                else self._normalise_aircraft_id(
+                else normalise_aircraft_id(
                     aircraft.registration or aircraft.callsign
                 )
             )
@@ -377,15 +990,11 @@ class FlightUpdaterService:
 
         self.ga_aircraft = sorted(
             by_key.values(),
-            key=lambda a: (
-                self._normalise_aircraft_id(a.registration),
-                self._normalise_aircraft_id(a.callsign),
-            ),
+            key=lambda a: glidingapp_identity(a).ids,
         )
 
         return self.ga_aircraft
 
-
     def compare_aircraft(self) -> list[str]:
         ga_aircraft = self.load_glidingapp_aircraft()
 
@@ -399,7 +1008,11 @@ class FlightUpdaterService:
 
         missing_in_aerolog: list[GlidingAppAircraft] = []
         missing_in_glidingapp: list[AerologAircraft] = []
-        differences: list[tuple[GlidingAppAircraft, AerologAircraft, list[str]]] = []
+        differences: list[
+            tuple[GlidingAppAircraft, AerologAircraft, dict[str, Any] | None, list[str]]
+        ] = []
+
+        differing: list[tuple[GlidingAppAircraft, AerologAircraft, list[str]]] = []
 
         for ga in ga_aircraft:
             al = self._find_matching_aerolog_aircraft(ga, al_index)
@@ -410,8 +1023,14 @@ class FlightUpdaterService:
 
             diffs = self._aircraft_differences(ga, al)
             if diffs:
-                ogn = self._find_ogn_record_for_ga(ga)
-                differences.append((ga, al, ogn, diffs))
+                differing.append((ga, al, diffs))
+
+        ogn_records = self.find_ogn_records_for_ga(
+            [ga for ga, _al, _diffs in differing]
+        )
+
+        for (ga, al, diffs), ogn in zip(differing, ogn_records):
+            differences.append((ga, al, ogn, diffs))
 
         for al in aerolog_aircraft:
             if self._find_matching_glidingapp_aircraft(al, ga_index) is None:
@@ -425,7 +1044,6 @@ class FlightUpdaterService:
             differences=differences,
         )
 
-
     def _index_glidingapp_aircraft(
         self,
         aircraft: list[GlidingAppAircraft],
@@ -433,12 +1051,11 @@ class FlightUpdaterService:
         index: dict[str, GlidingAppAircraft] = {}
 
         for item in aircraft:
-            for key in self._glidingapp_aircraft_keys(item):
+            for key in glidingapp_identity(item).keys:
                 index.setdefault(key, item)
 
         return index
 
-
     def _index_aerolog_aircraft(
         self,
         aircraft: list[AerologAircraft],
@@ -446,84 +1063,46 @@ class FlightUpdaterService:
         index: dict[str, AerologAircraft] = {}
 
         for item in aircraft:
-            for key in self._aerolog_aircraft_keys(item):
+            for key in aerolog_identity(item).keys:
                 index.setdefault(key, item)
 
         return index
 
-
     def _find_matching_aerolog_aircraft(
         self,
         ga: GlidingAppAircraft,
         al_index: dict[str, AerologAircraft],
     ) -> AerologAircraft | None:
-        for key in self._glidingapp_aircraft_keys(ga):
+        for key in glidingapp_identity(ga).keys:
             match = al_index.get(key)
             if match is not None:
                 return match
 
         return None
 
-
     def _find_matching_glidingapp_aircraft(
         self,
         al: AerologAircraft,
         ga_index: dict[str, GlidingAppAircraft],
     ) -> GlidingAppAircraft | None:
-        for key in self._aerolog_aircraft_keys(al):
+        for key in aerolog_identity(al).keys:
             match = ga_index.get(key)
             if match is not None:
                 return match
 
         return None
 
-
-    def _glidingapp_aircraft_keys(
-        self,
-        aircraft: GlidingAppAircraft,
-    ) -> set[str]:
-        keys = {
-            self._normalise_aircraft_id(aircraft.registration),
-            self._normalise_aircraft_id(aircraft.callsign),
-        }
-
-        return {key for key in keys if key}
-
-
-    def _aerolog_aircraft_keys(
-        self,
-        aircraft: AerologAircraft,
-    ) -> set[str]:
-        keys = {
-            self._normalise_aircraft_id(aircraft.registration),
-            self._normalise_aircraft_id(aircraft.short_registration),
-            self._normalise_aircraft_id(aircraft.competition_registration),
-        }
-
-        return {key for key in keys if key}
-    
-    @staticmethod
-    def _values_differ(left: object, right: object) -> bool:
-        left_text = FlightUpdaterService._normalise_aircraft_id(str(left or ""))
-        right_text = FlightUpdaterService._normalise_aircraft_id(str(right or ""))
-
-        if not left_text and not right_text:
-            return False
-
-        return left_text != right_text
-
-
     def _aircraft_differences(
         self,
         ga: GlidingAppAircraft,
         al: AerologAircraft,
     ) -> list[str]:
-        reg_diff = self._values_differ(
+        reg_diff = values_differ(
             ga.registration,
             al.registration,
         )
 
-        cn_diff = self._values_differ(
+        cn_diff = values_differ(
             ga.callsign,
             al.competition_registration,
         )
@@ -539,18 +1118,6 @@ class FlightUpdaterService:
 
         return []
 
-
-    @staticmethod
-    def _values_differ(left: object, right: object) -> bool:
-        left_text = FlightUpdaterService._normalise_aircraft_id(left)
-        right_text = FlightUpdaterService._normalise_aircraft_id(right)
-
-        if not left_text and not right_text:
-            return False
-
-        return left_text != right_text
-
-
     def _format_aircraft_comparison(
         self,
         ga_aircraft: list[GlidingAppAircraft],
@@ -648,7 +1215,7 @@ class FlightUpdaterService:
             lines.append("")
 
         return lines
-    
+
     @staticmethod
     def _fixed_width(value: object, width: int) -> str:
         text = str(value or "").strip()
@@ -657,24 +1224,11 @@ class FlightUpdaterService:
             text = text[:width]
 
         return f"{text:<{width}}"
-    
-    @staticmethod
-    def _normalise_aircraft_id(value: str | None) -> str:
-        return (
-            str(value or "")
-            .strip()
-            .upper()
-            .replace("-", "")
-            .replace(" ", "")
-        )
-    
+
     def list_glidingapp_aircraft_report(self) -> list[str]:
         aircraft = sorted(
             self.load_glidingapp_aircraft(),
-            key=lambda a: (
-                self._normalise_aircraft_id(a.registration),
-                self._normalise_aircraft_id(a.callsign),
-            ),
+            key=lambda a: glidingapp_identity(a).ids,
         )
 
         lines: list[str] = []
@@ -705,7 +1259,6 @@ class FlightUpdaterService:
 
         return lines
 
-
     def list_aerolog_aircraft_report(self) -> list[str]:
         if not self.al_aircraft:
             aircraft = self.load_aerolog_aircraft_cache()
@@ -714,10 +1267,8 @@ class FlightUpdaterService:
 
         aircraft = sorted(
             aircraft,
-            key=lambda a: (
-                self._normalise_aircraft_id(a.registration),
-                self._normalise_aircraft_id(a.competition_registration),
-            ),
+            # Registration, then competition number, as before; ties keep list order.
+            key=lambda a: aerolog_identity(a).ids[:2],
         )
 
         lines: list[str] = []
@@ -778,8 +1329,9 @@ class FlightUpdaterService:
 
         al_index = self._index_aerolog_aircraft(aerolog_aircraft)
 
-        aircraft_by_registration = self.aircraft_service.get_aircraft_by_registration()
-        aircraft_by_callsign = self.aircraft_service.get_aircraft_by_callsign()
+        aircraft_by_registration = self.get_aircraft_by_registration()
+        aircraft_by_callsign = self.get_aircraft_by_callsign()
+        aircraft_index = self.get_aircraft_index()
 
         rows: list[tuple[GlidingAppAircraft, AerologAircraft | None, str]] = []
         seen: set[str] = set()
@@ -789,12 +1341,11 @@ class FlightUpdaterService:
                 flight,
                 aircraft_by_registration,
                 aircraft_by_callsign,
+                aircraft_index,
             )
 
-            aircraft_key = (
-                self._normalise_aircraft_id(ga_aircraft.registration)
-                or self._normalise_aircraft_id(ga_aircraft.callsign)
-            )
+            identity = glidingapp_identity(ga_aircraft)
+            aircraft_key = identity.ids[0] or identity.ids[1]
 
             if not aircraft_key or aircraft_key in seen:
                 continue
@@ -820,12 +1371,12 @@ class FlightUpdaterService:
 
         return self._format_aerolog_upload_aircraft_errors(rows)
 
-
     def _find_glidingapp_aircraft_for_flight(
         self,
         flight: FlightDisplayRow,
         aircraft_by_registration: dict,
         aircraft_by_callsign: dict,
+        aircraft_index: AircraftIndex,
     ) -> GlidingAppAircraft:
         reg_key = (flight.registration or "").strip().upper()
         cs_key = (flight.callsign or "").strip().upper()
@@ -839,18 +1390,10 @@ class FlightUpdaterService:
             return aircraft
 
         # Fallback if the service dictionaries use a different normalisation.
-        flight_reg = self._normalise_aircraft_id(flight.registration)
-        flight_cs = self._normalise_aircraft_id(flight.callsign)
+        aircraft = aircraft_index.find(flight.registration, flight.callsign)
 
-        for candidate in aircraft_by_registration.values():
-            candidate_reg = self._normalise_aircraft_id(candidate.registration)
-            candidate_cs = self._normalise_aircraft_id(candidate.callsign)
-
-            if candidate_reg in {flight_reg, flight_cs}:
-                return candidate
-
-            if candidate_cs in {flight_reg, flight_cs}:
-                return candidate
+        if aircraft is not None:
+            return aircraft
 
         # Last-resort stub, so the report can still show something useful.
         return GlidingAppAircraft(
@@ -860,18 +1403,17 @@ class FlightUpdaterService:
             flarm_id="",
         )
 
-
     def _aircraft_difference_code(
         self,
         ga: GlidingAppAircraft,
         al: AerologAircraft,
     ) -> str:
-        reg_diff = self._values_differ(
+        reg_diff = values_differ(
             ga.registration,
             al.registration,
         )
 
-        cn_diff = self._values_differ(
+        cn_diff = values_differ(
             ga.callsign,
             al.competition_registration,
         )
@@ -887,18 +1429,6 @@ class FlightUpdaterService:
 
         return ""
 
-
-    @staticmethod
-    def _values_differ(left: object, right: object) -> bool:
-        left_text = FlightUpdaterService._normalise_aircraft_id(left)
-        right_text = FlightUpdaterService._normalise_aircraft_id(right)
-
-        if not left_text and not right_text:
-            return False
-
-        return left_text != right_text
-
-
     def _format_aerolog_upload_aircraft_errors(
         self,
         rows: list[tuple[GlidingAppAircraft, AerologAircraft | None, str]],
@@ -908,10 +1438,7 @@ class FlightUpdaterService:
 
         rows = sorted(
             rows,
-            key=lambda row: (
-                self._normalise_aircraft_id(row[0].registration),
-                self._normalise_aircraft_id(row[0].callsign),
-            ),
+            key=lambda row: glidingapp_identity(row[0]).ids,
         )
 
         lines: list[str] = []
@@ -940,4 +1467,4 @@ class FlightUpdaterService:
                 f"{self._fixed_width(difference, 12)}"
             )
 
-        return lines
\ No newline at end of file
+        return lines
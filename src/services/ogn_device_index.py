@@ -0,0 +1,201 @@
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Any, Callable
+
+
+MAGIC = b"OGNIDX02"
+
+# magic, source mtime_ns, source size, source record count, device count,
+# string count
+HEADER = struct.Struct("<8sqqIII")
+
+FIELDS = ("device_id", "registration", "cn", "aircraft_model")
+
+
+class OgnDeviceIndex:
+    """
+    Compact, pre-indexed copy of the fields we use from the OGN device database.
+
+    The file holds a table of unique UTF-8 strings and one row of four string
+    numbers per device, sorted by normalised device ID. Lookups binary-search
+    the rows and decode only the strings of the record that is returned.
+
+    The file records the size and mtime of the source DDB it was built from
+    and is rebuilt when that changes.
+
+    len() is the number of unique device IDs; source_record_count is the
+    number of records in the DDB the index was built from.
+    """
+
+    def __init__(
+        self,
+        data: bytes,
+        source_record_count: int,
+        device_count: int,
+        string_count: int,
+    ):
+        offsets_start = HEADER.size
+        offsets_end = offsets_start + (string_count + 1) * 4
+        rows_end = offsets_end + device_count * len(FIELDS) * 4
+
+        self._offsets = array("I")
+        self._offsets.frombytes(data[offsets_start:offsets_end])
+
+        self._rows = array("I")
+        self._rows.frombytes(data[offsets_end:rows_end])
+
+        self._blob = memoryview(data)[rows_end:]
+        self._strings: dict[int, str] = {}
+        self._device_count = device_count
+        self.source_record_count = source_record_count
+
+    def __len__(self) -> int:
+        return self._device_count
+
+    @classmethod
+    def open_if_fresh(
+        cls,
+        index_path: str | Path,
+        source_path: str | Path,
+    ) -> "OgnDeviceIndex | None":
+        index_path = Path(index_path)
+        source_path = Path(source_path)
+
+        try:
+            source_stat = source_path.stat()
+            data = index_path.read_bytes()
+        except OSError:
+            return None
+
+        if len(data) < HEADER.size:
+            return None
+
+        (
+            magic,
+            mtime_ns,
+            size,
+            source_record_count,
+            device_count,
+            string_count,
+        ) = HEADER.unpack_from(data)
+
+        if (
+            magic != MAGIC
+            or mtime_ns != source_stat.st_mtime_ns
+            or size != source_stat.st_size
+        ):
+            return None
+
+        return cls(data, source_record_count, device_count, string_count)
+
+    @classmethod
+    def build(
+        cls,
+        records: list[dict[str, Any]],
+        index_path: str | Path,
+        source_path: str | Path,
+        normalise_device_id: Callable[[object], str],
+    ) -> "OgnDeviceIndex":
+        index_path = Path(index_path)
+
+        strings: dict[bytes, int] = {b"": 0}
+        rows: dict[bytes, tuple[int, int, int, int]] = {}
+
+        def intern(value: object) -> int:
+            encoded = str(value or "").strip().encode("utf-8")
+            return strings.setdefault(encoded, len(strings))
+
+        for record in records:
+            device_id = normalise_device_id(record.get("device_id")).encode("utf-8")
+
+            # First record wins for duplicate device IDs.
+            if not device_id or device_id in rows:
+                continue
+
+            rows[device_id] = (
+                intern(device_id.decode("utf-8")),
+                intern(record.get("registration")),
+                intern(record.get("cn")),
+                intern(record.get("aircraft_model")),
+            )
+
+        offsets = array("I", [0])
+        blob = bytearray()
+
+        for encoded in strings:
+            blob.extend(encoded)
+            offsets.append(len(blob))
+
+        row_values = array("I")
+
+        for device_id in sorted(rows):
+            row_values.extend(rows[device_id])
+
+        try:
+            source_stat = Path(source_path).stat()
+            mtime_ns, size = source_stat.st_mtime_ns, source_stat.st_size
+        except OSError:
+            # Never fresh, so the next start rebuilds it.
+            mtime_ns, size = -1, -1
+
+        data = b"".join([
+            HEADER.pack(MAGIC, mtime_ns, size, len(records), len(rows), len(strings)),
+            offsets.tobytes(),
+            row_values.tobytes(),
+            bytes(blob),
+        ])
+
+        tmp_path = index_path.with_name(index_path.name + ".tmp")
+
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, index_path)
+        except OSError:
+            # Unwritable cache directory: use the index in memory for this
+            # run and try to write it again on the next start.
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+        return cls(data, len(records), len(rows), len(strings))
+
+    def find(self, device_id: str) -> dict[str, str] | None:
+        """Return the record for an already-normalised device ID."""
+        key = device_id.encode("utf-8")
+        width = len(FIELDS)
+
+        low = 0
+        high = self._device_count
+
+        while low < high:
+            middle = (low + high) // 2
+            candidate = self._string_bytes(self._rows[middle * width])
+
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                row = self._rows[middle * width:(middle + 1) * width]
+                return {
+                    name: self._string(number)
+                    for name, number in zip(FIELDS, row)
+                }
+
+        return None
+
+    def _string_bytes(self, number: int) -> bytes:
+        return bytes(self._blob[self._offsets[number]:self._offsets[number + 1]])
+
+    def _string(self, number: int) -> str:
+        text = self._strings.get(number)
+
+        if text is None:
+            text = self._string_bytes(number).decode("utf-8")
+            self._strings[number] = text
+
+        return text
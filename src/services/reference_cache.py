@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+
+T = TypeVar("T")
+
+DEFAULT_REFERENCE_TTL_SECONDS = 900
+
+
+class ReferenceCache:
+    """
+    Thread-safe in-memory TTL cache for slow-changing reference data.
+
+    Each key is loaded at most once per TTL, even when several fetch
+    threads ask for it at the same time.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_REFERENCE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, load: Callable[[], T]) -> T:
+        entry = self._fresh_entry(key)
+
+        if entry is not None:
+            return entry[1]
+
+        with self._lock_for(key):
+            # Another thread may have loaded it while we waited.
+            entry = self._fresh_entry(key)
+
+            if entry is not None:
+                return entry[1]
+
+            value = load()
+
+            with self._lock:
+                self._entries[key] = (time.monotonic(), value)
+
+            return value
+
+    def invalidate(self, key: str | None = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def _fresh_entry(self, key: str) -> tuple[float, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        if time.monotonic() - entry[0] > self.ttl_seconds:
+            return None
+
+        return entry
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
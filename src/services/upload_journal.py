@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+if TYPE_CHECKING:
+    # Annotations only, so this module imports without glidinglib.
+    from glidinglib.models.combination_flight_model import CombinationFlight
+
+
+DEFAULT_JOURNAL_PATH = Path.home() / ".flightupdater" / "upload_journal.sqlite3"
+
+
+class UploadJournal:
+    """
+    Record of the GA flights that have reached Aerolog.
+
+    Each flight is stored by sync_key with a hash of the Aerolog payload that
+    was sent for it, so a later upload can tell new, changed and unchanged
+    flights apart. payloads builds that payload, one entry per flight, for a
+    list of flights; only what would be posted affects the hash.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        payloads: Callable[[list[CombinationFlight]], list[Any]],
+    ):
+        self.path = Path(path)
+        self.payloads = payloads
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sent (
+                    sync_key INTEGER PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    flight_date TEXT,
+                    sent_at REAL NOT NULL
+                )
+                """
+            )
+
+    @classmethod
+    def from_config(
+        cls,
+        config: dict,
+        payloads: Callable[[list[CombinationFlight]], list[Any]],
+    ) -> "UploadJournal":
+        return cls(
+            config.get("upload", {}).get("journal_path") or DEFAULT_JOURNAL_PATH,
+            payloads,
+        )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=10)
+
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def content_hash(payload: Any) -> str:
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def content_hashes(self, flights: list[CombinationFlight]) -> list[str]:
+        if not flights:
+            return []
+
+        return [self.content_hash(payload) for payload in self.payloads(flights)]
+
+    def classify(
+        self,
+        flights: list[CombinationFlight],
+    ) -> dict[str, list[CombinationFlight]]:
+        """Split flights into "new", "changed" and "unchanged" against the journal."""
+        sync_keys = [f.sync_key for f in flights if f.sync_key is not None]
+        sent: dict[int, str] = {}
+
+        with self._connect() as conn:
+            # Chunked to stay under SQLite's bound-parameter limit.
+            for start in range(0, len(sync_keys), 500):
+                batch = sync_keys[start:start + 500]
+                sent.update(conn.execute(
+                    f"SELECT sync_key, content_hash FROM sent "
+                    f"WHERE sync_key IN ({','.join('?' * len(batch))})",
+                    batch,
+                ).fetchall())
+
+        plan: dict[str, list[CombinationFlight]] = {
+            "new": [],
+            "changed": [],
+            "unchanged": [],
+        }
+
+        # Only flights sent before need their payload built and hashed.
+        seen = [f for f in flights if f.sync_key in sent]
+        hashes = dict(zip(map(id, seen), self.content_hashes(seen)))
+
+        for flight in flights:
+            previous = sent.get(flight.sync_key)
+
+            if previous is None:
+                plan["new"].append(flight)
+            elif previous != hashes[id(flight)]:
+                plan["changed"].append(flight)
+            else:
+                plan["unchanged"].append(flight)
+
+        return plan
+
+    def record(self, flights: list[CombinationFlight]) -> None:
+        flights = [f for f in flights if f.sync_key is not None]
+        now = time.time()
+
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO sent "
+                "(sync_key, content_hash, flight_date, sent_at) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        f.sync_key,
+                        content_hash,
+                        f.flight_date.isoformat() if f.flight_date else None,
+                        now,
+                    )
+                    for f, content_hash in zip(flights, self.content_hashes(flights))
+                ],
+            )
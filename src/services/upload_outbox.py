@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import pickle
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    # Annotations only, so this module imports without glidinglib.
+    from glidinglib.models.combination_flight_model import CombinationFlight
+
+
+DEFAULT_OUTBOX_PATH = Path.home() / ".flightupdater" / "upload_outbox.sqlite3"
+
+# A claim older than this is treated as abandoned (the sender crashed or was
+# killed), so the chunk becomes due again. It is well above the time the
+# pipeline's retries take for one chunk.
+CLAIM_TIMEOUT_SECONDS = 3600
+
+
+@dataclass
+class OutboxChunk:
+    chunk_id: int
+    flights: list[CombinationFlight]
+    attempts: int
+    last_error: str | None
+
+
+class UploadOutbox:
+    """
+    Chunks of CombinationFlight records waiting to be sent to Aerolog.
+
+    A chunk is written before its first send and only removed once Aerolog
+    has taken it, so anything not yet sent survives a crash or restart.
+
+    A sender must claim a chunk before sending it. The claim is a single
+    conditional UPDATE, so an upload and the background drain (or two
+    processes) can never both send the same chunk.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS chunks (
+                    chunk_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    created_at REAL NOT NULL,
+                    next_attempt_at REAL NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    claimed_at REAL,
+                    payload BLOB NOT NULL
+                )
+                """
+            )
+
+    @classmethod
+    def from_config(cls, config: dict) -> "UploadOutbox":
+        return cls(config.get("upload", {}).get("outbox_path") or DEFAULT_OUTBOX_PATH)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Short-lived connections, as in FlightCache, so the upload threads
+        # and the background drain can share the outbox.
+        conn = sqlite3.connect(self.path, timeout=10)
+
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def add(
+        self,
+        flights: list[CombinationFlight],
+        claimed: bool = False,
+    ) -> int:
+        """
+        Queue a chunk and return its ID.
+
+        With claimed=True the chunk is inserted already claimed by the caller,
+        so it is never due for anyone else until it is released.
+        """
+        now = time.time()
+
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO chunks (created_at, next_attempt_at, claimed_at, payload) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    now,
+                    now,
+                    now if claimed else None,
+                    pickle.dumps(flights, protocol=pickle.HIGHEST_PROTOCOL),
+                ),
+            )
+
+        return cursor.lastrowid
+
+    def due(self, now: float | None = None) -> list[OutboxChunk]:
+        """
+        Unclaimed chunks whose next attempt is due, oldest first.
+
+        The list can be stale by the time it is used; claim each chunk
+        before sending it.
+        """
+        now = time.time() if now is None else now
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT chunk_id, attempts, last_error, payload FROM chunks "
+                "WHERE next_attempt_at <= ? "
+                "AND (claimed_at IS NULL OR claimed_at < ?) "
+                "ORDER BY chunk_id",
+                (now, now - CLAIM_TIMEOUT_SECONDS),
+            ).fetchall()
+
+        chunks: list[OutboxChunk] = []
+
+        for chunk_id, attempts, last_error, payload in rows:
+            try:
+                flights = pickle.loads(payload)
+            except (pickle.UnpicklingError, AttributeError, EOFError):
+                # Left in place for inspection; it cannot be sent as it is.
+                continue
+
+            chunks.append(OutboxChunk(chunk_id, flights, attempts, last_error))
+
+        return chunks
+
+    def claim(self, chunk_id: int) -> bool:
+        """
+        Claim a chunk for sending.
+
+        False if someone else holds the claim or the chunk has already been
+        sent and removed.
+        """
+        now = time.time()
+
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE chunks SET claimed_at = ? WHERE chunk_id = ? "
+                "AND (claimed_at IS NULL OR claimed_at < ?)",
+                (now, chunk_id, now - CLAIM_TIMEOUT_SECONDS),
+            )
+
+        return cursor.rowcount == 1
+
+    def release(self, chunk_id: int) -> None:
+        """Give up a claim, leaving the chunk for a later retry."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE chunks SET claimed_at = NULL WHERE chunk_id = ?",
+                (chunk_id,),
+            )
+
+    def record_failure(
+        self,
+        chunk_id: int,
+        error: str,
+        next_attempt_at: float,
+    ) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE chunks SET attempts = attempts + 1, last_error = ?, "
+                "next_attempt_at = ? WHERE chunk_id = ?",
+                (error, next_attempt_at, chunk_id),
+            )
+
+    def remove(self, chunk_id: int) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM chunks WHERE chunk_id = ?", (chunk_id,))
+
+    def sync_keys(self) -> set[int]:
+        """sync_keys of every flight still waiting in the outbox."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT payload FROM chunks").fetchall()
+
+        keys: set[int] = set()
+
+        for (payload,) in rows:
+            try:
+                flights = pickle.loads(payload)
+            except (pickle.UnpicklingError, AttributeError, EOFError):
+                continue
+
+            keys.update(f.sync_key for f in flights if f.sync_key is not None)
+
+        return keys
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
@@ -1,9 +1,113 @@
-from datetime import datetime
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Iterator
 
 from model.flight_display_row import FlightDisplayRow
 
 
 LogLine = tuple[str, str | None]
+Section = tuple[str, list[FlightDisplayRow]]
+
+# Section models are kept for the most recent flight lists (GA, Ktrax,
+# Aerolog and a few error subsets), so each fetch is partitioned once.
+SECTION_CACHE_SIZE = 16
+
+AWAY_CLUB_TITLE = "Flights departing away from GRL - club aircraft"
+AWAY_NON_CLUB_TITLE = "Flights departing away from GRL - non-club aircraft"
+
+
+def _time_key(flight: FlightDisplayRow) -> tuple[bool, int]:
+    return (flight.takeoff_seconds is None, flight.takeoff_seconds or 0)
+
+
+@dataclass(slots=True)
+class FlightSections:
+    """
+    Flights sorted by takeoff time and partitioned into display groups.
+
+    Every group is a list of positions into flights, already in takeoff
+    order, so sections can be produced without sorting or scanning again.
+    Built in a single pass by FlightSections.build.
+    """
+
+    flights: list[FlightDisplayRow]
+    normal: list[int] = field(default_factory=list)
+    by_launch: dict[str, list[int]] = field(default_factory=dict)
+    by_tug: dict[str, list[int]] = field(default_factory=dict)
+    no_tug: list[int] = field(default_factory=list)
+    away_club: list[int] = field(default_factory=list)
+    away_non_club: list[int] = field(default_factory=list)
+    with_notes: list[int] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, flights_unsorted: list[FlightDisplayRow]) -> "FlightSections":
+        model = cls(sorted(flights_unsorted, key=_time_key))
+        model.by_launch = {group: [] for group in FlightTableFormatter.GROUPS}
+        known_launches = FlightTableFormatter.GROUPS[:-1]
+
+        for position, flight in enumerate(model.flights):
+            if flight.notes:
+                model.with_notes.append(position)
+
+            if flight.source == "GA" and flight.airfield_takeoff_key != "GRL":
+                if flight.is_club_aircraft:
+                    model.away_club.append(position)
+                else:
+                    model.away_non_club.append(position)
+                continue
+
+            model.normal.append(position)
+
+            launch = flight.launch_key
+            model.by_launch[launch if launch in known_launches else "other"].append(position)
+
+            if launch == "aerotow":
+                if flight.tow_callsign:
+                    model.by_tug.setdefault(flight.tow_callsign, []).append(position)
+                else:
+                    model.no_tug.append(position)
+
+        return model
+
+    def rows(self, positions: list[int]) -> list[FlightDisplayRow]:
+        flights = self.flights
+        return [flights[position] for position in positions]
+
+    def sections(
+        self,
+        title: str,
+        group_by_launch_type: bool = False,
+        include_non_grl_sections: bool = True,
+        include_non_grl_non_club: bool = False,
+    ) -> Iterator[Section]:
+        """Yield the non-empty (title, flights) sections in display order."""
+        if group_by_launch_type:
+            yield from self._launch_sections()
+        elif self.normal:
+            yield title, self.rows(self.normal)
+
+        if include_non_grl_sections:
+            if self.away_club:
+                yield AWAY_CLUB_TITLE, self.rows(self.away_club)
+
+            if include_non_grl_non_club and self.away_non_club:
+                yield AWAY_NON_CLUB_TITLE, self.rows(self.away_non_club)
+
+    def _launch_sections(self) -> Iterator[Section]:
+        # Aerotows are split by tug only when more than one tug flew.
+        if len(self.by_tug) > 1:
+            for tow_callsign in sorted(self.by_tug):
+                yield f"AEROTOW Flights - {tow_callsign}", self.rows(self.by_tug[tow_callsign])
+
+            if self.no_tug:
+                yield "AEROTOW Flights - no tug recorded", self.rows(self.no_tug)
+        elif self.by_launch["aerotow"]:
+            yield "AEROTOW Flights", self.rows(self.by_launch["aerotow"])
+
+        for group in FlightTableFormatter.GROUPS[1:]:
+            if self.by_launch[group]:
+                yield f"{group.upper()} Flights", self.rows(self.by_launch[group])
 
 
 class FlightTableFormatter:
@@ -19,6 +123,9 @@ class FlightTableFormatter:
         self.grl_only = grl_only
         self.group_by_launch_type = group_by_launch_type
 
+        self._section_cache: OrderedDict[int, tuple[list[FlightDisplayRow], FlightSections]] = OrderedDict()
+        self._section_lock = threading.Lock()
+
     def filter_aerolog_upload_flights(
         self,
         flights: list[FlightDisplayRow],
@@ -39,8 +146,8 @@ class FlightTableFormatter:
             if flight.source != "GA":
                 continue
 
-            departed_from_grl = (flight.airfield_takeoff or "").upper() == "GRL"
-            is_club_aircraft = getattr(flight, "is_club_aircraft", False)
+            departed_from_grl = flight.airfield_takeoff_key == "GRL"
+            is_club_aircraft = flight.is_club_aircraft
 
             if departed_from_grl:
                 upload_flights.append(flight)
@@ -51,6 +158,29 @@ class FlightTableFormatter:
 
         return upload_flights
 
+    @staticmethod
+    def count_types_of_flight(
+        flights: list[FlightDisplayRow],
+    ) -> tuple[int, int, int, int, int, int]:
+        aerotow = winch = self_launch = tmg = other = 0
+
+        for flight in flights:
+            launch = flight.launch_key
+
+            if launch == "aerotow":
+                aerotow += 1
+            elif launch == "winch":
+                winch += 1
+            elif launch == "self-launch":
+                self_launch += 1
+            elif launch == "tmg":
+                tmg += 1
+            else:
+                other += 1
+
+        total = aerotow + winch + self_launch + tmg + other
+        return aerotow, winch, self_launch, tmg, other, total
+
     def sort_flights_for_display(
         self,
         flights: list[FlightDisplayRow],
@@ -59,24 +189,48 @@ class FlightTableFormatter:
         if group_by_launch_type is None:
             group_by_launch_type = self.group_by_launch_type
 
-        def time_key(f: FlightDisplayRow):
-            return (f.takeoff_time is None, f.takeoff_time or datetime.min.time())
+        return sorted(flights, key=_time_key)
+
+    def section_model(
+        self,
+        flights_unsorted: list[FlightDisplayRow],
+    ) -> FlightSections:
+        """
+        Return the section model for a flight list, building it on first use.
+
+        Models are cached by list identity. Fetches and overlays always
+        produce new lists, so a cached model is never stale.
+        """
+        key = id(flights_unsorted)
 
-        if not group_by_launch_type:
-            return sorted(flights, key=time_key)
+        with self._section_lock:
+            cached = self._section_cache.get(key)
 
-        return sorted(flights, key=time_key)
+            if cached is not None and cached[0] is flights_unsorted:
+                self._section_cache.move_to_end(key)
+                return cached[1]
 
-    def build_sections(
+        model = FlightSections.build(flights_unsorted)
+
+        with self._section_lock:
+            # Holding the list keeps its id from being reused while cached.
+            self._section_cache[key] = (flights_unsorted, model)
+
+            while len(self._section_cache) > SECTION_CACHE_SIZE:
+                self._section_cache.popitem(last=False)
+
+        return model
+
+    def iter_sections(
         self,
         flights_unsorted: list[FlightDisplayRow],
         title: str,
         group_by_launch_type: bool | None = None,
         include_non_grl_sections: bool = True,
         include_non_grl_non_club: bool = False,
-    ) -> list[tuple[str, list[FlightDisplayRow]]]:
+    ) -> Iterator[Section]:
         """
-        Build display/PDF sections.
+        Yield display/PDF sections.
 
         Display and print always include all normal flights.
 
@@ -90,142 +244,30 @@ class FlightTableFormatter:
         if group_by_launch_type is None:
             group_by_launch_type = self.group_by_launch_type
 
-        flights = self.sort_flights_for_display(
-            flights_unsorted,
+        return self.section_model(flights_unsorted).sections(
+            title,
             group_by_launch_type=group_by_launch_type,
+            include_non_grl_sections=include_non_grl_sections,
+            include_non_grl_non_club=include_non_grl_non_club,
         )
 
-        away_from_grl_club = [
-            f for f in flights
-            if f.source == "GA"
-            and (f.airfield_takeoff or "").upper() != "GRL"
-            and getattr(f, "is_club_aircraft", False)
-        ]
-
-        away_from_grl_non_club = [
-            f for f in flights
-            if f.source == "GA"
-            and (f.airfield_takeoff or "").upper() != "GRL"
-            and not getattr(f, "is_club_aircraft", False)
-        ]
-
-        normal_flights = [
-            f for f in flights
-            if not (
-                f.source == "GA"
-                and (f.airfield_takeoff or "").upper() != "GRL"
-            )
-        ]
-
-        sections: list[tuple[str, list[FlightDisplayRow]]] = []
-
-        if group_by_launch_type:
-            sections.extend(
-                self._build_launch_sections(normal_flights)
-            )
-        else:
-            if normal_flights:
-                sections.append((title, normal_flights))
-
-        if include_non_grl_sections:
-            if away_from_grl_club:
-                sections.append((
-                    "Flights departing away from GRL - club aircraft",
-                    self.sort_flights_for_display(
-                        away_from_grl_club,
-                        group_by_launch_type=False,
-                    ),
-                ))
-
-            if include_non_grl_non_club and away_from_grl_non_club:
-                sections.append((
-                    "Flights departing away from GRL - non-club aircraft",
-                    self.sort_flights_for_display(
-                        away_from_grl_non_club,
-                        group_by_launch_type=False,
-                    ),
-                ))
-
-        return sections
-
-
-    def _build_launch_sections(
+    def build_sections(
         self,
-        flights: list[FlightDisplayRow],
-    ) -> list[tuple[str, list[FlightDisplayRow]]]:
-        sections: list[tuple[str, list[FlightDisplayRow]]] = []
-
-        aerotow_flights = [
-            f for f in flights
-            if (f.launch_method or "").lower() == "aerotow"
-        ]
-
-        tow_callsigns = sorted({
-            f.tow_callsign
-            for f in aerotow_flights
-            if f.tow_callsign
-        })
-
-        if len(tow_callsigns) > 1:
-            for tow_callsign in tow_callsigns:
-                subset = [
-                    f for f in aerotow_flights
-                    if f.tow_callsign == tow_callsign
-                ]
-
-                if subset:
-                    sections.append((
-                        f"AEROTOW Flights - {tow_callsign}",
-                        self.sort_flights_for_display(
-                            subset,
-                            group_by_launch_type=False,
-                        ),
-                    ))
-
-            no_tow = [
-                f for f in aerotow_flights
-                if not f.tow_callsign
-            ]
-
-            if no_tow:
-                sections.append((
-                    "AEROTOW Flights - no tug recorded",
-                    self.sort_flights_for_display(
-                        no_tow,
-                        group_by_launch_type=False,
-                    ),
-                ))
-        elif aerotow_flights:
-            sections.append((
-                "AEROTOW Flights",
-                self.sort_flights_for_display(
-                    aerotow_flights,
-                    group_by_launch_type=False,
-                ),
-            ))
-
-        for group in ["winch", "self-launch", "tmg", "other"]:
-            if group == "other":
-                subset = [
-                    f for f in flights
-                    if (f.launch_method or "").lower() not in self.GROUPS[:-1]
-                ]
-            else:
-                subset = [
-                    f for f in flights
-                    if (f.launch_method or "").lower() == group
-                ]
-
-            if subset:
-                sections.append((
-                    f"{group.upper()} Flights",
-                    self.sort_flights_for_display(
-                        subset,
-                        group_by_launch_type=False,
-                    ),
-                ))
-
-        return sections
+        flights_unsorted: list[FlightDisplayRow],
+        title: str,
+        group_by_launch_type: bool | None = None,
+        include_non_grl_sections: bool = True,
+        include_non_grl_non_club: bool = False,
+    ) -> list[Section]:
+        return list(
+            self.iter_sections(
+                flights_unsorted,
+                title,
+                group_by_launch_type=group_by_launch_type,
+                include_non_grl_sections=include_non_grl_sections,
+                include_non_grl_non_club=include_non_grl_non_club,
+            )
+        )
 
     def format_flights(
         self,
@@ -235,65 +277,52 @@ class FlightTableFormatter:
         group_by_launch_type: bool | None = None,
         include_non_grl_sections: bool = True,
         include_non_grl_non_club: bool = False,
-    ) -> list[LogLine]:
-        sections = self.build_sections(
+    ) -> Iterator[LogLine]:
+        """
+        Yield the log lines for each section as (text, tag) pairs.
+
+        This is a generator, so lines are formatted as the caller consumes
+        them. Wrap it in list() to index, measure or reuse the result.
+        """
+        header = self.header()
+
+        for section_title, section_flights in self.iter_sections(
             flights_unsorted,
             title,
             group_by_launch_type=group_by_launch_type,
             include_non_grl_sections=include_non_grl_sections,
             include_non_grl_non_club=include_non_grl_non_club,
-        )
-
-        lines: list[LogLine] = []
-        header = self.header()
-
-        for section_title, section_flights in sections:
-            if not section_flights:
-                continue
-
-            lines.append(("", None))
-            lines.append((section_title, None))
-            lines.append((header, None))
-            lines.extend(
-                self._format_rows(
-                    section_flights,
-                    notes_only=notes_only,
-                )
+        ):
+            yield ("", None)
+            yield (section_title, None)
+            yield (header, None)
+            yield from self._format_rows(
+                section_flights,
+                notes_only=notes_only,
             )
 
-        return lines
-
     def format_ga_notes(
         self,
         flights_unsorted: list[FlightDisplayRow],
-    ) -> list[LogLine]:
-        flights = [f for f in flights_unsorted if f.notes]
-
-        if not flights:
-            return []
-
-        flights = sorted(
-            flights,
-            key=lambda f: (
-                f.takeoff_time is None,
-                f.takeoff_time or datetime.min.time(),
-            ),
+    ) -> Iterator[LogLine]:
+        """Yield the notes table as (text, tag) pairs; a generator, like format_flights."""
+        model = self.section_model(flights_unsorted)
+
+        if not model.with_notes:
+            return
+
+        yield ("", None)
+        yield ("GA flights with notes", None)
+        yield (
+            f"{'No':>3} "
+            f"{'Seq':>6} "
+            f"{'Aircraft':16}"
+            f"{'Takeoff':8}"
+            f"{'Notes':80}",
+            None,
         )
 
-        lines: list[LogLine] = [
-            ("", None),
-            ("GA flights with notes", None),
-            (
-                f"{'No':>3} "
-                f"{'Seq':>6} "
-                f"{'Aircraft':16}"
-                f"{'Takeoff':8}"
-                f"{'Notes':80}",
-                None,
-            ),
-        ]
-
-        for idx, flight in enumerate(flights, start=1):
+        for idx, flight in enumerate(model.rows(model.with_notes), start=1):
             tag = "even" if idx % 2 == 0 else "odd"
             seq = flight.sequence_number or ""
             aircraft = self.aircraft_str(flight)
@@ -306,9 +335,7 @@ class FlightTableFormatter:
                 f"{flight.notes or '':80}"
             )
 
-            lines.append((line, tag))
-
-        return lines
+            yield (line, tag)
 
     def header(self) -> str:
         return (
@@ -328,8 +355,7 @@ class FlightTableFormatter:
         self,
         flights: list[FlightDisplayRow],
         notes_only: bool = False,
-    ) -> list[LogLine]:
-        lines: list[LogLine] = []
+    ) -> Iterator[LogLine]:
         idx = 0
 
         for flight in flights:
@@ -341,7 +367,7 @@ class FlightTableFormatter:
             idx += 1
             tag = "even" if idx % 2 == 0 else "odd"
 
-            launch = (flight.launch_method or "").lower()
+            launch = flight.launch_key
             height_str = str(flight.height_ft or "") if launch == "aerotow" else ""
 
             tow_pilot = (
@@ -371,9 +397,7 @@ class FlightTableFormatter:
                 f"{flight.source or '':6}"
             )
 
-            lines.append((line, tag))
-
-        return lines
+            yield (line, tag)
 
     @staticmethod
     def aircraft_str(flight: FlightDisplayRow) -> str:
@@ -406,7 +430,7 @@ class FlightTableFormatter:
 
         nm = (name or "")[:name_width]
         return f"{acct_str} {nm:<{name_width}}"
-    
+
     @staticmethod
     def fixed_width(value: object, width: int) -> str:
         text = str(value or "").strip()
@@ -414,4 +438,4 @@ class FlightTableFormatter:
         if len(text) > width:
             text = text[:width]
 
-        return f"{text:<{width}}"    
\ No newline at end of file
+        return f"{text:<{width}}"
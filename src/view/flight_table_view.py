@@ -0,0 +1,249 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable
+
+from model.flight_display_row import FlightDisplayRow
+from view.flight_table_formatter import FlightTableFormatter
+
+
+# Rows are inserted into the Treeview a chunk at a time, as they scroll
+# into view, so large reports never materialise every row at once.
+ROW_CHUNK_SIZE = 100
+LOAD_MORE_THRESHOLD = 0.9
+
+
+def _time_sort_key(seconds: int | None) -> tuple[bool, int]:
+    return (seconds is None, seconds or 0)
+
+
+def _crew(account: str, name: str) -> str:
+    return FlightTableFormatter.crew_str(account, name, 30).strip()
+
+
+def _tug_pilot(flight: FlightDisplayRow) -> str:
+    return f"{flight.tow_pilot_account or ''} {flight.tow_pilot_name or ''}".strip()
+
+
+def _height(flight: FlightDisplayRow) -> str:
+    return str(flight.height_ft or "") if flight.launch_key == "aerotow" else ""
+
+
+Column = tuple[
+    str,
+    int,
+    str,
+    Callable[[FlightDisplayRow], Any],
+    Callable[[FlightDisplayRow], Any],
+]
+
+# (heading, width, anchor, display value, sort key)
+COLUMNS: list[Column] = [
+    ("Seq", 50, "e",
+     lambda f: f.sequence_number or "",
+     lambda f: f.sequence_number or 0),
+    ("Launch", 80, "w",
+     lambda f: f.launch_method or "",
+     lambda f: f.launch_key),
+    ("Aircraft", 120, "w",
+     FlightTableFormatter.aircraft_str,
+     FlightTableFormatter.aircraft_str),
+    ("Takeoff", 60, "center",
+     FlightDisplayRow.takeoff_str,
+     lambda f: _time_sort_key(f.takeoff_seconds)),
+    ("Landing", 60, "center",
+     FlightDisplayRow.landing_str,
+     lambda f: _time_sort_key(f.landing_seconds)),
+    ("P1", 200, "w",
+     lambda f: _crew(f.pic_account, f.pic_name),
+     lambda f: (f.pic_name or "").lower()),
+    ("P2", 200, "w",
+     lambda f: _crew(f.p2_account, f.p2_name),
+     lambda f: (f.p2_name or "").lower()),
+    ("Payer", 60, "w",
+     lambda f: f.payer_account or "",
+     lambda f: f.payer_account or ""),
+    ("Tow", 70, "w",
+     lambda f: f.tow_callsign or "",
+     lambda f: f.tow_callsign or ""),
+    ("Tug pilot", 180, "w",
+     _tug_pilot,
+     lambda f: (f.tow_pilot_name or "").lower()),
+    ("Height", 60, "e",
+     _height,
+     lambda f: f.height_ft or 0),
+    ("Category", 100, "w",
+     lambda f: f.category or "",
+     lambda f: (f.category or "").lower()),
+    ("From", 70, "w",
+     lambda f: f.airfield_takeoff or "",
+     lambda f: f.airfield_takeoff_key),
+    ("To", 70, "w",
+     lambda f: f.airfield_landing or "",
+     lambda f: (f.airfield_landing or "").upper()),
+    ("Source", 50, "w",
+     lambda f: f.source or "",
+     lambda f: f.source or ""),
+]
+
+
+class FlightTableView(ttk.Frame):
+    """
+    Sortable table of flight sections, filled lazily as the user scrolls.
+
+    Each section from FlightTableFormatter.build_sections is a top-level
+    item. Only the first chunk of each section's rows is inserted up front;
+    further chunks are added when the view is scrolled near the bottom.
+    Clicking a column heading sorts the rows within every section.
+    """
+
+    def __init__(self, parent: tk.Misc):
+        super().__init__(parent)
+
+        self.tree = ttk.Treeview(
+            self,
+            columns=[heading for heading, *_rest in COLUMNS],
+            show="tree headings",
+        )
+        # The tree column holds the section titles as well as row numbers.
+        self.tree.column("#0", width=260, stretch=False)
+        self.tree.heading("#0", text="No", anchor="w")
+
+        for index, (heading, width, anchor, _value, _key) in enumerate(COLUMNS):
+            self.tree.column(heading, width=width, anchor=anchor, stretch=False)
+            self.tree.heading(
+                heading,
+                text=heading,
+                command=lambda column=index: self.sort_by(column),
+            )
+
+        self.tree.tag_configure("even", background="white")
+        self.tree.tag_configure("odd", background="#f0f0f0")
+        self.tree.tag_configure("section", font=("TkDefaultFont", 10, "bold"))
+
+        y_scroll = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        x_scroll = ttk.Scrollbar(self, orient="horizontal", command=self.tree.xview)
+
+        self.tree.configure(
+            yscrollcommand=lambda first, last: self._on_scroll(y_scroll, first, last),
+            xscrollcommand=x_scroll.set,
+        )
+
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        y_scroll.grid(row=0, column=1, sticky="ns")
+        x_scroll.grid(row=1, column=0, sticky="ew")
+
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self._sections: list[tuple[str, list[FlightDisplayRow]]] = []
+        self._loaded: dict[str, int] = {}
+        self._section_items: list[str] = []
+        self._sort_column: int | None = None
+        self._sort_descending = False
+
+    def show(self, sections: list[tuple[str, list[FlightDisplayRow]]]) -> None:
+        self._sections = [
+            (title, list(flights))
+            for title, flights in sections
+            if flights
+        ]
+        self._sort_column = None
+        self._sort_descending = False
+        self._populate()
+
+    def clear(self) -> None:
+        self.show([])
+
+    def sort_by(self, column: int) -> None:
+        if self._sort_column == column:
+            self._sort_descending = not self._sort_descending
+        else:
+            self._sort_column = column
+            self._sort_descending = False
+
+        sort_key = COLUMNS[column][4]
+
+        self._sections = [
+            (title, sorted(flights, key=sort_key, reverse=self._sort_descending))
+            for title, flights in self._sections
+        ]
+        self._populate()
+
+    def _populate(self) -> None:
+        self.tree.delete(*self.tree.get_children())
+        self._loaded = {}
+        self._section_items = []
+
+        for title, flights in self._sections:
+            item = self.tree.insert(
+                "",
+                tk.END,
+                text=f"{title} ({len(flights)})",
+                open=True,
+                tags=("section",),
+            )
+            self._section_items.append(item)
+            self._loaded[item] = 0
+            self._load_more(item)
+
+    def _load_more(self, item: str) -> None:
+        if item not in self._loaded:
+            # The table was repopulated before this deferred load ran.
+            return
+
+        flights = self._sections[self._section_items.index(item)][1]
+        start = self._loaded[item]
+        end = min(start + ROW_CHUNK_SIZE, len(flights))
+
+        for idx in range(start, end):
+            flight = flights[idx]
+            self.tree.insert(
+                item,
+                tk.END,
+                text=str(idx + 1),
+                values=[value(flight) for _h, _w, _a, value, _k in COLUMNS],
+                tags=("even" if (idx + 1) % 2 == 0 else "odd",),
+            )
+
+        self._loaded[item] = end
+
+    def _on_scroll(self, scrollbar: ttk.Scrollbar, first: str, last: str) -> None:
+        scrollbar.set(first, last)
+
+        item = self._section_to_extend(float(last) >= LOAD_MORE_THRESHOLD)
+
+        if item is not None:
+            # Let Tk finish this scroll before inserting more rows.
+            self.after_idle(lambda: self._load_more(item))
+
+    def _section_to_extend(self, near_end: bool) -> str | None:
+        """
+        The unfinished section whose loaded rows are running out on screen.
+
+        Near the end of the table that is the section owning the bottom
+        visible row. Otherwise it is the lowest section whose last loaded
+        row is in view, so a section further up still fills in when the
+        user scrolls to it.
+        """
+        unfinished = [
+            item
+            for index, item in enumerate(self._section_items)
+            if self._loaded[item] < len(self._sections[index][1])
+        ]
+
+        if not unfinished:
+            return None
+
+        if near_end:
+            bottom = self.tree.identify_row(self.tree.winfo_height() - 1)
+            # Below the last row, the last section owns the bottom of the view.
+            owner = (self.tree.parent(bottom) or bottom) if bottom else self._section_items[-1]
+
+            if owner in unfinished:
+                return owner
+
+        for item in reversed(unfinished):
+            if self.tree.bbox(self.tree.get_children(item)[-1]):
+                return item
+
+        return None
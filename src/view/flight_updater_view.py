@@ -1,5 +1,6 @@
 import sys
 import json
+import queue
 import threading
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
@@ -8,9 +9,10 @@ from pathlib import Path
 from tkcalendar import DateEntry
 
 from model.flight_display_row import FlightDisplayRow
-from services.flight_comparison_service import find_unmatched
+from services.flight_comparison_service import Reconciliation, reconcile
 
 from view.flight_table_formatter import FlightTableFormatter
+from view.flight_table_view import FlightTableView
 from view.ga_pdf_printer import GAPdfPrinter
 
 
@@ -19,6 +21,13 @@ try:
 except ImportError:
     VERSION = "unknown"
 
+# The log sink is drained on the Tk main loop in batches.
+LOG_DRAIN_INTERVAL_MS = 50
+LOG_DRAIN_MAX_LINES = 2000
+
+_CLEAR_LOG = object()
+
+
 class FlightUpdaterApp:
     def __init__(self, root: tk.Tk, updater_service):
         self.root = root
@@ -27,14 +36,26 @@ class FlightUpdaterApp:
         self.ga: list[FlightDisplayRow] = []
         self.kt: list[FlightDisplayRow] = []
         self.al: list[FlightDisplayRow] = []
+        self.reconciliation: Reconciliation | None = None
+
+        # One formatter for the whole app, so the log, table, notes and PDF
+        # all reuse the section model built once per fetched flight list.
+        self.formatter = FlightTableFormatter(
+            grl_only=False,
+            group_by_launch_type=False,
+        )
 
         self.launch_sort = tk.BooleanVar(value=True)
         self.include_non_grl_club_departures = tk.BooleanVar(value=True)
         self.list_non_club_non_grl_departures = tk.BooleanVar(value=False)
         self.dry_run_only = tk.BooleanVar(value=True)
         self.show_json = tk.BooleanVar(value=False)
+        self.resend_unchanged = tk.BooleanVar(value=False)
         self.print_to_file = tk.BooleanVar(value=False)
         self.modify_payer = tk.BooleanVar(value=True)
+        self.refresh_cache = tk.BooleanVar(value=False)
+        self.export_combined = tk.BooleanVar(value=False)
+        self.fast_pdf = tk.BooleanVar(value=False)
 
         version = self._get_version()
         aerolog_mode = self._get_aerolog_mode()
@@ -107,7 +128,6 @@ class FlightUpdaterApp:
             pady=2,
         )
 
-
         ttk.Checkbutton(
             fetch_frame,
             text="Modify Payer",
@@ -121,6 +141,18 @@ class FlightUpdaterApp:
             pady=2,
         )
 
+        ttk.Checkbutton(
+            fetch_frame,
+            text="Refresh cached flights",
+            variable=self.refresh_cache,
+        ).grid(
+            row=5,
+            column=0,
+            columnspan=3,
+            sticky="w",
+            padx=5,
+            pady=2,
+        )
 
         # ============================================================
         # Block 2: Lists / print
@@ -183,6 +215,55 @@ class FlightUpdaterApp:
             pady=2,
         )
 
+        ttk.Label(list_frame, text="Export to:").grid(
+            row=3,
+            column=0,
+            sticky="w",
+            padx=5,
+            pady=5,
+        )
+
+        self.export_to_entry = DateEntry(list_frame, date_pattern="yyyy-MM-dd")
+        self.export_to_entry.grid(
+            row=3,
+            column=1,
+            sticky="w",
+            padx=5,
+            pady=5,
+        )
+
+        self.export_pdfs_btn = ttk.Button(
+            list_frame,
+            text="Export GA PDFs",
+            command=self.export_ga_pdfs,
+        )
+        self.export_pdfs_btn.grid(row=3, column=2, sticky="w", padx=5, pady=5)
+
+        ttk.Checkbutton(
+            list_frame,
+            text="One combined PDF",
+            variable=self.export_combined,
+        ).grid(
+            row=4,
+            column=0,
+            columnspan=3,
+            sticky="w",
+            padx=5,
+            pady=2,
+        )
+
+        ttk.Checkbutton(
+            list_frame,
+            text="Fast PDF layout",
+            variable=self.fast_pdf,
+        ).grid(
+            row=5,
+            column=0,
+            columnspan=3,
+            sticky="w",
+            padx=5,
+            pady=2,
+        )
 
         # ============================================================
         # Block 3: Aerolog upload
@@ -241,6 +322,17 @@ class FlightUpdaterApp:
             pady=2,
         )
 
+        ttk.Checkbutton(
+            upload_frame,
+            text="Resend unchanged flights",
+            variable=self.resend_unchanged,
+        ).grid(
+            row=4,
+            column=0,
+            sticky="w",
+            padx=5,
+            pady=2,
+        )
 
         # ============================================================
         # Block 4: Aircraft
@@ -289,8 +381,14 @@ class FlightUpdaterApp:
         )
         self.instructions_btn.grid(row=0, column=0, sticky="w", padx=5, pady=5)
 
-        self.log_widget = scrolledtext.ScrolledText(root, state="disabled")
-        self.log_widget.pack(fill="both", expand=True, padx=10, pady=10)
+        self.notebook = ttk.Notebook(root)
+        self.notebook.pack(fill="both", expand=True, padx=10, pady=10)
+
+        self.log_widget = scrolledtext.ScrolledText(self.notebook, state="disabled")
+        self.notebook.add(self.log_widget, text="Log")
+
+        self.table_view = FlightTableView(self.notebook)
+        self.notebook.add(self.table_view, text="Table")
 
         self.log_widget.tag_configure("even", background="white")
         self.log_widget.tag_configure("odd", background="#f0f0f0")
@@ -298,6 +396,10 @@ class FlightUpdaterApp:
         self.log_widget.tag_configure("error_even", foreground="red", background="white")
         self.log_widget.tag_configure("error_odd", foreground="red", background="#f0f0f0")
 
+        # Worker threads never touch the widget; they push lines here.
+        self._log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
+
         threading.Thread(
             target=self._initialise_ogn_ddb_worker,
             daemon=True,
@@ -319,16 +421,59 @@ class FlightUpdaterApp:
             self.log_message("WARNING: Could not load OGN DDB:")
             self.log_message(traceback.format_exc())
 
+        try:
+            pending = self.service.start_upload_drain(progress=self.log_message)
+
+            if pending:
+                self.log_message(
+                    f"Aerolog upload outbox: retrying {pending} unsent chunk(s) "
+                    f"from an earlier session"
+                )
+
+        except Exception:
+            self.log_message("WARNING: Could not start the Aerolog upload outbox:")
+            self.log_message(traceback.format_exc())
+
     def log_message(self, msg: str, tag: str | None = None) -> None:
-        self.log_widget.configure(state="normal")
-        self.log_widget.insert(tk.END, msg + "\n", tag if tag else None)
-        self.log_widget.see(tk.END)
-        self.log_widget.configure(state="disabled")
+        """Queue a line for the log widget. Safe to call from any thread."""
+        self._log_queue.put((msg, tag))
 
     def clear(self) -> None:
-        self.log_widget.configure(state="normal")
-        self.log_widget.delete("1.0", tk.END)
-        self.log_widget.configure(state="disabled")
+        # Queued, so lines logged before the clear cannot appear after it.
+        self._log_queue.put(_CLEAR_LOG)
+
+    def _drain_log_queue(self) -> None:
+        chunks: list[str] = []
+        clear = False
+
+        try:
+            for _ in range(LOG_DRAIN_MAX_LINES):
+                item = self._log_queue.get_nowait()
+
+                if item is _CLEAR_LOG:
+                    chunks.clear()
+                    clear = True
+                    continue
+
+                msg, tag = item
+                chunks.extend((msg + "\n", tag or ""))
+        except queue.Empty:
+            pass
+
+        if clear or chunks:
+            self.log_widget.configure(state="normal")
+
+            if clear:
+                self.log_widget.delete("1.0", tk.END)
+
+            if chunks:
+                # One insert call for the whole batch.
+                self.log_widget.insert(tk.END, *chunks)
+
+            self.log_widget.see(tk.END)
+            self.log_widget.configure(state="disabled")
+
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
 
     def start(self) -> None:
         self._set_buttons_enabled(False)
@@ -345,6 +490,7 @@ class FlightUpdaterApp:
         self.clear_btn.config(state=state)
         self.send_aerolog_btn.config(state=state)
         self.print_btn.config(state=state)
+        self.export_pdfs_btn.config(state=state)
         self.test_errors_btn.config(state=state)
         self.instructions_btn.config(state=state)
 
@@ -352,7 +498,7 @@ class FlightUpdaterApp:
         self.compare_aircraft_btn.config(state=state)
         self.list_ga_aircraft_btn.config(state=state)
         self.list_al_aircraft_btn.config(state=state)
-        
+
     def list_ga(self) -> None:
         self.clear()
         self.print_flights(
@@ -360,6 +506,7 @@ class FlightUpdaterApp:
             "All Gliding.App flights",
             group_by_launch_type=self.launch_sort.get(),
         )
+        self.show_table(self.ga, "All Gliding.App flights")
 
     def list_ktrax(self) -> None:
         self.clear()
@@ -368,6 +515,7 @@ class FlightUpdaterApp:
             "All Ktrax flights",
             group_by_launch_type=self.launch_sort.get(),
         )
+        self.show_table(self.kt, "All Ktrax flights")
 
     def list_aerolog(self) -> None:
         self.clear()
@@ -376,6 +524,24 @@ class FlightUpdaterApp:
             "All Aerolog flights",
             group_by_launch_type=self.launch_sort.get(),
         )
+        self.show_table(self.al, "All Aerolog flights")
+
+    def show_table(
+        self,
+        flights_unsorted: list[FlightDisplayRow],
+        title: str,
+    ) -> None:
+        """Show flights in the Table tab. Must run on the Tk main thread."""
+        self.table_view.show(
+            self.formatter.build_sections(
+                flights_unsorted,
+                title,
+                group_by_launch_type=self.launch_sort.get(),
+                include_non_grl_non_club=(
+                    self.list_non_club_non_grl_departures.get()
+                ),
+            )
+        )
 
     def send_ga_to_aerolog(self) -> None:
         if not self.ga:
@@ -436,7 +602,6 @@ class FlightUpdaterApp:
                 "Failed to list Gliding.App aircraft. See log for details.",
             )
 
-
     def list_al_aircraft(self) -> None:
         try:
             self.clear()
@@ -460,6 +625,7 @@ class FlightUpdaterApp:
                 "List AL Aircraft",
                 "Failed to list Aerolog aircraft. See log for details.",
             )
+
     def compare_aircraft(self) -> None:
         try:
             self.clear()
@@ -492,14 +658,8 @@ class FlightUpdaterApp:
             self.log_message("")
             self.log_message("Sending Gliding.App flights to Aerolog...")
 
-            formatter = FlightTableFormatter(
-                grl_only=False,
-                group_by_launch_type=False,
-            )
-
             ga_flights_to_send = self._get_ga_flights_planned_for_aerolog_upload()
 
-
             # Always show the simple list, for both dry run and live send.
             self._print_aerolog_upload_summary(ga_flights_to_send)
 
@@ -507,6 +667,8 @@ class FlightUpdaterApp:
                 ga_flights_to_send,
                 modify_payer=self.modify_payer.get(),
                 dry_run=self.dry_run_only.get(),
+                progress=self.log_message,
+                resend=self.resend_unchanged.get(),
             )
 
             self.log_message(
@@ -516,6 +678,23 @@ class FlightUpdaterApp:
                 f"records={result.get('record_count')}"
             )
 
+            if "new_count" in result:
+                self.log_message(
+                    f"Upload plan: "
+                    f"new={result['new_count']}, "
+                    f"changed={result['changed_count']}, "
+                    f"skipped as already sent={result['skipped_count']}, "
+                    f"already in Aerolog={result['already_in_aerolog_count']}, "
+                    f"already queued={result['queued_count']}"
+                )
+
+            if result.get("pending_chunks"):
+                self.log_message(
+                    f"{result['pending_chunks']} chunk(s) are waiting in the upload "
+                    f"outbox and will be retried in the background.",
+                    "error",
+                )
+
             # Only print JSON when it is a dry run and Show JSON is ticked.
             if result.get("status") == "dry_run" and self.show_json.get():
                 payload = result.get("payload")
@@ -778,30 +957,11 @@ class FlightUpdaterApp:
         self,
         flights: list[FlightDisplayRow],
     ) -> tuple[int, int, int, int, int, int]:
-        aerotow = winch = self_launch = tmg = other = 0
-
-        for flight in flights:
-            launch = (flight.launch_method or "").lower()
-
-            if launch == "aerotow":
-                aerotow += 1
-            elif launch == "winch":
-                winch += 1
-            elif launch == "self-launch":
-                self_launch += 1
-            elif launch == "tmg":
-                tmg += 1
-            else:
-                other += 1
-
-        total = aerotow + winch + self_launch + tmg + other
-        return aerotow, winch, self_launch, tmg, other, total
-
+        return FlightTableFormatter.count_types_of_flight(flights)
 
     def _get_version(self) -> str:
         return VERSION
 
-
     def _get_aerolog_mode(self) -> str:
         # Assumes your config structure matches what your services use
         al_config = self.service.config.get("aerolog", {})
@@ -809,29 +969,35 @@ class FlightUpdaterApp:
 
         return mode.upper()
 
-
     def run(self) -> None:
         try:
             flight_date = self.date_entry.get_date()
 
             self.log_message(f"Fetching flights for {flight_date}...")
 
-            self.ga = self.service.get_glidingapp_flights(
+            fetched = self.service.fetch_all_sources(
                 flight_date,
                 modify_payer=self.modify_payer.get(),
-                )
-            self.kt = self.service.get_ktrax_flights(flight_date)
-            self.al = self.service.get_aerolog_flights(flight_date)
+                force_refresh=self.refresh_cache.get(),
+            )
+            self.ga = fetched["ga"]
+            self.kt = fetched["kt"]
+            self.al = fetched["al"]
 
-            kt_not_ga = find_unmatched(self.kt, self.ga)
-            ga_not_kt = find_unmatched(self.ga, self.kt)
+            latency = fetched["latency_seconds"]
+            self.log_message(
+                f"Fetched in {max(latency.values()):.1f}s "
+                f"(Gliding.App {latency['ga']:.1f}s, "
+                f"Ktrax {latency['kt']:.1f}s, "
+                f"Aerolog {latency['al']:.1f}s)"
+            )
 
-            al_not_ga = []
-            ga_not_al = []
+            self.reconciliation = reconcile(self.ga, self.kt, self.al)
 
-            if self.al:
-                al_not_ga = find_unmatched(self.al, self.ga)
-                ga_not_al = find_unmatched(self.ga, self.al)
+            kt_not_ga = self.reconciliation.kt_not_ga
+            ga_not_kt = self.reconciliation.ga_not_kt
+            al_not_ga = self.reconciliation.al_not_ga
+            ga_not_al = self.reconciliation.ga_not_al
 
             # self.log_message(
             #     f"Flights in Ktrax but not in Gliding.App: {len(kt_not_ga)}"
@@ -880,8 +1046,11 @@ class FlightUpdaterApp:
 
             self.print_ga_notes(self.ga)
             self.print_test_for_errors()
-            
 
+            self.root.after(
+                0,
+                lambda: self.show_table(self.ga, "All Gliding.App flights"),
+            )
 
         except Exception:
             self.log_message("ERROR:")
@@ -953,12 +1122,7 @@ class FlightUpdaterApp:
         include_non_grl_sections: bool = True,
         error_style: bool = False,
     ) -> None:
-        formatter = FlightTableFormatter(
-            grl_only=False,
-            group_by_launch_type=group_by_launch_type,
-        )
-
-        for line, tag in formatter.format_flights(
+        for line, tag in self.formatter.format_flights(
             flights_unsorted,
             title,
             notes_only=notes_only,
@@ -979,12 +1143,7 @@ class FlightUpdaterApp:
             self.log_message(line, tag)
 
     def print_ga_notes(self, flights_unsorted: list[FlightDisplayRow]) -> None:
-        formatter = FlightTableFormatter(
-            grl_only=False,
-            group_by_launch_type=False,
-        )
-
-        for line, tag in formatter.format_ga_notes(flights_unsorted):
+        for line, tag in self.formatter.format_ga_notes(flights_unsorted):
             self.log_message(line, tag)
 
     def print_ga(self) -> None:
@@ -992,19 +1151,39 @@ class FlightUpdaterApp:
             messagebox.showinfo("Print GA", "No Gliding.App flights to print.")
             return
 
-        try:
-            printer = GAPdfPrinter(
-                save_to_file=self.print_to_file.get(),
-                grl_only=False,
-                group_by_launch_type=self.launch_sort.get(),
-                include_non_grl_non_club=(
-                    self.list_non_club_non_grl_departures.get()
-                ),
-            )
+        # Options are read here; Tk variables belong to the main thread.
+        printer = GAPdfPrinter(
+            save_to_file=self.print_to_file.get(),
+            grl_only=False,
+            group_by_launch_type=self.launch_sort.get(),
+            include_non_grl_non_club=(
+                self.list_non_club_non_grl_departures.get()
+            ),
+            formatter=self.formatter,
+            renderer=self._pdf_renderer(),
+        )
+
+        self.print_btn.config(state="disabled")
+        self.log_message("")
+        self.log_message("Generating Gliding.App PDF...")
+
+        threading.Thread(
+            target=self._print_ga_worker,
+            args=(printer, self.ga, self.date_entry.get_date()),
+            daemon=True,
+        ).start()
 
+    def _print_ga_worker(
+        self,
+        printer: GAPdfPrinter,
+        flights: list[FlightDisplayRow],
+        flight_date,
+    ) -> None:
+        try:
             output_path = printer.print_ga(
-                self.ga,
-                self.date_entry.get_date(),
+                flights,
+                flight_date,
+                progress=self.log_message,
             )
 
             if output_path is not None:
@@ -1015,7 +1194,96 @@ class FlightUpdaterApp:
         except Exception as exc:
             self.log_message("ERROR printing Gliding.App flights:")
             self.log_message(traceback.format_exc())
-            messagebox.showerror("Print GA", f"Failed to output PDF:\n{exc}")
+            msg = f"Failed to output PDF:\n{exc}"
+            self.root.after(
+                0,
+                lambda msg=msg: messagebox.showerror("Print GA", msg),
+            )
+
+        finally:
+            self.root.after(0, lambda: self.print_btn.config(state="normal"))
+
+    def _pdf_renderer(self) -> str:
+        return "canvas" if self.fast_pdf.get() else "platypus"
+
+    def export_ga_pdfs(self) -> None:
+        start_date = self.date_entry.get_date()
+        end_date = self.export_to_entry.get_date()
+
+        if end_date < start_date:
+            messagebox.showinfo(
+                "Export GA PDFs",
+                "The export end date must not be before the fetch date.",
+            )
+            return
+
+        printer = GAPdfPrinter(
+            save_to_file=True,
+            grl_only=False,
+            group_by_launch_type=self.launch_sort.get(),
+            include_non_grl_non_club=(
+                self.list_non_club_non_grl_departures.get()
+            ),
+            renderer=self._pdf_renderer(),
+        )
+
+        self._set_buttons_enabled(False)
+        self.log_message("")
+        self.log_message(f"Exporting Gliding.App PDFs from {start_date} to {end_date}...")
+
+        threading.Thread(
+            target=self._export_ga_pdfs_worker,
+            args=(
+                printer,
+                start_date,
+                end_date,
+                self.export_combined.get(),
+                self.modify_payer.get(),
+                self.refresh_cache.get(),
+            ),
+            daemon=True,
+        ).start()
+
+    def _export_ga_pdfs_worker(
+        self,
+        printer: GAPdfPrinter,
+        start_date,
+        end_date,
+        combined: bool,
+        modify_payer: bool,
+        force_refresh: bool,
+    ) -> None:
+        try:
+            days = self.service.fetch_glidingapp_date_range(
+                start_date,
+                end_date,
+                modify_payer=modify_payer,
+                force_refresh=force_refresh,
+            )
+
+            for day in days:
+                if "error" in day:
+                    self.log_message(f"{day['date']}: ERROR {day['error']}", "error")
+
+            saved = printer.export_days(
+                [(day["date"], day["ga"]) for day in days if "error" not in day],
+                combined=combined,
+                progress=self.log_message,
+            )
+
+            self.log_message(f"Exported {len(saved)} PDF file(s)")
+
+        except Exception as exc:
+            self.log_message("ERROR exporting Gliding.App PDFs:")
+            self.log_message(traceback.format_exc())
+            msg = f"Failed to export PDFs:\n{exc}"
+            self.root.after(
+                0,
+                lambda msg=msg: messagebox.showerror("Export GA PDFs", msg),
+            )
+
+        finally:
+            self.root.after(0, lambda: self._set_buttons_enabled(True))
 
     def test_for_errors(self) -> None:
         if not self.ga:
@@ -1027,7 +1295,6 @@ class FlightUpdaterApp:
         self.clear()
         self.print_test_for_errors()
 
-
     def print_test_for_errors(self) -> None:
         error_groups = self.service.test_for_errors(self.ga)
 
@@ -1066,14 +1333,9 @@ class FlightUpdaterApp:
     def _get_ga_flights_planned_for_aerolog_upload(
         self,
     ) -> list[FlightDisplayRow]:
-        formatter = FlightTableFormatter(
-            grl_only=False,
-            group_by_launch_type=False,
-        )
-
-        return formatter.filter_aerolog_upload_flights(
+        return self.formatter.filter_aerolog_upload_flights(
             self.ga,
             include_non_grl_club_departures=(
                 self.include_non_grl_club_departures.get()
             ),
-        )
\ No newline at end of file
+        )
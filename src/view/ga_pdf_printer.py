@@ -1,11 +1,17 @@
+import dataclasses
+import hashlib
+import multiprocessing
 import os
+import subprocess
 import sys
 import tempfile
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
 from pathlib import Path
-from shutil import move
-from typing import Any
+from shutil import copy2
+from typing import Any, Callable
 
+from constants.display import RENDERERS
 from model.flight_display_row import FlightDisplayRow
 from view.flight_table_formatter import FlightTableFormatter
 
@@ -14,27 +20,77 @@ try:
     from reportlab.lib.pagesizes import landscape, A4
     from reportlab.lib.styles import getSampleStyleSheet
     from reportlab.lib.units import mm
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.pdfgen import canvas
 
     REPORTLAB_AVAILABLE = True
 except ImportError:
     REPORTLAB_AVAILABLE = False
 
 
+# Bump when the PDF layout changes so cached files are not reused.
+PDF_CACHE_VERSION = 1
+PDF_CACHE_DIR = Path(tempfile.gettempdir()) / "flightupdater-pdf"
+PDF_CACHE_MAX_FILES = 20
+
+# Upper bound on PDF export processes. Each one imports ReportLab and lays
+# out a whole day, so more than this mostly competes with the GUI.
+PDF_EXPORT_MAX_WORKERS = 4
+
+# Spawned rather than forked: forking the GUI process would copy Tk and
+# the service's threads and locks into every worker.
+_EXPORT_CONTEXT = multiprocessing.get_context("spawn")
+
+_ROW_FIELDS = tuple(
+    f.name for f in dataclasses.fields(FlightDisplayRow) if f.init
+)
+
+
 class GAPdfPrinter:
+    # (heading, width in mm). Shared by both renderers.
+    COLUMNS = [
+        ("No", 7),
+        ("Seq", 9),
+        ("Launch", 17),
+        ("Aircraft", 25),
+        ("Takeoff", 12),
+        ("Landing", 12),
+        ("P1", 42),
+        ("P2", 42),
+        ("Payer", 10),
+        ("Tow", 14),
+        ("Tug pilot", 25),
+        ("Height", 11),
+        ("Category", 18),
+        ("From", 10),
+        ("To", 10),
+    ]
+
+    RIGHT_ALIGNED = {0, 1}
+    CENTRED = {4, 5}
+    MONOSPACED = {6, 7}
+
     def __init__(
         self,
         save_to_file: bool = False,
         grl_only: bool = True,
         group_by_launch_type: bool = True,
         include_non_grl_non_club: bool = False,
+        formatter: FlightTableFormatter | None = None,
+        renderer: str = "platypus",
     ):
+        if renderer not in RENDERERS:
+            raise ValueError(f"Unknown PDF renderer: {renderer}")
+
         self.save_to_file = save_to_file
         self.grl_only = grl_only
         self.group_by_launch_type = group_by_launch_type
         self.include_non_grl_non_club = include_non_grl_non_club
+        self.renderer = renderer
 
-        self.formatter = FlightTableFormatter(
+        # Pass the app's formatter to reuse its cached section models.
+        self.formatter = formatter or FlightTableFormatter(
             grl_only=grl_only,
             group_by_launch_type=group_by_launch_type,
         )
@@ -43,13 +99,210 @@ class GAPdfPrinter:
         self,
         flights_unsorted: list[FlightDisplayRow],
         flight_date: Any,
+        progress: Callable[[str], None] | None = None,
     ) -> Path | None:
+        """
+        Render the PDF, then save it to Downloads or send it to the printer.
+
+        Slow enough to run on a worker thread; progress, if given, is called
+        with a short message as each section is laid out. Printing does not
+        wait for the spooler.
+
+        Rendered files are kept in a temp directory under a hash of the
+        flights, date and options, so an unchanged reprint or save reuses
+        the last file instead of rendering again.
+        """
+        if not REPORTLAB_AVAILABLE:
+            raise RuntimeError(
+                "ReportLab is not installed. Install reportlab to enable printing."
+            )
+
+        pdf_path = self._cache_path(flights_unsorted, flight_date)
+        target = self._downloads_target() if self.save_to_file else None
+
+        if self._reuse_cached(pdf_path, target):
+            if progress is not None:
+                progress("PDF: flights and options unchanged, reusing last PDF")
+        else:
+            self._render(flights_unsorted, flight_date, pdf_path, progress)
+
+            if target is not None:
+                copy2(pdf_path, target)
+
+        if target is not None:
+            return target
+
+        self._send_to_printer(str(pdf_path))
+        return None
+
+    def export_days(
+        self,
+        days: list[tuple[date, list[FlightDisplayRow]]],
+        output_dir: str | Path | None = None,
+        combined: bool = False,
+        max_workers: int | None = None,
+        progress: Callable[[str], None] | None = None,
+    ) -> list[Path]:
+        """
+        Save daily log sheets for several days, rendered in worker processes.
+
+        Writes GlidingApp_<date>.pdf per day, or with combined=True a single
+        GlidingApp_<first>_to_<last>.pdf with each day on a new page, to
+        output_dir (default: Downloads). Days without flights are skipped.
+        Per-day files go through the same PDF cache as print_ga. A day that
+        fails is reported through progress and does not stop the others.
+        max_workers is capped at PDF_EXPORT_MAX_WORKERS and the day count.
+        """
         if not REPORTLAB_AVAILABLE:
             raise RuntimeError(
                 "ReportLab is not installed. Install reportlab to enable printing."
             )
 
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
+        output_dir = Path(output_dir) if output_dir else self._downloads_dir()
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        days = [(flight_date, flights) for flight_date, flights in days if flights]
+
+        if not days:
+            return []
+
+        options = {
+            "grl_only": self.grl_only,
+            "group_by_launch_type": self.group_by_launch_type,
+            "include_non_grl_non_club": self.include_non_grl_non_club,
+            "renderer": self.renderer,
+        }
+
+        if combined:
+            target = output_dir / f"GlidingApp_{days[0][0]}_to_{days[-1][0]}.pdf"
+
+            # One document cannot be split across processes, but laying it
+            # out in a child process still keeps it off the GUI's GIL.
+            with ProcessPoolExecutor(max_workers=1, mp_context=_EXPORT_CONTEXT) as executor:
+                executor.submit(_export_combined_pdf, options, days, str(target)).result()
+
+            if progress is not None:
+                progress(f"PDF: saved {target}")
+
+            return [target]
+
+        saved: dict[date, Path] = {}
+
+        workers = min(
+            max_workers or PDF_EXPORT_MAX_WORKERS,
+            PDF_EXPORT_MAX_WORKERS,
+            len(days),
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=max(1, workers),
+            mp_context=_EXPORT_CONTEXT,
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _export_day_pdf,
+                    options,
+                    flights,
+                    flight_date,
+                    str(output_dir / f"GlidingApp_{flight_date}.pdf"),
+                ): flight_date
+                for flight_date, flights in days
+            }
+
+            for future in as_completed(futures):
+                flight_date = futures[future]
+
+                try:
+                    saved[flight_date] = Path(future.result())
+                except Exception as exc:
+                    if progress is not None:
+                        progress(f"PDF: {flight_date} failed: {type(exc).__name__}: {exc}")
+                    continue
+
+                if progress is not None:
+                    progress(f"PDF: saved {saved[flight_date]}")
+
+        return [saved[flight_date] for flight_date, _flights in days if flight_date in saved]
+
+    def cache_key(
+        self,
+        flights_unsorted: list[FlightDisplayRow],
+        flight_date: Any,
+    ) -> str:
+        """Hash of everything that affects the rendered PDF."""
+        digest = hashlib.sha256()
+        digest.update(
+            repr((
+                PDF_CACHE_VERSION,
+                str(flight_date),
+                self.group_by_launch_type,
+                self.include_non_grl_non_club,
+                self.renderer,
+            )).encode("utf-8")
+        )
+
+        for flight in flights_unsorted:
+            digest.update(
+                repr(tuple(getattr(flight, name) for name in _ROW_FIELDS)).encode("utf-8")
+            )
+
+        return digest.hexdigest()
+
+    def _cache_path(
+        self,
+        flights_unsorted: list[FlightDisplayRow],
+        flight_date: Any,
+    ) -> Path:
+        return PDF_CACHE_DIR / f"{self.cache_key(flights_unsorted, flight_date)}.pdf"
+
+    @staticmethod
+    def _reuse_cached(pdf_path: Path, target: Path | None) -> bool:
+        """
+        Refresh a cached PDF's mtime and copy it to target, if given.
+
+        False when there is no cached file, including when another process
+        prunes it part way through, so the caller renders instead.
+        """
+        try:
+            # Keeps recently used files when pruning. Unlike touch(), utime
+            # does not recreate a pruned file as an empty one.
+            os.utime(pdf_path)
+
+            if target is not None:
+                copy2(pdf_path, target)
+        except OSError:
+            return False
+
+        return True
+
+    def _render(
+        self,
+        flights_unsorted: list[FlightDisplayRow],
+        flight_date: Any,
+        pdf_path: Path,
+        progress: Callable[[str], None] | None = None,
+    ) -> None:
+        PDF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        self._prune_cache()
+
+        self._build_pdf([(flight_date, flights_unsorted)], pdf_path, progress)
+
+    def _build_pdf(
+        self,
+        days: list[tuple[Any, list[FlightDisplayRow]]],
+        pdf_path: Path,
+        progress: Callable[[str], None] | None = None,
+    ) -> None:
+        """Lay out one or more days, each starting on a new page."""
+        if self.renderer == "canvas":
+            self._build_pdf_canvas(days, pdf_path, progress)
+            return
+
+        tmp = tempfile.NamedTemporaryFile(
+            delete=False,
+            suffix=".pdf",
+            dir=pdf_path.parent,
+        )
         tmp.close()
 
         doc = SimpleDocTemplate(
@@ -65,39 +318,79 @@ class GAPdfPrinter:
         styles["Heading2"].fontSize = 12
         styles["Heading3"].fontSize = 10
 
-        story = [
-            Paragraph(f"Gliding.App Flights - {flight_date}", styles["Heading2"]),
-            Spacer(1, 6),
-        ]
+        story: list = []
 
-        sections = self.formatter.build_sections(
-            flights_unsorted,
-            "All Flights",
-            group_by_launch_type=self.group_by_launch_type,
-            include_non_grl_non_club=self.include_non_grl_non_club,
-        )
+        for flight_date, flights_unsorted in days:
+            if story:
+                story.append(PageBreak())
 
-        for section_title, section_flights in sections:
-            self._add_pdf_table(
-                story,
-                styles,
-                section_title,
-                section_flights,
+            story.append(
+                Paragraph(f"Gliding.App Flights - {flight_date}", styles["Heading2"])
             )
+            story.append(Spacer(1, 6))
+
+            for section_title, section_flights in self.formatter.iter_sections(
+                flights_unsorted,
+                "All Flights",
+                group_by_launch_type=self.group_by_launch_type,
+                include_non_grl_non_club=self.include_non_grl_non_club,
+            ):
+                if progress is not None:
+                    progress(f"PDF: {section_title} ({len(section_flights)} flights)")
+
+                self._add_pdf_table(
+                    story,
+                    styles,
+                    section_title,
+                    section_flights,
+                )
+
+        if progress is not None:
+            progress("PDF: building document")
+
+        try:
+            doc.build(story)
+
+            # Only complete files ever appear under their final name.
+            os.replace(tmp.name, pdf_path)
+        except Exception:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
 
-        doc.build(story)
+    @staticmethod
+    def _prune_cache() -> None:
+        def mtime(path: Path) -> float:
+            # Export workers may remove files while we look.
+            try:
+                return path.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        cached = sorted(
+            PDF_CACHE_DIR.glob("*.pdf"),
+            key=mtime,
+            reverse=True,
+        )
 
-        if self.save_to_file:
-            target = self._downloads_target()
-            move(tmp.name, target)
-            return target
+        for path in cached[PDF_CACHE_MAX_FILES:]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
 
+    @staticmethod
+    def _send_to_printer(path: str) -> None:
         if sys.platform.startswith("win"):
-            os.startfile(tmp.name, "print")
-        else:
-            os.system(f'lpr "{tmp.name}"')
+            os.startfile(path, "print")
+            return
 
-        return None
+        # Hand the file to the spooler without waiting for it.
+        subprocess.Popen(
+            ["lpr", path],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
 
     def _add_pdf_table(
         self,
@@ -112,69 +405,13 @@ class GAPdfPrinter:
         story.append(Paragraph(title, styles["Heading3"]))
         story.append(Spacer(1, 6))
 
-        data = [[
-            "No", "Seq", "Launch", "Aircraft", "Takeoff", "Landing",
-            "P1", "P2", "Payer", "Tow", "Tug pilot", "Height",
-            "Category", "From", "To",
-        ]]
-
-        for idx, flight in enumerate(subset, start=1):
-            launch = (flight.launch_method or "").lower()
-            height_str = str(flight.height_ft or "") if launch == "aerotow" else ""
-
-            tow_pilot = self._truncate(
-                (
-                    f"{flight.tow_pilot_account or ''} "
-                    f"{flight.tow_pilot_name or ''}"
-                ).strip(),
-                18,
-            )
+        data = [[heading for heading, _width in self.COLUMNS]]
+        data.extend(
+            self._row_cells(idx, flight)
+            for idx, flight in enumerate(subset, start=1)
+        )
 
-            data.append([
-                idx,
-                flight.sequence_number or "",
-                flight.launch_method or "",
-                self.formatter.aircraft_str(flight),
-                flight.takeoff_str(),
-                flight.landing_str(),
-                self.formatter.crew_str(
-                    flight.pic_account,
-                    flight.pic_name,
-                    30,
-                    pad_char="\u00A0",
-                ),
-                self.formatter.crew_str(
-                    flight.p2_account,
-                    flight.p2_name,
-                    30,
-                    pad_char="\u00A0",
-                ),
-                flight.payer_account or "",
-                flight.tow_callsign or "",
-                tow_pilot,
-                height_str,
-                flight.category or "",
-                self.formatter.fixed_width(flight.airfield_takeoff, 10).strip(),
-                self.formatter.fixed_width(flight.airfield_landing, 10).strip(),
-            ])
-
-        col_widths = [
-            7 * mm,    # No
-            9 * mm,    # Seq
-            17 * mm,   # Launch
-            25 * mm,   # Aircraft
-            12 * mm,   # Takeoff
-            12 * mm,   # Landing
-            42 * mm,   # P1
-            42 * mm,   # P2
-            10 * mm,   # Payer
-            14 * mm,   # Tow
-            25 * mm,   # Tug pilot
-            11 * mm,   # Height
-            18 * mm,   # Category
-            10 * mm,   # From
-            10 * mm,   # To
-        ]
+        col_widths = [width * mm for _heading, width in self.COLUMNS]
 
         table = Table(data, colWidths=col_widths, repeatRows=1)
 
@@ -200,12 +437,117 @@ class GAPdfPrinter:
         story.append(table)
         story.append(Spacer(1, 12))
 
-    def _downloads_target(self) -> Path:
+    def _row_cells(self, idx: int, flight: FlightDisplayRow) -> list:
+        height_str = str(flight.height_ft or "") if flight.launch_key == "aerotow" else ""
+
+        tow_pilot = self._truncate(
+            (
+                f"{flight.tow_pilot_account or ''} "
+                f"{flight.tow_pilot_name or ''}"
+            ).strip(),
+            18,
+        )
+
+        return [
+            idx,
+            flight.sequence_number or "",
+            flight.launch_method or "",
+            self.formatter.aircraft_str(flight),
+            flight.takeoff_str(),
+            flight.landing_str(),
+            self.formatter.crew_str(
+                flight.pic_account,
+                flight.pic_name,
+                30,
+                pad_char="\u00A0",
+            ),
+            self.formatter.crew_str(
+                flight.p2_account,
+                flight.p2_name,
+                30,
+                pad_char="\u00A0",
+            ),
+            flight.payer_account or "",
+            flight.tow_callsign or "",
+            tow_pilot,
+            height_str,
+            flight.category or "",
+            self.formatter.fixed_width(flight.airfield_takeoff, 10).strip(),
+            self.formatter.fixed_width(flight.airfield_landing, 10).strip(),
+        ]
+
+    def _build_pdf_canvas(
+        self,
+        days: list[tuple[Any, list[FlightDisplayRow]]],
+        pdf_path: Path,
+        progress: Callable[[str], None] | None = None,
+    ) -> None:
+        """
+        Draw the same tables as the platypus renderer straight onto the canvas.
+
+        Every row has the same height and the column edges are fixed, so
+        pagination is a running y position. The header row is repeated at
+        the top of each page, and the grid is drawn once per page block.
+        """
+        tmp = tempfile.NamedTemporaryFile(
+            delete=False,
+            suffix=".pdf",
+            dir=pdf_path.parent,
+        )
+        tmp.close()
+
+        layout = _CanvasLayout(
+            canvas.Canvas(tmp.name, pagesize=landscape(A4)),
+            [width * mm for _heading, width in self.COLUMNS],
+            self.RIGHT_ALIGNED,
+            self.CENTRED,
+            self.MONOSPACED,
+        )
+        headings = [heading for heading, _width in self.COLUMNS]
+
+        for day_number, (flight_date, flights_unsorted) in enumerate(days):
+            if day_number:
+                layout.new_page()
+
+            layout.heading(f"Gliding.App Flights - {flight_date}", 12)
+
+            for section_title, section_flights in self.formatter.iter_sections(
+                flights_unsorted,
+                "All Flights",
+                group_by_launch_type=self.group_by_launch_type,
+                include_non_grl_non_club=self.include_non_grl_non_club,
+            ):
+                if progress is not None:
+                    progress(f"PDF: {section_title} ({len(section_flights)} flights)")
+
+                layout.table(
+                    section_title,
+                    headings,
+                    (
+                        self._row_cells(idx, flight)
+                        for idx, flight in enumerate(section_flights, start=1)
+                    ),
+                )
+
+        if progress is not None:
+            progress("PDF: writing document")
+
+        try:
+            layout.pdf.save()
+            os.replace(tmp.name, pdf_path)
+        except Exception:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _downloads_dir() -> Path:
         downloads = Path.home() / "Downloads"
         downloads.mkdir(exist_ok=True)
+        return downloads
 
+    def _downloads_target(self) -> Path:
         stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        return downloads / f"GlidingApp_{stamp}.pdf"
+        return self._downloads_dir() / f"GlidingApp_{stamp}.pdf"
 
     @staticmethod
     def _truncate(value: object, max_len: int) -> str:
@@ -217,4 +559,205 @@ class GAPdfPrinter:
         if max_len <= 1:
             return text[:max_len]
 
-        return text[: max_len - 1] + "…"
\ No newline at end of file
+        return text[: max_len - 1] + "…"
+
+
+class _CanvasLayout:
+    """Running page position and drawing helpers for the canvas renderer."""
+
+    # Matches the platypus output: page margins plus frame padding, the
+    # Table default leading of 12 plus 1pt padding top and bottom, and the
+    # sample Heading2/Heading3 styles followed by a 6pt spacer.
+    MARGIN = 26
+    FONT_SIZE = 7
+    ROW_HEIGHT = 14
+    PADDING = 1
+
+    def __init__(
+        self,
+        pdf,
+        col_widths: list[float],
+        right_aligned: set[int],
+        centred: set[int],
+        monospaced: set[int],
+    ):
+        self.pdf = pdf
+        self.page_width, self.page_height = landscape(A4)
+
+        # Centre the table between the margins, as platypus does.
+        left = (self.page_width - sum(col_widths)) / 2
+        self.x_edges = [left]
+
+        for width in col_widths:
+            self.x_edges.append(self.x_edges[-1] + width)
+
+        self.col_widths = col_widths
+        self.right_aligned = right_aligned
+        self.centred = centred
+        self.fonts = [
+            "Courier" if column in monospaced else "Helvetica"
+            for column in range(len(col_widths))
+        ]
+
+        # (text, font, column) -> (clipped text, x position). Launch
+        # methods, times, names and airfields repeat throughout a day.
+        self._placed: dict[tuple[str, str, int], tuple[str, float]] = {}
+        self._text_font: str | None = None
+
+        self.y = self.page_height - self.MARGIN
+
+    def new_page(self) -> None:
+        self.pdf.showPage()
+        self.y = self.page_height - self.MARGIN
+
+    def heading(self, text: str, size: int, font: str = "Helvetica-Bold") -> None:
+        if self.y < self.page_height - self.MARGIN:
+            self.y -= 12
+
+        self.y -= size * 1.2
+        self.pdf.setFont(font, size)
+        self.pdf.drawString(self.MARGIN, self.y, text)
+        self.y -= 12
+
+    def table(self, title: str, headings: list[str], rows) -> None:
+        # Keep the section title with its header and first row.
+        if self.y - 12 - 10 * 1.2 - 12 - 2 * self.ROW_HEIGHT < self.MARGIN:
+            self.new_page()
+
+        self.heading(title, 10, "Helvetica-BoldOblique")
+
+        block_top = self.y
+        text = self._start_block(headings)
+
+        for cells in rows:
+            if self.y - self.ROW_HEIGHT < self.MARGIN:
+                self._end_block(text, block_top)
+                self.new_page()
+                block_top = self.y
+                text = self._start_block(headings)
+
+            self._row(text, cells, bold=False)
+
+        self._end_block(text, block_top)
+        self.y -= 12
+
+    def _start_block(self, headings: list[str]):
+        """Shade the header row and open one text object for the block."""
+        self.pdf.setFillColor(colors.lightgrey)
+        self.pdf.rect(
+            self.x_edges[0],
+            self.y - self.ROW_HEIGHT,
+            self.x_edges[-1] - self.x_edges[0],
+            self.ROW_HEIGHT,
+            stroke=0,
+            fill=1,
+        )
+        self.pdf.setFillColor(colors.black)
+
+        text = self.pdf.beginText()
+        self._text_font = None
+        self._row(text, headings, bold=True)
+        return text
+
+    def _end_block(self, text, block_top: float) -> None:
+        pdf = self.pdf
+        pdf.drawText(text)
+
+        pdf.setStrokeColor(colors.grey)
+        pdf.setLineWidth(0.5)
+
+        left, right = self.x_edges[0], self.x_edges[-1]
+
+        for x in self.x_edges:
+            pdf.line(x, block_top, x, self.y)
+
+        rows = round((block_top - self.y) / self.ROW_HEIGHT)
+
+        for row in range(rows + 1):
+            row_y = block_top - row * self.ROW_HEIGHT
+            pdf.line(left, row_y, right, row_y)
+
+    def _row(self, text, cells: list, bold: bool) -> None:
+        baseline = self.y - self.ROW_HEIGHT + (self.ROW_HEIGHT - self.FONT_SIZE) / 2 + 1
+
+        for column, value in enumerate(cells):
+            value = str(value)
+
+            if not value:
+                continue
+
+            font = "Helvetica-Bold" if bold else self.fonts[column]
+
+            if font != self._text_font:
+                text.setFont(font, self.FONT_SIZE)
+                self._text_font = font
+
+            key = (value, font, column)
+            placed = self._placed.get(key)
+
+            if placed is None:
+                placed = self._place(value, font, column, centred=bold)
+                self._placed[key] = placed
+
+            text.setTextOrigin(placed[1], baseline)
+            text.textOut(placed[0])
+
+        self.y -= self.ROW_HEIGHT
+
+    def _place(
+        self,
+        value: str,
+        font: str,
+        column: int,
+        centred: bool,
+    ) -> tuple[str, float]:
+        # Clip rather than overflow into the next cell. Cut in proportion
+        # first so long names need only a couple of width measurements.
+        available = self.col_widths[column] - 2 * self.PADDING
+        width = stringWidth(value, font, self.FONT_SIZE)
+
+        if width > available:
+            value = value[:int(len(value) * available / width)]
+            width = stringWidth(value, font, self.FONT_SIZE)
+
+            while value and width > available:
+                value = value[:-1]
+                width = stringWidth(value, font, self.FONT_SIZE)
+
+        left = self.x_edges[column]
+
+        if centred or column in self.centred:
+            return value, left + (self.col_widths[column] - width) / 2
+
+        if column in self.right_aligned:
+            return value, self.x_edges[column + 1] - self.PADDING - width
+
+        return value, left + self.PADDING
+
+
+# Process pool workers. They are module-level so they can be pickled, and
+# build their own printer because formatters and Tk state stay in the parent.
+
+def _export_day_pdf(
+    options: dict,
+    flights: list[FlightDisplayRow],
+    flight_date: date,
+    target: str,
+) -> str:
+    printer = GAPdfPrinter(**options)
+    pdf_path = printer._cache_path(flights, flight_date)
+
+    if not printer._reuse_cached(pdf_path, Path(target)):
+        printer._render(flights, flight_date, pdf_path)
+        copy2(pdf_path, target)
+
+    return target
+
+
+def _export_combined_pdf(
+    options: dict,
+    days: list[tuple[date, list[FlightDisplayRow]]],
+    target: str,
+) -> str:
+    GAPdfPrinter(**options)._build_pdf(days, Path(target))
+    return target
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# The application modules import as top-level packages from src, as they do
+# when main.py or cli.py is run.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,147 @@
+import random
+from dataclasses import dataclass
+
+import pytest
+
+from model.aircraft_identity import (
+    aerolog_identity,
+    aircraft_identity,
+    glidingapp_identity,
+    normalise_aircraft_id,
+    values_differ,
+)
+from model.aircraft_index import AircraftIndex
+
+
+# Reference: the per-module helpers aircraft_identity replaced.
+
+def reference_normalise(value) -> str:
+    return str(value or "").strip().upper().replace("-", "").replace(" ", "")
+
+
+def reference_keys(*values) -> set[str]:
+    return {key for key in map(reference_normalise, values) if key}
+
+
+def reference_values_differ(left, right) -> bool:
+    left_text = reference_normalise(left)
+    right_text = reference_normalise(right)
+
+    if not left_text and not right_text:
+        return False
+
+    return left_text != right_text
+
+
+def reference_index(aircraft) -> dict:
+    by_key = {}
+
+    for candidate in aircraft:
+        key = reference_normalise(candidate.registration)
+
+        if key:
+            by_key.setdefault(key, candidate)
+
+    for candidate in aircraft:
+        key = reference_normalise(candidate.callsign)
+
+        if key:
+            by_key.setdefault(key, candidate)
+
+    return by_key
+
+
+@dataclass(eq=False)
+class GlidingAppAircraft:
+    registration: str | None
+    callsign: str | None
+
+
+@dataclass(eq=False)
+class AerologAircraft:
+    registration: str | None
+    competition_registration: str | None
+    short_registration: str | None
+
+
+# Blanks, case, hyphen and space variants of a few shared identifiers.
+VALUES = [
+    None, "", " ", "-", " - ", 0, 21,
+    "G-CKAB", "gckab", " g ckab ", "G-C-K-A-B", "CKAB", "ckab",
+    "K21", "k-21", "K 21", "KAB", "G-DDDD", "DDDD",
+]
+
+
+def random_value(rng: random.Random):
+    return rng.choice(VALUES)
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_normalise_matches_reference(value):
+    assert normalise_aircraft_id(value) == reference_normalise(value)
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_identity_keys_match_reference(seed):
+    rng = random.Random(seed)
+    values = tuple(random_value(rng) for _ in range(rng.randint(0, 3)))
+
+    identity = aircraft_identity(*values)
+
+    assert identity.ids == tuple(map(reference_normalise, values))
+    assert set(identity.keys) == identity.key_set == reference_keys(*values)
+    assert len(identity.keys) == len(identity.key_set)
+    # Distinct keys keep the order of their first field.
+    assert list(identity.keys) == [
+        key for i, key in enumerate(identity.ids) if key and key not in identity.ids[:i]
+    ]
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_source_identities_match_reference(seed):
+    rng = random.Random(seed)
+    ga = GlidingAppAircraft(random_value(rng), random_value(rng))
+    al = AerologAircraft(random_value(rng), random_value(rng), random_value(rng))
+
+    assert glidingapp_identity(ga).key_set == reference_keys(ga.registration, ga.callsign)
+    assert aerolog_identity(al).key_set == reference_keys(
+        al.registration,
+        al.short_registration,
+        al.competition_registration,
+    )
+    assert glidingapp_identity(ga).matches(aerolog_identity(al)) == bool(
+        reference_keys(ga.registration, ga.callsign)
+        & reference_keys(al.registration, al.short_registration, al.competition_registration)
+    )
+    # The report sort keys.
+    assert glidingapp_identity(ga).ids == (
+        reference_normalise(ga.registration),
+        reference_normalise(ga.callsign),
+    )
+    assert aerolog_identity(al).ids[:2] == (
+        reference_normalise(al.registration),
+        reference_normalise(al.competition_registration),
+    )
+
+
+@pytest.mark.parametrize("left", VALUES)
+def test_values_differ_matches_reference(left):
+    for right in VALUES:
+        assert values_differ(left, right) == reference_values_differ(left, right)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_aircraft_index_matches_reference(seed):
+    rng = random.Random(seed)
+    aircraft = [
+        GlidingAppAircraft(random_value(rng), random_value(rng))
+        for _ in range(rng.randint(0, 8))
+    ]
+    expected = reference_index(aircraft)
+
+    index = AircraftIndex.build(aircraft)
+
+    assert len(index) == len(expected)
+
+    for value in VALUES:
+        assert index.find(value) is expected.get(reference_normalise(value))
@@ -0,0 +1,53 @@
+import sqlite3
+import time
+from datetime import date
+
+import pytest
+
+from services.flight_cache import FlightCache
+
+
+OLD_DAY = date(2020, 5, 1)
+
+
+def write_payload(cache: FlightCache, payload: bytes) -> None:
+    with sqlite3.connect(cache.path) as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO flights VALUES (?, ?, ?, ?)",
+            ("GA", OLD_DAY.isoformat(), time.time(), payload),
+        )
+    conn.close()
+
+
+def test_put_then_get_round_trips(tmp_path):
+    cache = FlightCache(tmp_path / "cache.sqlite3")
+    cache.put("GA", OLD_DAY, [{"sync_key": 1}])
+
+    assert cache.get("GA", OLD_DAY) == [{"sync_key": 1}]
+    assert cache.get("KT", OLD_DAY) is None
+
+
+def test_unusable_cache_location_disables_the_cache(tmp_path):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+
+    cache = FlightCache(blocker / "cache.sqlite3")
+
+    assert not cache.enabled
+    cache.put("GA", OLD_DAY, [])
+    assert cache.get("GA", OLD_DAY) is None
+
+
+@pytest.mark.parametrize("payload", [
+    # A class from a module that no longer exists.
+    b"cno_such_flight_module\nCombinationFlight\n)R.",
+    # A constructor whose signature has changed.
+    b"cbuiltins\nint\n(S'1'\nS'2'\nS'3'\ntR.",
+    b"not a pickle",
+    b"",
+])
+def test_stale_or_corrupt_entry_is_a_miss(tmp_path, payload):
+    cache = FlightCache(tmp_path / "cache.sqlite3")
+    write_payload(cache, payload)
+
+    assert cache.get("GA", OLD_DAY) is None
@@ -0,0 +1,255 @@
+import random
+from datetime import date, datetime, time
+
+import pytest
+
+from model.flight_display_row import FlightDisplayRow
+from services.flight_comparison_service import (
+    MAX_TOLERANCE_SECONDS,
+    PairComparison,
+    Reconciliation,
+    compare_pair,
+    match_flights,
+    reconcile,
+)
+
+
+# Reference: the original O(n*m) greedy matcher, kept independent of the
+# indexed code and the pre-normalised row keys.
+
+def _reference_normalise(value: str | None) -> str:
+    return (value or "").strip().upper().replace("-", "").replace(" ", "")
+
+
+def _reference_keys(*values: str | None) -> set[str]:
+    return {key for key in map(_reference_normalise, values) if key}
+
+
+def _reference_times_match(t1: time | None, t2: time | None, tolerance: int) -> bool:
+    if not t1 or not t2:
+        return False
+
+    today = date.today()
+    delta = abs((datetime.combine(today, t1) - datetime.combine(today, t2)).total_seconds())
+    return delta <= tolerance
+
+
+def reference_flights_match(
+    f1: FlightDisplayRow,
+    f2: FlightDisplayRow,
+    tolerance: int = MAX_TOLERANCE_SECONDS,
+) -> bool:
+    if not _reference_keys(f1.callsign, f1.registration) & _reference_keys(f2.callsign, f2.registration):
+        return False
+
+    tow1 = _reference_keys(f1.tow_callsign)
+    tow2 = _reference_keys(f2.tow_callsign)
+
+    if (tow1 or tow2) and not (tow1 & tow2):
+        return False
+
+    return (
+        _reference_times_match(f1.takeoff_time, f2.takeoff_time, tolerance)
+        and _reference_times_match(f1.landing_time, f2.landing_time, tolerance)
+    )
+
+
+def reference_match(
+    source: list[FlightDisplayRow],
+    target: list[FlightDisplayRow],
+    tolerance: int = MAX_TOLERANCE_SECONDS,
+):
+    used: set[int] = set()
+    pairs = []
+    unmatched = []
+
+    for flight in source:
+        for index, candidate in enumerate(target):
+            if index not in used and reference_flights_match(flight, candidate, tolerance):
+                used.add(index)
+                pairs.append((flight, candidate))
+                break
+        else:
+            unmatched.append(flight)
+
+    unused = [candidate for index, candidate in enumerate(target) if index not in used]
+    return pairs, unmatched, unused
+
+
+# Registration/callsign pairs that overlap in several ways, including the
+# same aircraft written with different spacing, hyphens and case.
+AIRCRAFT = [
+    ("G-CKAB", "K21"),
+    ("GCKAB", ""),
+    ("", "k-21"),
+    ("g ckab", "AB"),
+    ("G-DDDD", "K21"),
+    ("G-DDDD", ""),
+    ("", "DD"),
+]
+TUGS = ["", "", "TUG", "tug ", "T-2"]
+# Offsets around the tolerance edge, and repeats for equal takeoffs.
+OFFSETS = [0, 0, 60, 119, 120, 121, 180, 240, 241]
+
+
+def _clock(seconds: int) -> time:
+    return time(seconds // 3600, seconds % 3600 // 60, seconds % 60)
+
+
+def random_flights(rng: random.Random, count: int, source: str = "GA") -> list[FlightDisplayRow]:
+    flights = []
+
+    for _ in range(count):
+        registration, callsign = rng.choice(AIRCRAFT)
+        takeoff = 10 * 3600 + rng.choice(OFFSETS)
+        landing = takeoff + 1200 + rng.choice(OFFSETS)
+
+        flights.append(FlightDisplayRow(
+            source=source,
+            registration=registration,
+            callsign=callsign,
+            tow_callsign=rng.choice(TUGS),
+            takeoff_time=None if rng.random() < 0.05 else _clock(takeoff),
+            landing_time=None if rng.random() < 0.05 else _clock(landing),
+        ))
+
+    return flights
+
+
+def _ids(rows):
+    return [id(row) for row in rows]
+
+
+def _pair_ids(pairs):
+    return [(id(a), id(b)) for a, b in pairs]
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_indexed_matcher_equals_reference_greedy(seed):
+    rng = random.Random(seed)
+    source = random_flights(rng, rng.randint(0, 15))
+    target = random_flights(rng, rng.randint(0, 15))
+
+    pairs, unmatched, unused = match_flights(source, target)
+    expected_pairs, expected_unmatched, expected_unused = reference_match(source, target)
+
+    assert _pair_ids(pairs) == _pair_ids(expected_pairs)
+    assert _ids(unmatched) == _ids(expected_unmatched)
+    assert _ids(unused) == _ids(expected_unused)
+
+
+@pytest.mark.parametrize("tolerance", [0, 60, 120])
+def test_custom_tolerance_equals_reference_greedy(tolerance):
+    rng = random.Random(tolerance)
+
+    for _ in range(50):
+        source = random_flights(rng, 10)
+        target = random_flights(rng, 10)
+
+        pairs, unmatched, unused = match_flights(source, target, tolerance)
+        expected = reference_match(source, target, tolerance)
+
+        assert _pair_ids(pairs) == _pair_ids(expected[0])
+        assert _ids(unmatched) == _ids(expected[1])
+        assert _ids(unused) == _ids(expected[2])
+
+
+def test_tolerance_edge_is_inclusive():
+    base = FlightDisplayRow(
+        source="GA",
+        registration="G-CKAB",
+        takeoff_time=_clock(36000),
+        landing_time=_clock(37200),
+    )
+    at_edge = FlightDisplayRow(
+        source="KT",
+        registration="GCKAB",
+        takeoff_time=_clock(36000 + MAX_TOLERANCE_SECONDS),
+        landing_time=_clock(37200),
+    )
+    past_edge = FlightDisplayRow(
+        source="KT",
+        registration="GCKAB",
+        takeoff_time=_clock(36000 + MAX_TOLERANCE_SECONDS + 1),
+        landing_time=_clock(37200),
+    )
+
+    assert match_flights([base], [at_edge])[0] == [(base, at_edge)]
+    assert match_flights([base], [past_edge])[0] == []
+
+
+def test_lowest_index_target_wins_across_aircraft_keys():
+    # The second target shares only the callsign, the first only the
+    # registration; the lowest index is taken whichever bucket holds it.
+    flight = FlightDisplayRow(
+        source="GA",
+        registration="G-CKAB",
+        callsign="K21",
+        takeoff_time=_clock(36000),
+        landing_time=_clock(37200),
+    )
+    by_registration = FlightDisplayRow(
+        source="KT",
+        registration="G-CKAB",
+        takeoff_time=_clock(36100),
+        landing_time=_clock(37200),
+    )
+    by_callsign = FlightDisplayRow(
+        source="KT",
+        callsign="K21",
+        takeoff_time=_clock(36000),
+        landing_time=_clock(37200),
+    )
+
+    assert match_flights([flight], [by_registration, by_callsign])[0] == [(flight, by_registration)]
+    assert match_flights([flight], [by_callsign, by_registration])[0] == [(flight, by_callsign)]
+
+
+def reference_find_unmatched(
+    source: list[FlightDisplayRow],
+    target: list[FlightDisplayRow],
+) -> list[FlightDisplayRow]:
+    return reference_match(source, target)[1]
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_reconcile_equals_the_four_directional_greedy_passes(seed):
+    # The comparison used to call find_unmatched in both directions for each
+    # pair; reconcile derives both sides from one pass.
+    rng = random.Random(seed)
+    ga = random_flights(rng, rng.randint(0, 15))
+    kt = random_flights(rng, rng.randint(0, 15), "KT")
+    al = random_flights(rng, rng.randint(0, 15), "AL")
+
+    result = reconcile(ga, kt, al)
+
+    assert _ids(result.kt_not_ga) == _ids(reference_find_unmatched(kt, ga))
+    assert _ids(result.ga_not_kt) == _ids(reference_find_unmatched(ga, kt))
+    assert _ids(result.al_not_ga) == _ids(reference_find_unmatched(al, ga))
+    assert _ids(result.ga_not_al) == _ids(reference_find_unmatched(ga, al))
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_compare_pair_accounts_for_every_flight_once(seed):
+    rng = random.Random(seed)
+    ga = random_flights(rng, rng.randint(0, 15))
+    other = random_flights(rng, rng.randint(0, 15))
+
+    comparison = compare_pair(ga, other)
+
+    assert _pair_ids(comparison.matched) == _pair_ids(reference_match(ga, other)[0])
+    assert sorted(_ids([a for a, _ in comparison.matched] + comparison.ga_only)) == sorted(_ids(ga))
+    assert sorted(_ids([b for _, b in comparison.matched] + comparison.other_only)) == sorted(_ids(other))
+    assert all(reference_flights_match(a, b) for a, b in comparison.matched)
+
+
+def test_reconcile_with_empty_sources():
+    ga = random_flights(random.Random(1), 5)
+
+    result = reconcile(ga, [], [])
+
+    assert _ids(result.ga_not_kt) == _ids(ga)
+    assert _ids(result.ga_not_al) == _ids(ga)
+    assert result.kt_not_ga == []
+    assert result.al_not_ga == []
+    assert reconcile([], [], []) == Reconciliation(PairComparison(), PairComparison())
@@ -0,0 +1,101 @@
+import random
+from datetime import date
+
+import pytest
+
+from model.flight_display_row import FlightDisplayRow
+from view.flight_table_formatter import FlightTableFormatter
+
+np = pytest.importorskip("numpy")
+
+from model.flight_frame import FlightFrame  # noqa: E402
+
+
+LAUNCHES = ["Aerotow", "Winch", "Self-launch", "TMG", ""]
+AIRFIELDS = ["GRL", "grl", "LHG", ""]
+
+
+def random_rows(count: int, seed: int = 1) -> list[FlightDisplayRow]:
+    rng = random.Random(seed)
+
+    return [
+        FlightDisplayRow(
+            source=rng.choice(["GA", "GA", "KT", "AL"]),
+            flight_date=rng.choice([date(2026, 5, 1), date(2026, 5, 2), None]),
+            launch_method=rng.choice(LAUNCHES),
+            tow_pilot_account=rng.choice(["", "3001"]),
+            tow_pilot_name=rng.choice(["", "Tug Pilot"]),
+            airfield_takeoff=rng.choice(AIRFIELDS),
+            is_club_aircraft=rng.random() < 0.5,
+        )
+        for _ in range(count)
+    ]
+
+
+def test_masks_match_row_by_row_checks():
+    rows = random_rows(500)
+    frame = FlightFrame(rows)
+
+    assert frame.rows(frame.launch_is("Aerotow")) == [
+        r for r in rows if r.launch_key == "aerotow"
+    ]
+    assert frame.rows(frame.departs_from("grl")) == [
+        r for r in rows if r.airfield_takeoff_key == "GRL"
+    ]
+    assert frame.rows(frame.missing_tug_pilot()) == [
+        r
+        for r in rows
+        if r.launch_key == "aerotow"
+        and not r.tow_pilot_account
+        and not r.tow_pilot_name
+    ]
+    assert frame.rows(frame.from_source("XX")) == []
+
+
+@pytest.mark.parametrize("include_non_grl_club_departures", [False, True])
+def test_upload_candidates_match_the_formatter_filter(include_non_grl_club_departures):
+    rows = random_rows(500, seed=2)
+    frame = FlightFrame(rows)
+    mask = frame.aerolog_upload_candidates(include_non_grl_club_departures)
+
+    assert frame.rows(mask) == FlightTableFormatter().filter_aerolog_upload_flights(
+        rows,
+        include_non_grl_club_departures,
+    )
+
+
+def test_count_by_launch_matches_count_types_of_flight():
+    rows = random_rows(500, seed=3)
+    counts = FlightFrame(rows).count_by("launch")
+    aerotow, winch, self_launch, tmg, other, total = (
+        FlightTableFormatter.count_types_of_flight(rows)
+    )
+
+    assert counts.get("aerotow", 0) == aerotow
+    assert counts.get("winch", 0) == winch
+    assert counts.get("self-launch", 0) == self_launch
+    assert counts.get("tmg", 0) == tmg
+    assert sum(counts.values()) == total
+
+
+def test_count_by_date_skips_undated_rows():
+    rows = [
+        FlightDisplayRow(source="GA", flight_date=date(2026, 5, 1)),
+        FlightDisplayRow(source="GA", flight_date=date(2026, 5, 1)),
+        FlightDisplayRow(source="GA", flight_date=date(2026, 5, 2)),
+        FlightDisplayRow(source="GA"),
+    ]
+
+    assert FlightFrame(rows).count_by_date() == {
+        date(2026, 5, 1): 2,
+        date(2026, 5, 2): 1,
+    }
+
+
+def test_empty_frame():
+    frame = FlightFrame([])
+
+    assert len(frame) == 0
+    assert frame.count_by("launch") == {}
+    assert frame.count_by_date() == {}
+    assert frame.rows(frame.club_aircraft()) == []
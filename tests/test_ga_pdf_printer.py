@@ -0,0 +1,99 @@
+from datetime import date, time
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from model.flight_display_row import FlightDisplayRow  # noqa: E402
+from view import ga_pdf_printer  # noqa: E402
+from view.ga_pdf_printer import GAPdfPrinter  # noqa: E402
+
+
+FLIGHT_DATE = date(2026, 5, 1)
+FLIGHTS = [
+    FlightDisplayRow(
+        source="GA",
+        flight_date=FLIGHT_DATE,
+        registration="G-CKAB",
+        launch_method="Winch",
+        takeoff_time=time(10, 0),
+        landing_time=time(10, 20),
+        airfield_takeoff="GRL",
+        is_club_aircraft=True,
+    ),
+]
+
+
+@pytest.fixture
+def printer(tmp_path, monkeypatch):
+    monkeypatch.setattr(ga_pdf_printer, "PDF_CACHE_DIR", tmp_path / "cache")
+    printer = GAPdfPrinter(save_to_file=True)
+    monkeypatch.setattr(printer, "_downloads_target", lambda: tmp_path / "saved.pdf")
+    return printer
+
+
+def test_cached_pdf_is_reused(printer, monkeypatch):
+    pdf_path = printer._cache_path(FLIGHTS, FLIGHT_DATE)
+    pdf_path.parent.mkdir(parents=True)
+    pdf_path.write_bytes(b"%PDF cached")
+
+    def fail_render(*args, **kwargs):
+        raise AssertionError("rendered despite a cached PDF")
+
+    monkeypatch.setattr(printer, "_render", fail_render)
+
+    assert printer.print_ga(FLIGHTS, FLIGHT_DATE).read_bytes() == b"%PDF cached"
+
+
+def test_pdf_pruned_during_reuse_is_rendered_again(printer, monkeypatch):
+    pdf_path = printer._cache_path(FLIGHTS, FLIGHT_DATE)
+    pdf_path.parent.mkdir(parents=True)
+    pdf_path.write_bytes(b"%PDF cached")
+    real_copy2 = ga_pdf_printer.copy2
+    pruned = []
+
+    def copy2_after_prune(source, target):
+        # Another process prunes the file between the mtime refresh and
+        # the copy.
+        if not pruned:
+            pruned.append(source)
+            ga_pdf_printer.Path(source).unlink()
+
+        return real_copy2(source, target)
+
+    monkeypatch.setattr(ga_pdf_printer, "copy2", copy2_after_prune)
+
+    saved = printer.print_ga(FLIGHTS, FLIGHT_DATE)
+
+    assert pruned
+    assert saved.read_bytes().startswith(b"%PDF-")
+    assert pdf_path.read_bytes() == saved.read_bytes()
+
+
+def test_missing_cache_file_is_not_recreated_empty(printer):
+    pdf_path = printer._cache_path(FLIGHTS, FLIGHT_DATE)
+
+    assert not GAPdfPrinter._reuse_cached(pdf_path, None)
+    assert not pdf_path.exists()
+
+
+def test_export_uses_capped_spawned_workers(printer, tmp_path, monkeypatch):
+    created = []
+    real_executor = ga_pdf_printer.ProcessPoolExecutor
+
+    def recording_executor(**kwargs):
+        created.append(kwargs)
+        return real_executor(**kwargs)
+
+    monkeypatch.setattr(ga_pdf_printer, "ProcessPoolExecutor", recording_executor)
+    days = [(date(2026, 5, day), FLIGHTS) for day in (1, 2)]
+
+    saved = printer.export_days(days, output_dir=tmp_path / "out", max_workers=64)
+
+    assert [path.name for path in saved] == [
+        "GlidingApp_2026-05-01.pdf",
+        "GlidingApp_2026-05-02.pdf",
+    ]
+    assert all(path.read_bytes().startswith(b"%PDF-") for path in saved)
+    assert created[0]["max_workers"] == 2
+    assert created[0]["mp_context"].get_start_method() == "spawn"
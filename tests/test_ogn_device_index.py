@@ -0,0 +1,75 @@
+import os
+
+from services.ogn_device_index import OgnDeviceIndex
+
+
+RECORDS = [
+    {"device_id": "dd1234", "registration": "G-CKAB", "cn": "AB", "aircraft_model": "ASK-21"},
+    {"device_id": "DD1234", "registration": "G-DUPE", "cn": "", "aircraft_model": ""},
+    {"device_id": "3f0001", "registration": "G-DDDD", "cn": "DD", "aircraft_model": "Discus"},
+    {"device_id": "", "registration": "G-NOID", "cn": "", "aircraft_model": ""},
+]
+
+
+def normalise(value: object) -> str:
+    return str(value or "").strip().upper()
+
+
+def build(tmp_path, index_path=None) -> OgnDeviceIndex:
+    source_path = tmp_path / "ddb.json"
+
+    if not source_path.exists():
+        source_path.write_text("[]")
+
+    return OgnDeviceIndex.build(
+        RECORDS,
+        index_path or tmp_path / "ddb.json.idx",
+        source_path,
+        normalise_device_id=normalise,
+    )
+
+
+def test_find_returns_the_first_record_per_device(tmp_path):
+    index = build(tmp_path)
+
+    assert len(index) == 2
+    assert index.source_record_count == len(RECORDS)
+    assert index.find("DD1234") == {
+        "device_id": "DD1234",
+        "registration": "G-CKAB",
+        "cn": "AB",
+        "aircraft_model": "ASK-21",
+    }
+    assert index.find("3F0001")["registration"] == "G-DDDD"
+    assert index.find("000000") is None
+
+
+def test_index_is_fresh_until_the_source_changes(tmp_path):
+    build(tmp_path)
+    source_path = tmp_path / "ddb.json"
+    index_path = tmp_path / "ddb.json.idx"
+
+    # Age alone does not make the index stale.
+    os.utime(source_path, (0, 0))
+    build(tmp_path)
+    reopened = OgnDeviceIndex.open_if_fresh(index_path, source_path)
+
+    assert reopened is not None
+    assert len(reopened) == 2
+    assert reopened.source_record_count == len(RECORDS)
+    assert reopened.find("DD1234")["cn"] == "AB"
+
+    source_path.write_text("[1]")
+
+    assert OgnDeviceIndex.open_if_fresh(index_path, source_path) is None
+
+
+def test_unwritable_index_path_falls_back_to_memory(tmp_path):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+
+    index = build(tmp_path, index_path=blocker / "ddb.json.idx")
+
+    assert len(index) == 2
+    assert index.find("DD1234")["registration"] == "G-CKAB"
+    assert OgnDeviceIndex.open_if_fresh(blocker / "ddb.json.idx", tmp_path / "ddb.json") is None
@@ -0,0 +1,61 @@
+from dataclasses import dataclass, field
+from datetime import date
+
+from services.upload_journal import UploadJournal
+
+
+@dataclass
+class FakeFlight:
+    sync_key: int
+    payer: str = "1001"
+    flight_date: date = date(2026, 5, 1)
+    # Not part of the Aerolog payload; its repr differs on every run.
+    client_state: object = field(default_factory=object)
+
+
+def aerolog_payloads(flights: list[FakeFlight]) -> list[dict]:
+    return [
+        {"sync_key": f.sync_key, "payer": f.payer, "date": f.flight_date}
+        for f in flights
+    ]
+
+
+def make_journal(tmp_path) -> UploadJournal:
+    return UploadJournal(tmp_path / "journal.sqlite3", aerolog_payloads)
+
+
+def sync_keys(flights: list[FakeFlight]) -> list[int]:
+    return [f.sync_key for f in flights]
+
+
+def test_classify_splits_new_changed_and_unchanged(tmp_path):
+    journal = make_journal(tmp_path)
+    journal.record([FakeFlight(1), FakeFlight(2)])
+
+    plan = journal.classify([
+        FakeFlight(1),
+        FakeFlight(2, payer="2002"),
+        FakeFlight(3),
+    ])
+
+    assert sync_keys(plan["new"]) == [3]
+    assert sync_keys(plan["changed"]) == [2]
+    assert sync_keys(plan["unchanged"]) == [1]
+
+
+def test_fields_outside_the_payload_do_not_count_as_changes(tmp_path):
+    journal = make_journal(tmp_path)
+    journal.record([FakeFlight(1)])
+
+    # A fresh object, as a new fetch would build, with a different client_state.
+    plan = journal.classify([FakeFlight(1)])
+
+    assert sync_keys(plan["unchanged"]) == [1]
+
+
+def test_journal_persists_across_instances(tmp_path):
+    make_journal(tmp_path).record([FakeFlight(1)])
+
+    plan = make_journal(tmp_path).classify([FakeFlight(1)])
+
+    assert sync_keys(plan["unchanged"]) == [1]
@@ -0,0 +1,194 @@
+import threading
+from dataclasses import dataclass
+from datetime import date
+
+from services.aerolog_upload_pipeline import AerologUploadPipeline
+from services.upload_outbox import UploadOutbox
+
+
+@dataclass
+class FakeFlight:
+    sync_key: int
+    flight_date: date = date(2026, 5, 1)
+
+
+def flights(count: int) -> list[FakeFlight]:
+    return [FakeFlight(sync_key) for sync_key in range(1, count + 1)]
+
+
+class FakeSend:
+    """Records every chunk sent and answers with each result in turn."""
+
+    def __init__(self, *results):
+        self.results = list(results) or [{"sent": True}]
+        self.calls: list[list[int]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, chunk: list[FakeFlight]) -> dict:
+        with self._lock:
+            self.calls.append([f.sync_key for f in chunk])
+            result = self.results[min(len(self.calls), len(self.results)) - 1]
+
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+
+def make_pipeline(tmp_path, send, **options) -> AerologUploadPipeline:
+    options.setdefault("backoff_seconds", 0)
+
+    return AerologUploadPipeline(
+        send,
+        UploadOutbox(tmp_path / "outbox.sqlite3"),
+        **options,
+    )
+
+
+def test_upload_sends_every_chunk_and_empties_the_outbox(tmp_path):
+    send = FakeSend()
+    recorded: list[int] = []
+    pipeline = make_pipeline(
+        tmp_path,
+        send,
+        chunk_size=25,
+        on_sent=lambda chunk: recorded.extend(f.sync_key for f in chunk),
+    )
+
+    results = pipeline.upload(flights(60))
+
+    assert [r.status for r in results] == ["sent", "sent", "sent"]
+    assert [r.record_count for r in results] == [25, 25, 10]
+    assert sorted(recorded) == list(range(1, 61))
+    assert pipeline.pending_count() == 0
+
+
+def test_rejected_chunk_is_dropped_without_retry(tmp_path):
+    send = FakeSend({"sent": False, "status": "invalid"})
+    recorded: list[int] = []
+    pipeline = make_pipeline(
+        tmp_path,
+        send,
+        on_sent=lambda chunk: recorded.extend(f.sync_key for f in chunk),
+    )
+
+    [result] = pipeline.upload(flights(3))
+
+    assert result.status == "rejected"
+    assert result.attempts == 1
+    assert result.error == "status=invalid"
+    assert len(send.calls) == 1
+    assert recorded == []
+    assert pipeline.pending_count() == 0
+
+
+def test_failing_chunk_is_retried_then_left_pending(tmp_path):
+    send = FakeSend(ConnectionError("timed out"))
+    pipeline = make_pipeline(tmp_path, send, max_attempts=3)
+
+    [result] = pipeline.upload(flights(3))
+
+    assert result.status == "pending"
+    assert result.attempts == 3
+    assert result.error == "ConnectionError: timed out"
+    assert len(send.calls) == 3
+    assert pipeline.pending_count() == 1
+
+
+def test_retry_succeeds_within_max_attempts(tmp_path):
+    send = FakeSend(ConnectionError("reset"), {"sent": True})
+    pipeline = make_pipeline(tmp_path, send, max_attempts=3)
+
+    [result] = pipeline.upload(flights(3))
+
+    assert result.status == "sent"
+    assert result.attempts == 2
+    assert pipeline.pending_count() == 0
+
+
+def test_pending_chunk_survives_a_new_outbox_and_is_drained(tmp_path):
+    failing = make_pipeline(tmp_path, FakeSend(ConnectionError("down")), max_attempts=1)
+    failing.upload(flights(3))
+
+    reopened = UploadOutbox(tmp_path / "outbox.sqlite3")
+    [chunk] = reopened.due()
+
+    assert reopened.count() == 1
+    assert chunk.attempts == 1
+    assert chunk.last_error == "ConnectionError: down"
+    assert [f.sync_key for f in chunk.flights] == [1, 2, 3]
+
+    send = FakeSend()
+    [result] = make_pipeline(tmp_path, send).drain()
+
+    assert result.status == "sent"
+    assert result.attempts == 2
+    assert send.calls == [[1, 2, 3]]
+    assert reopened.count() == 0
+
+
+def test_uploaded_chunks_are_claimed_from_the_start(tmp_path):
+    outbox = UploadOutbox(tmp_path / "outbox.sqlite3")
+    chunk_id = outbox.add(flights(2), claimed=True)
+
+    assert outbox.due() == []
+    assert not outbox.claim(chunk_id)
+
+    outbox.release(chunk_id)
+
+    assert [chunk.chunk_id for chunk in outbox.due()] == [chunk_id]
+    assert outbox.claim(chunk_id)
+    assert not outbox.claim(chunk_id)
+
+
+def test_drain_does_not_resend_a_chunk_from_a_stale_due_list(tmp_path):
+    outbox = UploadOutbox(tmp_path / "outbox.sqlite3")
+    outbox.add(flights(2))
+    stale = outbox.due()
+
+    send = FakeSend()
+    pipeline = make_pipeline(tmp_path, send)
+    pipeline.drain()
+
+    # A second drainer that read due() before the chunk was sent.
+    assert not outbox.claim(stale[0].chunk_id)
+    assert pipeline.drain() == []
+    assert send.calls == [[1, 2]]
+
+
+def test_drain_skips_a_chunk_an_upload_is_sending(tmp_path):
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[list[int]] = []
+
+    def slow_send(chunk: list[FakeFlight]) -> dict:
+        calls.append([f.sync_key for f in chunk])
+        started.set()
+        release.wait(5)
+        return {"sent": True}
+
+    pipeline = make_pipeline(tmp_path, slow_send)
+    upload = threading.Thread(target=pipeline.upload, args=(flights(2),))
+    upload.start()
+
+    try:
+        assert started.wait(5)
+        assert pipeline.drain() == []
+    finally:
+        release.set()
+        upload.join(5)
+
+    assert calls == [[1, 2]]
+    assert pipeline.pending_count() == 0
+
+
+def test_outbox_reports_queued_sync_keys(tmp_path):
+    outbox = UploadOutbox(tmp_path / "outbox.sqlite3")
+    chunk_id = outbox.add(flights(2))
+    outbox.add([FakeFlight(3)])
+
+    assert outbox.sync_keys() == {1, 2, 3}
+
+    outbox.remove(chunk_id)
+
+    assert outbox.sync_keys() == {3}